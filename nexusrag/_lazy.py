@@ -0,0 +1,58 @@
+"""Deferred imports for heavy optional dependencies."""
+
+from typing import Any
+import importlib
+
+
+class _LazyObject:
+    """Proxy for a module or module attribute that is imported on first use.
+
+    Attribute access and calls are forwarded to the real object, which is
+    resolved once and cached on the proxy.
+    """
+
+    __slots__ = ("_name", "_target")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._target = None
+
+    def _load(self) -> Any:
+        """Import and cache the target object.
+
+        Returns:
+            Any: The module or attribute named by the proxy
+        """
+        if self._target is None:
+            try:
+                self._target = importlib.import_module(self._name)
+            except ModuleNotFoundError as e:
+                # Not a module: import the parent and take the attribute
+                if e.name != self._name:
+                    raise
+                module_name, _, attribute = self._name.rpartition(".")
+                self._target = getattr(importlib.import_module(module_name), attribute)
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<lazy import {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> Any:
+    """Return a proxy that imports a module or attribute on first use.
+
+    Args:
+        name (str): Dotted module name (e.g. "torch") or module attribute
+            (e.g. "nexusrag.embedders.universal.UniversalEmbedder")
+
+    Returns:
+        Any: Proxy forwarding attribute access and calls to the target
+    """
+    return _LazyObject(name)
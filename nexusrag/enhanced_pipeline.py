@@ -7,6 +7,72 @@ from nexusrag.chunking.document_chunker import DocumentChunker
 from nexusrag.metadata_filter import MetadataFilter
 from nexusrag.knowledge_graph import KnowledgeGraphBuilder, KnowledgeGraph
 from nexusrag.agents.basic_agent import BasicAgent
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+
+def _multimodal_processor_class() -> type:
+    """Load MultimodalProcessor from multimodal.py.
+    
+    The module is loaded by path because the nexusrag.multimodal package
+    shadows it (and to avoid circular imports).
+    
+    Returns:
+        type: The MultimodalProcessor class
+    """
+    import importlib.util
+    import os
+    
+    # Get the path to the multimodal.py file
+    multimodal_path = os.path.join(os.path.dirname(__file__), 'multimodal.py')
+    
+    # Load the module
+    spec = importlib.util.spec_from_file_location("multimodal", multimodal_path)
+    multimodal_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(multimodal_module)
+    
+    return multimodal_module.MultimodalProcessor
+
+
+def _parsed_without_models(file_path: str) -> bool:
+    """Check whether MultimodalProcessor hands a file to UniversalParser.
+    
+    Images, audio, video and PDFs go through model-backed processors
+    (BLIP-2, Whisper, Nougat); every other format is parsed by UniversalParser.
+    
+    Args:
+        file_path (str): Path to the document file
+        
+    Returns:
+        bool: True if the file is parsed without loading any model
+    """
+    from nexusrag.multimodal.universal import (
+        IMAGE_EXTENSIONS, AUDIO_EXTENSIONS, VIDEO_EXTENSIONS
+    )
+    
+    ext = os.path.splitext(file_path)[1].lower()
+    return not (
+        ext in IMAGE_EXTENSIONS or ext in AUDIO_EXTENSIONS
+        or ext in VIDEO_EXTENSIONS or ext == '.pdf'
+    )
+
+
+def _parse_file_in_worker(file_path: str) -> List[Document]:
+    """Parse one file with the worker process's UniversalParser.
+    
+    Module-level so it can be pickled into ProcessPoolExecutor workers. Only
+    files for which _parsed_without_models holds are sent here, so workers
+    never load multimodal models.
+    
+    Args:
+        file_path (str): Path to the document file
+        
+    Returns:
+        List[Document]: Documents extracted from the file
+    """
+    from nexusrag.parsers.universal import get_parser
+    
+    return get_parser().parse(file_path)
 
 
 class EnhancedRAGPipeline:
@@ -34,21 +100,8 @@ class EnhancedRAGPipeline:
         self.vector_store = vector_store
         self.llm = llm
         
-        # Import MultimodalProcessor directly from multimodal.py to avoid circular imports
-        import importlib.util
-        import sys
-        import os
-        
-        # Get the path to the multimodal.py file
-        multimodal_path = os.path.join(os.path.dirname(__file__), 'multimodal.py')
-        
-        # Load the module
-        spec = importlib.util.spec_from_file_location("multimodal", multimodal_path)
-        multimodal_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(multimodal_module)
-        
         # Get the MultimodalProcessor class
-        MultimodalProcessor = multimodal_module.MultimodalProcessor
+        MultimodalProcessor = _multimodal_processor_class()
         
         # Initialize enhanced components
         self.chunker = DocumentChunker(chunk_size, chunk_overlap)
@@ -77,17 +130,37 @@ class EnhancedRAGPipeline:
         # Add to vector store
         self.vector_store.add(documents)
         
-    def process_documents(self, file_paths: List[str], chunk: bool = True) -> None:
+    def process_documents(self, file_paths: List[str], chunk: bool = True,
+                          max_workers: int = 1) -> None:
         """Process multiple document files and add them to the vector store.
         
         Args:
             file_paths (List[str]): Paths to the document files
             chunk (bool): Whether to chunk the documents
+            max_workers (int): Worker processes used to parse files in
+                parallel (None for the CPU count); 1 parses in this process.
+                Only formats parsed without models (Word, HTML, Markdown,
+                text) are sent to workers; images, audio, video and PDFs are
+                always processed here. On platforms that spawn processes
+                (Windows, macOS), calls with more than one worker must be
+                made under an ``if __name__ == "__main__":`` guard.
         """
+        max_workers = max_workers or os.cpu_count() or 1
+        
+        # Parsing is CPU-bound, so spread model-free files over processes
+        pooled = []
+        if max_workers > 1:
+            pooled = list(dict.fromkeys(p for p in file_paths if _parsed_without_models(p)))
+        parsed = {}
+        if len(pooled) > 1:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(pooled))) as executor:
+                parsed = dict(zip(pooled, executor.map(_parse_file_in_worker, pooled)))
+        
         all_documents = []
         for file_path in file_paths:
-            # Process multimodal document
-            documents = self.multimodal_processor.process_multimodal_document(file_path)
+            documents = parsed.get(file_path)
+            if documents is None:
+                documents = self.multimodal_processor.process_multimodal_document(file_path)
             
             # Chunk documents if requested
             if chunk:
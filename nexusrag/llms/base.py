@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 
 
@@ -17,3 +18,23 @@ class BaseLLM(ABC):
             str: Generated response
         """
         pass
+    
+    def generate_batch(self, prompts: List[str], context: List[Dict[str, Any]] = None) -> List[str]:
+        """Generate responses for several independent prompts.
+        
+        The default implementation issues the generate calls concurrently
+        from a thread pool, overlapping their round-trips; providers with a
+        native batch API can override it.
+        
+        Args:
+            prompts (List[str]): Prompts to generate responses for
+            context (List[Dict[str, Any]]): Optional context documents, shared by all prompts
+            
+        Returns:
+            List[str]: Generated responses, in prompt order
+        """
+        if len(prompts) <= 1:
+            return [self.generate(prompt, context) for prompt in prompts]
+        
+        with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+            return list(executor.map(lambda prompt: self.generate(prompt, context), prompts))
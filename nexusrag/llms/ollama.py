@@ -34,16 +34,25 @@ class OllamaLLM(BaseLLM):
         Returns:
             str: Generated response
         """
-        # Build the full prompt with context
-        if context:
-            context_text = "\n".join([doc["content"] for doc in context])
-            full_prompt = f"Use the following context to answer the question:\n\n{context_text}\n\nQuestion: {prompt}\n\nAnswer:"
-        else:
-            full_prompt = prompt
-        
         # Generate response
         response = self.client.generate(
             model=self.model_name,
-            prompt=full_prompt
+            prompt=self._build_prompt(prompt, context)
         )
         return response['response']
+    
+    @staticmethod
+    def _build_prompt(prompt: str, context: List[Dict[str, Any]] = None) -> str:
+        """Build the full prompt with context.
+        
+        Args:
+            prompt (str): The prompt to generate a response for
+            context (List[Dict[str, Any]]): Optional context documents
+            
+        Returns:
+            str: Full prompt
+        """
+        if context:
+            context_text = "\n".join([doc["content"] for doc in context])
+            return f"Use the following context to answer the question:\n\n{context_text}\n\nQuestion: {prompt}\n\nAnswer:"
+        return prompt
@@ -40,6 +40,29 @@ class OpenAILLM(BaseLLM):
         Returns:
             str: Generated response
         """
+        messages = self._build_messages(prompt, context)
+        
+        # Generate response
+        response = self.client.chat.completions.create(
+            model=self.model_name,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=500
+        )
+        
+        return response.choices[0].message.content
+    
+    @staticmethod
+    def _build_messages(prompt: str, context: List[Dict[str, Any]] = None) -> List[Dict[str, str]]:
+        """Build the chat messages for a prompt.
+        
+        Args:
+            prompt (str): The prompt to generate a response for
+            context (List[Dict[str, Any]]): Optional context documents
+            
+        Returns:
+            List[Dict[str, str]]: Chat messages
+        """
         # Build the messages
         messages = []
         
@@ -57,12 +80,4 @@ class OpenAILLM(BaseLLM):
             "content": prompt
         })
         
-        # Generate response
-        response = self.client.chat.completions.create(
-            model=self.model_name,
-            messages=messages,
-            temperature=0.7,
-            max_tokens=500
-        )
-        
-        return response.choices[0].message.content
+        return messages
@@ -48,3 +48,15 @@ class UniversalLLM(BaseLLM):
             str: Generated response
         """
         return self.llm.generate(prompt, context)
+    
+    def generate_batch(self, prompts: List[str], context: List[Dict[str, Any]] = None) -> List[str]:
+        """Generate responses for several independent prompts using the selected LLM.
+        
+        Args:
+            prompts (List[str]): Prompts to generate responses for
+            context (List[Dict[str, Any]]): Optional context documents, shared by all prompts
+            
+        Returns:
+            List[str]: Generated responses, in prompt order
+        """
+        return self.llm.generate_batch(prompts, context)
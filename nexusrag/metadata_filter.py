@@ -1,6 +1,79 @@
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Iterable, Sequence, Tuple
+from functools import lru_cache
 from .parsers.base import Document
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Operators in the order they are evaluated: the most selective checks run
+# first so a compiled predicate rejects most documents after one lookup.
+_OPERATOR_ORDER = {"eq": 0, "in": 1, "contains": 2, "gt": 3, "ge": 3, "lt": 3, "le": 3, "ne": 4}
+
+# Generated statement per operator; {x} is the looked-up value, {v} the constant.
+_OPERATOR_TEMPLATES = {
+    "eq": "if {x} != {v}: return False",
+    "ne": "if {x} == {v}: return False",
+    "in": "if {x} not in {v}: return False",
+    "contains": "if {x} is None or {v} not in {x}: return False",
+    "gt": "if {x} is None or not {x} > {v}: return False",
+    "ge": "if {x} is None or not {x} >= {v}: return False",
+    "lt": "if {x} is None or not {x} < {v}: return False",
+    "le": "if {x} is None or not {x} <= {v}: return False",
+}
+
+
+def _membership_container(values: Iterable[Any]):
+    """Return a frozenset for an "in" test, or a tuple if a value is unhashable."""
+    values = tuple(values)
+    try:
+        return frozenset(values)
+    except TypeError:
+        return values
+
+
+def _normalize_spec(spec: Iterable[Tuple[str, str, Any]]) -> Tuple[Tuple[str, str, Any], ...]:
+    """Validate a filter spec and order it by operator selectivity."""
+    normalized = []
+    for field_name, op, value in spec:
+        if not isinstance(field_name, str):
+            raise TypeError(f"Metadata field names must be strings, got {field_name!r}")
+        if op not in _OPERATOR_TEMPLATES:
+            raise ValueError(f"Unsupported filter operator: {op}")
+        if op == "in":
+            value = _membership_container(value)
+        normalized.append((field_name, op, value))
+    
+    # sorted() is stable, so ties keep the caller's order
+    return tuple(sorted(normalized, key=lambda entry: _OPERATOR_ORDER[entry[1]]))
+
+
+def _generate_predicate(spec: Tuple[Tuple[str, str, Any], ...]) -> Callable[[Dict[str, Any]], bool]:
+    """Generate a predicate function specialized to a normalized spec."""
+    namespace = {"_get": dict.get}
+    lines = []
+    for index, (field_name, op, value) in enumerate(spec):
+        namespace[f"_v{index}"] = value
+        lines.append(f"    _x = _get(m, {field_name!r})")
+        lines.append("    " + _OPERATOR_TEMPLATES[op].format(x="_x", v=f"_v{index}"))
+    body = "\n".join(lines)
+    
+    source = (
+        f"def _match(m):\n{body}\n    return True\n"
+        f"def _match_document(d):\n    m = d.metadata\n{body}\n    return True\n"
+    )
+    exec(source, namespace)
+    
+    predicate = namespace["_match"]
+    predicate._compiled_fields = tuple(field_name for field_name, _, _ in spec)
+    predicate._match_document = namespace["_match_document"]
+    return predicate
+
+
+_generate_cached_predicate = lru_cache(maxsize=256)(_generate_predicate)
+
 
 class MetadataFilter:
     """Utility for filtering documents based on metadata."""
@@ -17,8 +90,37 @@ class MetadataFilter:
         Returns:
             List[Document]: Filtered documents
         """
+        # Predicates from MetadataFilter.compile carry a document-level twin
+        match_document = getattr(filter_func, "_match_document", None)
+        if match_document is not None:
+            return list(filter(match_document, documents))
+        
         return [doc for doc in documents if filter_func(doc.metadata)]
     
+    @staticmethod
+    def compile(spec: Sequence[Tuple[str, str, Any]]) -> Callable[[Dict[str, Any]], bool]:
+        """Compile a metadata filter spec into a specialized predicate.
+        
+        Each spec entry is ``(field_name, operator, value)`` where operator is
+        one of "eq", "ne", "in", "contains", "gt", "ge", "lt" or "le". Checks
+        are reordered so equality tests run first, and the predicate is
+        generated as straight-line code instead of interpreting the spec per
+        document. Compiled predicates are cached per spec.
+        
+        Args:
+            spec (Sequence[Tuple[str, str, Any]]): Conditions that must all hold
+            
+        Returns:
+            Callable: Predicate taking metadata and returning True/False, usable
+            with filter_by_metadata
+        """
+        normalized = _normalize_spec(spec)
+        try:
+            return _generate_cached_predicate(normalized)
+        except TypeError:
+            # Unhashable constants cannot be cache keys
+            return _generate_predicate(normalized)
+    
     @staticmethod
     def filter_by_source(documents: List[Document], source_pattern: str) -> List[Document]:
         """Filter documents by source pattern.
@@ -30,7 +132,47 @@ class MetadataFilter:
         Returns:
             List[Document]: Filtered documents
         """
-        return [doc for doc in documents if source_pattern in doc.metadata.get("source", "")]
+        get = dict.get
+        return [doc for doc in documents if source_pattern in get(doc.metadata, "source", "")]
+    
+    @staticmethod
+    def filter_by_sources(documents: List[Document], source_patterns: Iterable[str]) -> List[Document]:
+        """Filter documents whose source contains any of several patterns.
+        
+        Uses an Aho-Corasick automaton (pyahocorasick) when installed, so each
+        source is scanned once regardless of the number of patterns; otherwise
+        falls back to testing the patterns one by one.
+        
+        Args:
+            documents (List[Document]): Documents to filter
+            source_patterns (Iterable[str]): Patterns to match in source metadata
+            
+        Returns:
+            List[Document]: Filtered documents
+        """
+        patterns = list(dict.fromkeys(source_patterns))
+        if not patterns:
+            return []
+        if "" in patterns:
+            # The empty pattern matches every source, as with filter_by_source
+            return list(documents)
+        
+        get = dict.get
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for pattern in patterns:
+                automaton.add_word(pattern, pattern)
+            automaton.make_automaton()
+            iter_matches = automaton.iter
+            return [
+                doc for doc in documents
+                if next(iter_matches(get(doc.metadata, "source", "")), None) is not None
+            ]
+        
+        def matches_any(source: str) -> bool:
+            return any(pattern in source for pattern in patterns)
+        
+        return [doc for doc in documents if matches_any(get(doc.metadata, "source", ""))]
     
     @staticmethod
     def filter_by_content_type(documents: List[Document], content_type: str) -> List[Document]:
@@ -43,7 +185,24 @@ class MetadataFilter:
         Returns:
             List[Document]: Filtered documents
         """
-        return [doc for doc in documents if doc.metadata.get("content_type") == content_type]
+        get = dict.get
+        return [doc for doc in documents if get(doc.metadata, "content_type") == content_type]
+    
+    @staticmethod
+    def filter_by_content_types(documents: List[Document], 
+                                content_types: Iterable[str]) -> List[Document]:
+        """Filter documents matching any of several content types.
+        
+        Args:
+            documents (List[Document]): Documents to filter
+            content_types (Iterable[str]): Content types to accept
+            
+        Returns:
+            List[Document]: Filtered documents
+        """
+        accepted = frozenset(content_types)
+        get = dict.get
+        return [doc for doc in documents if get(doc.metadata, "content_type") in accepted]
     
     @staticmethod
     def filter_by_custom_field(documents: List[Document], 
@@ -59,4 +218,5 @@ class MetadataFilter:
         Returns:
             List[Document]: Filtered documents
         """
-        return [doc for doc in documents if doc.metadata.get(field_name) == field_value]
+        get = dict.get
+        return [doc for doc in documents if get(doc.metadata, field_name) == field_value]
@@ -43,6 +43,17 @@ class MultimodalProcessor:
         """
         return self.processor.process_file(file_path)
     
+    def process_files(self, file_paths: List[str]) -> List[Document]:
+        """Process many files, batching and overlapping work across modalities.
+        
+        Args:
+            file_paths (List[str]): Paths to the files
+            
+        Returns:
+            List[Document]: Documents in the same file order as file_paths
+        """
+        return self.processor.process_files(file_paths)
+    
     def process_audio(self, audio_path: str) -> Document:
         """Process an audio file and generate transcription.
         
@@ -1,6 +1,25 @@
 from typing import List, Dict, Any
 from ..parsers.base import Document
 import os
+import threading
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _whisper():
+    """Import and cache the whisper module.
+    
+    Returns:
+        module: The openai-whisper module
+    """
+    try:
+        import whisper
+    except ImportError:
+        raise ImportError(
+            "To use audio transcription, you need to install OpenAI Whisper. "
+            "Please run: pip install openai-whisper"
+        )
+    return whisper
 
 
 class AudioProcessor:
@@ -15,22 +34,35 @@ class AudioProcessor:
         self.model_size = model_size
         self.model = None
         self.processor = None
+        self.device = None
+        self.decoding_options = None
+        # Audio and video are processed on separate threads and share this model
+        self._model_lock = threading.Lock()
         
     def _load_model(self):
         """Load the Whisper model."""
         if self.model is not None:
             return
             
-        try:
-            import whisper
-            self.model = whisper.load_model(self.model_size)
-        except ImportError:
-            raise ImportError(
-                "To use audio transcription, you need to install OpenAI Whisper. "
-                "Please run: pip install openai-whisper"
-            )
-        except Exception as e:
-            raise RuntimeError(f"Failed to load Whisper model: {e}")
+        whisper = _whisper()
+        
+        with self._model_lock:
+            if self.model is not None:
+                return
+            
+            try:
+                import torch
+                
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+                model = whisper.load_model(self.model_size, device=device)
+                
+                # Reused by every batched decode; fp16 is only supported on GPU
+                self.decoding_options = whisper.DecodingOptions(fp16=device == "cuda")
+                self.device = device
+                # Published last so the unlocked check above never sees a half-loaded model
+                self.model = model
+            except Exception as e:
+                raise RuntimeError(f"Failed to load Whisper model: {e}")
     
     def process_audio(self, audio_path: str) -> Document:
         """Process an audio file and generate transcription.
@@ -44,14 +76,96 @@ class AudioProcessor:
         # Load model
         self._load_model()
         
-        # Transcribe audio
-        result = self.model.transcribe(audio_path)
+        return self._transcribe(audio_path, audio_path)
+    
+    def _transcribe(self, audio_path: str, audio) -> Document:
+        """Transcribe audio with sliding-window decoding.
+        
+        Args:
+            audio_path (str): Path to the audio file, used for metadata
+            audio: Path to the audio file, or its already decoded samples
+            
+        Returns:
+            Document: Document containing audio transcription and metadata
+        """
+        result = self.model.transcribe(audio, fp16=self.device == "cuda")
+        
+        return self._create_document(
+            audio_path,
+            result["text"],
+            result.get("language", "unknown"),
+            result.get("segments", [])
+        )
+    
+    def process_audio_batch(self, audio_paths: List[str], batch_size: int = 8) -> List[Document]:
+        """Process several audio files, decoding short clips in batches.
+        
+        Clips that fit in a single 30 second Whisper window have their mel
+        spectrograms stacked and decoded together, so the encoder runs once
+        per batch and each clip becomes a single segment. Longer files need
+        sliding-window transcription and are transcribed individually from
+        the samples already loaded.
+        
+        Args:
+            audio_paths (List[str]): Paths to the audio files
+            batch_size (int): Maximum number of clips decoded together
+            
+        Returns:
+            List[Document]: Documents in the same order as audio_paths
+        """
+        # Load model
+        self._load_model()
+        
+        whisper = _whisper()
+        import torch
+        
+        documents = [None] * len(audio_paths)
+        short_clips = []
+        
+        for idx, audio_path in enumerate(audio_paths):
+            audio = whisper.load_audio(audio_path)
+            if audio.shape[0] > whisper.audio.N_SAMPLES:
+                documents[idx] = self._transcribe(audio_path, audio)
+            else:
+                short_clips.append((idx, audio_path, audio))
+        
+        for start in range(0, len(short_clips), batch_size):
+            batch = short_clips[start:start + batch_size]
+            mel = torch.stack([
+                whisper.log_mel_spectrogram(
+                    whisper.pad_or_trim(audio), n_mels=self.model.dims.n_mels
+                )
+                for _, _, audio in batch
+            ]).to(self.device)
+            
+            results = whisper.decode(self.model, mel, self.decoding_options)
+            
+            for (idx, audio_path, audio), result in zip(batch, results):
+                # Same segment shape as transcribe() for a single-window clip
+                segment = {
+                    "start": 0.0,
+                    "end": audio.shape[0] / whisper.audio.SAMPLE_RATE,
+                    "text": result.text
+                }
+                documents[idx] = self._create_document(
+                    audio_path, result.text, result.language, [segment]
+                )
         
-        # Extract transcription and additional info
-        transcription = result["text"]
-        language = result.get("language", "unknown")
-        segments = result.get("segments", [])
+        return documents
+    
+    def _create_document(self, audio_path: str, transcription: str, language: str,
+                         segments: List[Dict[str, Any]]) -> Document:
+        """Create a transcription document with audio metadata.
         
+        Args:
+            audio_path (str): Path to the audio file
+            transcription (str): Transcribed text
+            language (str): Detected language
+            segments (List[Dict[str, Any]]): Timed transcription segments
+            
+        Returns:
+            Document: Document containing audio transcription and metadata
+        """
         # Create document
         metadata = {
             "source": audio_path,
@@ -84,13 +198,7 @@ class AudioProcessor:
         Returns:
             Document: Document containing video transcription and metadata
         """
-        try:
-            import whisper
-        except ImportError:
-            raise ImportError(
-                "To process video files, you need to install OpenAI Whisper. "
-                "Please run: pip install openai-whisper"
-            )
+        _whisper()
         
         # For now, we'll just transcribe the video directly
         # In a more advanced implementation, we might extract audio first
@@ -1,6 +1,16 @@
 from typing import List, Dict, Any
 from ..parsers.base import Document
 import pandas as pd
+import re
+
+
+# A line containing a tab or a pipe is treated as a table row
+_TABLE_ROW_RE = re.compile(r'^[^\n]*[\t|][^\n]*$', re.MULTILINE)
+
+# Cell delimiters together with the whitespace around them (tabs excluded from
+# the padding so that consecutive tabs still produce empty cells)
+_TAB_SPLIT_RE = re.compile(r'[^\S\t]*\t[^\S\t]*')
+_PIPE_SPLIT_RE = re.compile(r'\s*\|\s*')
 
 
 class TableProcessor:
@@ -24,9 +34,7 @@ class TableProcessor:
             df = pd.DataFrame(table_data[1:], columns=table_data[0])
         except Exception:
             # If conversion fails, treat as simple text table
-            table_text = ""
-            for row in table_data:
-                table_text += "\t".join(str(cell) for cell in row) + "\n"
+            table_text = "\n".join("\t".join(map(str, row)) for row in table_data)
             
             metadata = {
                 "content_type": "table",
@@ -51,48 +59,47 @@ class TableProcessor:
         
         return Document(content=table_text.strip(), metadata=metadata)
     
-    def process_html_table(self, html_content: str) -> Document:
+    def process_html_table(self, html_content: str, use_pandas: bool = False) -> Document:
         """Process HTML table and convert to structured format.
         
+        By default the first table's cells are read directly with lxml and
+        passed to process_table_data; pandas.read_html is much slower and is
+        only used when typed column inference is requested.
+        
         Args:
             html_content (str): HTML content containing table
+            use_pandas (bool): Parse with pandas.read_html for typed columns
             
         Returns:
             Document: Document containing table as structured text
         """
         try:
-            import pandas as pd
-            from io import StringIO
-        except ImportError:
-            raise ImportError(
-                "To process HTML tables, you need to install pandas. "
-                "Please run: pip install pandas"
-            )
-        
-        try:
-            # Read HTML tables
-            tables = pd.read_html(StringIO(html_content))
+            if use_pandas:
+                return self._process_html_table_with_pandas(html_content)
             
+            try:
+                import lxml.html
+            except ImportError:
+                # pandas picks its own available HTML backend
+                return self._process_html_table_with_pandas(html_content)
+            
+            tree = lxml.html.fromstring(html_content)
+            tables = tree.xpath('(//table)[1]')
             if not tables:
                 raise ValueError("No tables found in HTML content")
             
-            # Use the first table
-            df = tables[0]
-            
-            # Convert to structured text
-            table_text = df.to_string(index=False)
+            # Rows of the first table only, not of tables nested inside it
+            table_data = [
+                [cell.text_content().strip() for cell in row.xpath('./td|./th')]
+                for row in tables[0].xpath('./tr|./thead/tr|./tbody/tr|./tfoot/tr')
+            ]
+            table_data = [row for row in table_data if row]
+            if not table_data:
+                raise ValueError("No rows found in HTML table")
             
-            # Create document
-            metadata = {
-                "content_type": "table",
-                "media_type": "text",
-                "processing_method": "html",
-                "rows": len(df),
-                "columns": len(df.columns),
-                "column_names": list(df.columns)
-            }
-            
-            return Document(content=table_text.strip(), metadata=metadata)
+            document = self.process_table_data(table_data)
+            document.metadata["processing_method"] = "html"
+            return document
             
         except Exception as e:
             # Fallback to simple text processing
@@ -105,6 +112,85 @@ class TableProcessor:
             
             return Document(content=html_content.strip(), metadata=metadata)
     
+    def process_html_tables(self, html_content: str) -> List[Document]:
+        """Process every table in an HTML document.
+        
+        Tables are streamed with lxml's iterparse and each element is cleared
+        once processed, so memory stays flat for documents with many tables.
+        
+        Args:
+            html_content (str): HTML content containing tables
+            
+        Returns:
+            List[Document]: One document per non-empty table, in document order
+            of each table's closing tag
+        """
+        from io import BytesIO
+        from lxml import etree
+        
+        documents = []
+        events = etree.iterparse(
+            BytesIO(html_content.encode("utf-8")),
+            events=("end",),
+            tag="table",
+            html=True,
+            encoding="utf-8"
+        )
+        
+        for _, table in events:
+            # Nested tables end first and are cleared, so only this table's rows remain
+            table_data = [
+                ["".join(cell.itertext()).strip() for cell in row if cell.tag in ("td", "th")]
+                for row in table.iter("tr")
+            ]
+            table_data = [row for row in table_data if row]
+            if table_data:
+                document = self.process_table_data(table_data)
+                document.metadata["processing_method"] = "html"
+                documents.append(document)
+            
+            # Free the processed table and anything before it
+            table.clear()
+            while table.getprevious() is not None:
+                del table.getparent()[0]
+        
+        return documents
+    
+    def _process_html_table_with_pandas(self, html_content: str) -> Document:
+        """Process the first HTML table with pandas.read_html.
+        
+        Args:
+            html_content (str): HTML content containing table
+            
+        Returns:
+            Document: Document containing table as structured text
+        """
+        from io import StringIO
+        
+        # Read HTML tables
+        tables = pd.read_html(StringIO(html_content))
+        
+        if not tables:
+            raise ValueError("No tables found in HTML content")
+        
+        # Use the first table
+        df = tables[0]
+        
+        # Convert to structured text
+        table_text = df.to_string(index=False)
+        
+        # Create document
+        metadata = {
+            "content_type": "table",
+            "media_type": "text",
+            "processing_method": "html",
+            "rows": len(df),
+            "columns": len(df.columns),
+            "column_names": list(df.columns)
+        }
+        
+        return Document(content=table_text.strip(), metadata=metadata)
+    
     def extract_tables_from_document(self, document_content: str) -> List[Document]:
         """Extract tables from document content.
         
@@ -116,63 +202,47 @@ class TableProcessor:
         """
         documents = []
         
-        # Simple table detection based on delimiters
-        lines = document_content.split('\n')
+        # Simple heuristic: lines with tabs or pipes might be tables. The regex
+        # finds all such lines in one pass; adjacent matches form one table.
         table_lines = []
-        in_table = False
-        
-        for line in lines:
-            # Simple heuristic: lines with multiple tabs or pipes might be tables
-            if '\t' in line or '|' in line:
-                if not in_table:
-                    in_table = True
-                    table_lines = [line]
-                else:
-                    table_lines.append(line)
-            else:
-                if in_table:
-                    # Process collected table lines
-                    if len(table_lines) > 1:  # Need at least header and one row
-                        # Try to parse as table
-                        table_data = []
-                        for table_line in table_lines:
-                            # Split by tabs or pipes
-                            if '\t' in table_line:
-                                row = table_line.split('\t')
-                            elif '|' in table_line:
-                                # Remove leading/trailing pipes and split
-                                row = [cell.strip() for cell in table_line.strip('|').split('|')]
-                            else:
-                                row = [table_line]
-                            
-                            # Clean up cells
-                            row = [cell.strip() for cell in row]
-                            table_data.append(row)
-                        
-                        # Process table data
-                        if table_data:
-                            doc = self.process_table_data(table_data)
-                            documents.append(doc)
-                    
-                    in_table = False
-                    table_lines = []
+        previous_end = None
+        
+        for match in _TABLE_ROW_RE.finditer(document_content):
+            if table_lines and match.start() != previous_end + 1:
+                self._append_table(table_lines, documents)
+                table_lines = []
+            table_lines.append(match.group())
+            previous_end = match.end()
         
         # Handle case where document ends with a table
-        if in_table and len(table_lines) > 1:
-            table_data = []
-            for table_line in table_lines:
-                if '\t' in table_line:
-                    row = table_line.split('\t')
-                elif '|' in table_line:
-                    row = [cell.strip() for cell in table_line.strip('|').split('|')]
-                else:
-                    row = [table_line]
-                
-                row = [cell.strip() for cell in row]
-                table_data.append(row)
-            
-            if table_data:
-                doc = self.process_table_data(table_data)
-                documents.append(doc)
+        if table_lines:
+            self._append_table(table_lines, documents)
         
         return documents
+    
+    def _append_table(self, table_lines: List[str], documents: List[Document]) -> None:
+        """Parse a run of table lines and append the resulting table document.
+        
+        Args:
+            table_lines (List[str]): Consecutive lines of one table
+            documents (List[Document]): Documents to append the table to
+        """
+        # Need at least header and one row
+        if len(table_lines) < 2:
+            return
+        
+        # A table uses one delimiter throughout, so pick it once from the first
+        # line; the split regexes consume whitespace around inner delimiters,
+        # so only the outer cells need stripping
+        if '\t' in table_lines[0]:
+            table_data = [_TAB_SPLIT_RE.split(line) for line in table_lines]
+        else:
+            # Remove leading/trailing pipes and split
+            table_data = [_PIPE_SPLIT_RE.split(line.strip('|')) for line in table_lines]
+        
+        for row in table_data:
+            row[0] = row[0].strip()
+            row[-1] = row[-1].strip()
+        
+        # Process table data
+        documents.append(self.process_table_data(table_data))
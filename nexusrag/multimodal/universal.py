@@ -4,9 +4,17 @@ from .image_processor import ImageProcessor
 from .audio_processor import AudioProcessor
 from .table_processor import TableProcessor
 from .pdf_processor import PDFProcessor
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import os
 
 
+IMAGE_EXTENSIONS = frozenset(['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff'])
+AUDIO_EXTENSIONS = frozenset(['.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a'])
+VIDEO_EXTENSIONS = frozenset(['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'])
+
+
 class UniversalMultimodalProcessor:
     """Universal multimodal processor that integrates all modalities."""
     
@@ -34,15 +42,15 @@ class UniversalMultimodalProcessor:
         ext = ext.lower()
         
         # Process based on file type
-        if ext in ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff']:
+        if ext in IMAGE_EXTENSIONS:
             # Image file
             doc = self.image_processor.process_image(file_path)
             return [doc]
-        elif ext in ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a']:
+        elif ext in AUDIO_EXTENSIONS:
             # Audio file
             doc = self.audio_processor.process_audio(file_path)
             return [doc]
-        elif ext in ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm']:
+        elif ext in VIDEO_EXTENSIONS:
             # Video file
             doc = self.audio_processor.process_video(file_path)
             return [doc]
@@ -55,6 +63,64 @@ class UniversalMultimodalProcessor:
             parser = UniversalParser()
             return parser.parse(file_path)
     
+    def process_files(self, file_paths: List[str], max_workers: int = None) -> List[Document]:
+        """Process many files, batching each modality and running modalities concurrently.
+        
+        Images are captioned in GPU batches, short audio clips are decoded in
+        Whisper batches, and PDFs, videos and other documents are processed per
+        file. Each modality runs in its own thread so disk I/O, CPU OCR and GPU
+        work overlap.
+        
+        Args:
+            file_paths (List[str]): Paths to the files
+            max_workers (int): Maximum number of concurrent threads
+            
+        Returns:
+            List[Document]: Documents grouped in the same file order as file_paths
+        """
+        groups = defaultdict(list)
+        for idx, file_path in enumerate(file_paths):
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(f"File not found: {file_path}")
+            
+            ext = os.path.splitext(file_path)[1].lower()
+            if ext in IMAGE_EXTENSIONS:
+                groups["image"].append((idx, file_path))
+            elif ext in AUDIO_EXTENSIONS:
+                groups["audio"].append((idx, file_path))
+            else:
+                groups["other"].append((idx, file_path))
+        
+        handlers = {
+            "image": self._process_image_batch,
+            "audio": self._process_audio_batch,
+            "other": self._process_file_batch
+        }
+        
+        results = [None] * len(file_paths)
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = [
+                (items, executor.submit(handlers[modality], [path for _, path in items]))
+                for modality, items in groups.items()
+            ]
+            for items, future in futures:
+                for (idx, _), docs in zip(items, future.result()):
+                    results[idx] = docs
+        
+        return [doc for docs in results for doc in docs]
+    
+    def _process_image_batch(self, image_paths: List[str]) -> List[List[Document]]:
+        """OCR a batch of images, captioning low-confidence ones, one document list per image."""
+        return [[doc] for doc in self.image_processor.process_images(image_paths)]
+    
+    def _process_audio_batch(self, audio_paths: List[str]) -> List[List[Document]]:
+        """Transcribe a batch of audio files, one document list per file."""
+        return [[doc] for doc in self.audio_processor.process_audio_batch(audio_paths)]
+    
+    def _process_file_batch(self, file_paths: List[str]) -> List[List[Document]]:
+        """Process PDFs, videos and other files one at a time."""
+        return [self.process_file(file_path) for file_path in file_paths]
+    
     def process_image(self, image_path: str) -> Document:
         """Process an image file.
         
@@ -121,6 +187,17 @@ class UniversalMultimodalProcessor:
         """
         return self.table_processor.process_html_table(html_content)
     
+    def process_html_tables(self, html_content: str) -> List[Document]:
+        """Process every table in an HTML document.
+        
+        Args:
+            html_content (str): HTML content containing tables
+            
+        Returns:
+            List[Document]: List of documents containing table content
+        """
+        return self.table_processor.process_html_tables(html_content)
+    
     def extract_tables_from_document(self, document_content: str) -> List[Document]:
         """Extract tables from document content.
         
@@ -135,37 +212,86 @@ class UniversalMultimodalProcessor:
     def process_multimodal_content(self, content: Dict[str, Any]) -> List[Document]:
         """Process multimodal content from various sources.
         
+        Synchronous wrapper around aprocess_multimodal_content. When called
+        from inside a running event loop, where asyncio.run is not allowed,
+        the content types are processed one after another instead; await
+        aprocess_multimodal_content there to get the concurrent version.
+        
         Args:
             content (Dict[str, Any]): Dictionary containing multimodal content
             
         Returns:
             List[Document]: List of documents containing processed content
         """
-        documents = []
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aprocess_multimodal_content(content))
         
-        # Process different content types
-        if "image_path" in content:
-            doc = self.process_image(content["image_path"])
-            documents.append(doc)
+        steps = self._content_steps(content)
+        results = [process(content[key]) for key, process, _ in steps]
+        return self._collect_documents(steps, results)
+    
+    def _content_steps(self, content: Dict[str, Any]) -> List[tuple]:
+        """Select the processors for the content types present.
         
-        if "audio_path" in content:
-            doc = self.process_audio(content["audio_path"])
-            documents.append(doc)
+        Args:
+            content (Dict[str, Any]): Dictionary containing multimodal content
+            
+        Returns:
+            List[tuple]: (content key, processor, whether it returns a list of
+            documents) for each content type in content
+        """
+        steps = [
+            ("image_path", self.process_image, False),
+            ("audio_path", self.process_audio, False),
+            ("video_path", self.process_video, False),
+            ("pdf_path", self.process_pdf, True),
+            ("table_data", self.process_table_data, False),
+            ("html_table", self.process_html_table, False)
+        ]
+        return [step for step in steps if step[0] in content]
+    
+    @staticmethod
+    def _collect_documents(steps: List[tuple], results: List[Any]) -> List[Document]:
+        """Flatten processor results into one document list, in step order.
+        
+        Args:
+            steps (List[tuple]): Steps from _content_steps
+            results (List[Any]): Result of each step
+            
+        Returns:
+            List[Document]: Processed documents
+        """
+        documents = []
+        for (_, _, returns_list), result in zip(steps, results):
+            if returns_list:
+                documents.extend(result)
+            else:
+                documents.append(result)
         
-        if "video_path" in content:
-            doc = self.process_video(content["video_path"])
-            documents.append(doc)
+        return documents
+    
+    async def aprocess_multimodal_content(self, content: Dict[str, Any]) -> List[Document]:
+        """Process multimodal content from various sources concurrently.
         
-        if "pdf_path" in content:
-            docs = self.process_pdf(content["pdf_path"])
-            documents.extend(docs)
+        Each content type is independent, so the processors run side by side
+        in the event loop's default thread pool and the total time is roughly
+        that of the slowest one.
         
-        if "table_data" in content:
-            doc = self.process_table_data(content["table_data"])
-            documents.append(doc)
+        Args:
+            content (Dict[str, Any]): Dictionary containing multimodal content
+            
+        Returns:
+            List[Document]: List of documents containing processed content, in
+            the same content-type order as the sequential version
+        """
+        steps = self._content_steps(content)
         
-        if "html_table" in content:
-            doc = self.process_html_table(content["html_table"])
-            documents.append(doc)
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(None, process, content[key])
+            for key, process, _ in steps
+        ))
         
-        return documents
+        return self._collect_documents(steps, results)
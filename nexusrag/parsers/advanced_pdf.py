@@ -1,14 +1,171 @@
 from typing import List
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import os
+import threading
 from .base import BaseParser, Document
 import fitz  # PyMuPDF
 from ..metadata.extractor import MetadataExtractor
 
 
+# Text extraction flags for "blocks" mode. Ligature preservation is left out so
+# MuPDF emits plain characters ("fi" rather than U+FB01), which embed better;
+# image blocks are kept so they appear in the output.
+BLOCK_FLAGS = (
+    fitz.TEXT_PRESERVE_WHITESPACE
+    | fitz.TEXT_MEDIABOX_CLIP
+    | fitz.TEXT_PRESERVE_IMAGES
+)
+
+# Below this many pages, process start-up costs more than parallel parsing saves
+PARALLEL_MIN_PAGES = 4
+
+# Open PyMuPDF handles per thread (fitz documents are not thread-safe), so
+# repeated parses of a PDF skip re-reading its xref table and trailer
+MAX_OPEN_DOCUMENTS = 8
+_open_documents = threading.local()
+
+
+def _reset_open_documents() -> None:
+    """Drop the handles inherited from the parent in a forked child process.
+    
+    A forked child shares the parent's file descriptors, and with them their
+    file offsets, so reading through an inherited handle races with every
+    other process using it. The child opens its own handles instead.
+    """
+    global _open_documents
+    _open_documents = threading.local()
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only; spawned children start empty
+    os.register_at_fork(after_in_child=_reset_open_documents)
+
+
+def close_cached() -> None:
+    """Close the PDF handles cached by the calling thread.
+    
+    Open handles keep their files locked on Windows; call this once the
+    parsed files are no longer needed.
+    """
+    cache = getattr(_open_documents, "cache", None)
+    while cache:
+        _, pdf_document = cache.popitem()
+        pdf_document.close()
+
+
+def _open_pdf(file_path: str) -> "fitz.Document":
+    """Return an open PyMuPDF document for a path from the per-thread LRU.
+    
+    Handles are keyed by absolute path and mtime, so a modified file is
+    reopened; evicted and stale handles are closed.
+    
+    Args:
+        file_path (str): Path to the PDF file
+        
+    Returns:
+        fitz.Document: Open document (owned by the cache; do not close it)
+    """
+    cache = getattr(_open_documents, "cache", None)
+    if cache is None:
+        cache = _open_documents.cache = OrderedDict()
+    
+    path = os.path.abspath(file_path)
+    key = (path, os.stat(path).st_mtime_ns)
+    pdf_document = cache.get(key)
+    if pdf_document is not None:
+        cache.move_to_end(key)
+        return pdf_document
+    
+    # Close handles for older versions of the same file
+    for stale_key in [k for k in cache if k[0] == path]:
+        cache.pop(stale_key).close()
+    
+    pdf_document = cache[key] = fitz.open(path)
+    while len(cache) > MAX_OPEN_DOCUMENTS:
+        _, evicted = cache.popitem(last=False)
+        evicted.close()
+    return pdf_document
+
+
+def _parse_page_range(file_path: str, start: int, end: int) -> List[Document]:
+    """Extract text and image blocks from pages [start, end) of a PDF.
+    
+    Module-level so it can be pickled into ProcessPoolExecutor workers; each
+    worker opens its own handle on the file.
+    
+    Args:
+        file_path (str): Path to the PDF file
+        start (int): First page index (0-based)
+        end (int): Page index to stop before
+        
+    Returns:
+        List[Document]: Extracted documents in page order
+    """
+    documents = []
+    
+    # Open PDF (cached handle)
+    pdf_document = _open_pdf(file_path)
+    
+    for page_num in range(start, end):
+        page = pdf_document[page_num]
+        
+        # Extract (x0, y0, x1, y1, text, block_no, block_type) tuples in C,
+        # sorted top-to-bottom, left-to-right into reading order
+        blocks = page.get_text("blocks", flags=BLOCK_FLAGS, sort=True)
+        
+        for x0, y0, x1, y1, text, block_idx, block_type in blocks:
+            if block_type == 0:  # Text block
+                text_content = "\n".join(
+                    line for line in text.splitlines() if line.strip()
+                ).strip()
+                if not text_content:
+                    continue
+                
+                document = Document(
+                    content=text_content,
+                    metadata={
+                        "source": file_path,
+                        "page": page_num + 1,
+                        "block_type": "text",
+                        "block_index": block_idx,
+                        "bbox": (x0, y0, x1, y1)
+                    }
+                )
+                documents.append(document)
+            
+            else:  # Image block
+                # Extract image information
+                document = Document(
+                    content=f"[Image at page {page_num + 1}, block {block_idx}]",
+                    metadata={
+                        "source": file_path,
+                        "page": page_num + 1,
+                        "block_type": "image",
+                        "block_index": block_idx,
+                        "bbox": (x0, y0, x1, y1)
+                    }
+                )
+                documents.append(document)
+    
+    return documents
+
+
 class AdvancedPDFParser(BaseParser):
     """Advanced PDF parser with layout analysis and structured content extraction."""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 1):
+        """Initialize the parser.
+        
+        Args:
+            max_workers (int): Worker processes for page extraction (None for
+                the CPU count; the default 1 parses in this process). PDFs
+                with few pages are always parsed serially. On platforms that
+                spawn processes (Windows, macOS), parsers with more than one
+                worker must be used under an ``if __name__ == "__main__":``
+                guard.
+        """
         super().__init__()
+        self.max_workers = max_workers
     
     def parse(self, file_path: str) -> List[Document]:
         """Parse PDF with advanced layout analysis.
@@ -19,57 +176,28 @@ class AdvancedPDFParser(BaseParser):
         Returns:
             List[Document]: List of extracted documents with metadata
         """
-        documents = []
+        # Open PDF to count pages; the serial path reuses this handle
+        page_count = _open_pdf(file_path).page_count
         
-        # Open PDF
-        pdf_document = fitz.open(file_path)
-        
-        for page_num in range(len(pdf_document)):
-            page = pdf_document[page_num]
-            
-            # Extract text with layout information
-            blocks = page.get_text("dict")
+        max_workers = self.max_workers or os.cpu_count() or 1
+        if page_count < PARALLEL_MIN_PAGES or max_workers < 2:
+            documents = _parse_page_range(file_path, 0, page_count)
+        else:
+            # Split pages into contiguous ranges, one per worker
+            chunk_size = -(-page_count // max_workers)
+            ranges = [
+                (start, min(start + chunk_size, page_count))
+                for start in range(0, page_count, chunk_size)
+            ]
             
-            # Process text blocks
-            for block_idx, block in enumerate(blocks.get("blocks", [])):
-                if "lines" in block:  # Text block
-                    text_lines = []
-                    for line in block.get("lines", []):
-                        line_text = ""
-                        for span in line.get("spans", []):
-                            line_text += span.get("text", "")
-                        if line_text.strip():
-                            text_lines.append(line_text)
-                    
-                    if text_lines:
-                        text_content = "\n".join(text_lines)
-                        document = Document(
-                            content=text_content.strip(),
-                            metadata={
-                                "source": file_path,
-                                "page": page_num + 1,
-                                "block_type": "text",
-                                "block_index": block_idx,
-                                "bbox": block.get("bbox", [])
-                            }
-                        )
-                        documents.append(document)
-                
-                elif "image" in block:  # Image block
-                    # Extract image information
-                    document = Document(
-                        content=f"[Image at page {page_num + 1}, block {block_idx}]",
-                        metadata={
-                            "source": file_path,
-                            "page": page_num + 1,
-                            "block_type": "image",
-                            "block_index": block_idx,
-                            "bbox": block.get("bbox", [])
-                        }
-                    )
-                    documents.append(document)
-        
-        pdf_document.close()
+            documents = []
+            with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [
+                    executor.submit(_parse_page_range, file_path, start, end)
+                    for start, end in ranges
+                ]
+                for future in futures:
+                    documents.extend(future.result())
         
         # Enhance metadata for all documents
         enhanced_documents = []
@@ -1,9 +1,29 @@
 from abc import ABC, abstractmethod
-from typing import List
+from collections import OrderedDict
+from typing import List, Tuple
+import os
+import threading
+
+
+# Parse results kept by parse_cached, keyed by (parser class, parser config,
+# absolute path, mtime, size); bounded both by entry count and by the total
+# number of content characters held
+PARSE_CACHE_SIZE = 512
+PARSE_CACHE_MAX_CHARS = 50_000_000
+_parse_cache = OrderedDict()
+_parse_cache_chars = 0
+_parse_cache_lock = threading.Lock()
 
 
 class Document:
-    """Represents a document with its content and metadata."""
+    """Represents a document with its content and metadata.
+    
+    Documents use ``__slots__`` to keep per-instance memory small on large
+    corpora; subclasses that need extra attributes must declare their own
+    ``__slots__`` (or omit it to get a ``__dict__`` back).
+    """
+    __slots__ = ("content", "metadata")
+    
     def __init__(self, content: str, metadata: dict = None):
         self.content = content
         self.metadata = metadata or {}
@@ -23,3 +43,72 @@ class BaseParser(ABC):
             List[Document]: List of parsed documents
         """
         pass
+    
+    def parse_cached(self, file_path: str, stat_result: os.stat_result = None) -> List[Document]:
+        """Parse a document file, reusing the result for unchanged files.
+        
+        Results are cached per (parser class, _cache_key(), absolute path,
+        mtime, size) in an LRU bounded by PARSE_CACHE_SIZE entries and
+        PARSE_CACHE_MAX_CHARS content characters, so re-parsing an unchanged
+        file skips all parsing work; on a miss the file is parsed with this
+        instance, so its configuration applies. Callers get fresh Document
+        copies and may modify them freely. clear_parse_cache() empties the
+        cache.
+        
+        Args:
+            file_path (str): Path to the document file to parse
+            stat_result (os.stat_result): Optional stat result for file_path,
+                reused instead of stat-ing the file again
+            
+        Returns:
+            List[Document]: List of parsed documents
+        """
+        global _parse_cache_chars
+        
+        stat = stat_result or os.stat(file_path)
+        key = (type(self), self._cache_key(), os.path.abspath(file_path),
+               stat.st_mtime_ns, stat.st_size)
+        
+        with _parse_cache_lock:
+            entry = _parse_cache.get(key)
+            if entry is not None:
+                _parse_cache.move_to_end(key)
+        
+        if entry is None:
+            # Parse outside the lock so different files parse concurrently
+            cached = tuple(self.parse(file_path))
+            chars = sum(len(doc.content) for doc in cached)
+            if chars <= PARSE_CACHE_MAX_CHARS:
+                with _parse_cache_lock:
+                    previous = _parse_cache.pop(key, None)
+                    if previous is not None:
+                        _parse_cache_chars -= previous[1]
+                    _parse_cache[key] = (cached, chars)
+                    _parse_cache_chars += chars
+                    while (len(_parse_cache) > PARSE_CACHE_SIZE
+                           or _parse_cache_chars > PARSE_CACHE_MAX_CHARS):
+                        _parse_cache_chars -= _parse_cache.popitem(last=False)[1][1]
+        else:
+            cached = entry[0]
+        
+        return [Document(content=doc.content, metadata=dict(doc.metadata)) for doc in cached]
+    
+    @staticmethod
+    def clear_parse_cache() -> None:
+        """Drop every result cached by parse_cached."""
+        global _parse_cache_chars
+        
+        with _parse_cache_lock:
+            _parse_cache.clear()
+            _parse_cache_chars = 0
+    
+    def _cache_key(self) -> Tuple:
+        """Return the parser configuration that parse_cached results depend on.
+        
+        Parsers whose output depends on constructor arguments override this,
+        so differently configured instances do not share cache entries.
+        
+        Returns:
+            Tuple: Hashable configuration key
+        """
+        return ()
@@ -1,6 +1,54 @@
 from typing import List
 from .base import BaseParser, Document
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, NavigableString, CData, Tag
+
+try:
+    import lxml  # noqa: F401
+    _BS4_BACKEND = 'lxml'
+except ImportError:
+    _BS4_BACKEND = 'html.parser'
+
+# Only build the parts of the tree the parser reads. lxml always wraps content
+# in <body>, so this is safe there; html.parser would drop body-less fragments.
+_CONTENT_STRAINER = (
+    SoupStrainer(['title', 'main', 'article', 'body', 'div'])
+    if _BS4_BACKEND == 'lxml' else None
+)
+
+# Elements whose text forms one paragraph
+BLOCK_TAGS = ['p', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'td', 'th', 'pre']
+_BLOCK_TAG_SET = frozenset(BLOCK_TAGS)
+
+
+def _iter_paragraphs(root) -> List[str]:
+    """Collect the paragraphs of an element in document order.
+    
+    Each outermost block element gives one paragraph; text outside any block
+    element (e.g. a div's introductory text) gives one paragraph per line.
+    The tree is walked with an explicit stack, so deep nesting is fine.
+    
+    Args:
+        root: BeautifulSoup element to read
+        
+    Returns:
+        List[str]: Non-empty paragraphs
+    """
+    paragraphs = []
+    stack = [iter(root.children)]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+        elif isinstance(child, Tag):
+            if child.name in _BLOCK_TAG_SET:
+                text = child.get_text(' ', strip=True)
+                if text:
+                    paragraphs.append(text)
+            else:
+                stack.append(iter(child.children))
+        elif type(child) in (NavigableString, CData):  # skips comments, doctypes
+            paragraphs.extend(line.strip() for line in child.split('\n') if line.strip())
+    return paragraphs
 
 
 class HTMLParser(BaseParser):
@@ -15,19 +63,12 @@ class HTMLParser(BaseParser):
         Returns:
             List[Document]: List of parsed documents
         """
-        try:
-            from bs4 import BeautifulSoup
-        except ImportError:
-            raise ImportError(
-                "To use HTMLParser, you need to install the beautifulsoup4 library. "
-                "Please run: pip install beautifulsoup4"
-            )
-        
         # Read and parse the HTML file
         with open(file_path, 'r', encoding='utf-8') as file:
             content = file.read()
         
-        soup = BeautifulSoup(content, 'html.parser')
+        # lxml's C tokenizer is much faster than the pure-Python html.parser
+        soup = BeautifulSoup(content, _BS4_BACKEND, parse_only=_CONTENT_STRAINER)
         
         # Remove script and style elements
         for script in soup(["script", "style"]):
@@ -41,20 +82,14 @@ class HTMLParser(BaseParser):
         # Try to find main content areas
         main_content = soup.find('main') or soup.find('article') or soup.find('div', class_=['content', 'main', 'article'])
         
-        if main_content:
-            # If we found a main content area, extract from there
-            text_content = main_content.get_text(separator='\n', strip=True)
-        else:
-            # Otherwise, extract from the body
-            body = soup.find('body')
-            if body:
-                text_content = body.get_text(separator='\n', strip=True)
-            else:
-                # Fallback to entire document
-                text_content = soup.get_text(separator='\n', strip=True)
+        if not main_content:
+            # Otherwise, extract from the body, falling back to the entire document
+            main_content = soup.find('body') or soup
         
-        # Split into paragraphs
-        paragraphs = [p.strip() for p in text_content.split('\n') if p.strip()]
+        # Take paragraphs straight from block-level elements (blocks nested in
+        # another block are already part of the outer block's text), and lines
+        # of any text outside them, in document order
+        paragraphs = _iter_paragraphs(main_content)
         
         # Create Document objects
         documents = []
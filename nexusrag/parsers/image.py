@@ -3,7 +3,43 @@ from .base import BaseParser, Document
 from PIL import Image
 import pytesseract
 import os
-from ..metadata.extractor import MetadataExtractor
+import threading
+import numpy as np
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+# A persistent libtesseract handle avoids spawning a tesseract process and
+# reloading language data for every image; the API is not thread-safe
+_TESS_API = None
+_TESS_LOCK = threading.Lock()
+
+# Grayscale standard deviation below which an image is treated as blank
+BLANK_IMAGE_STD_THRESHOLD = 5.0
+
+
+def _ocr_image(image) -> str:
+    """Run OCR on an image, through tesserocr when installed.
+    
+    Args:
+        image (PIL.Image.Image): Image to read
+        
+    Returns:
+        str: Recognized text
+    """
+    global _TESS_API
+    
+    if tesserocr is None:
+        return pytesseract.image_to_string(image)
+    
+    with _TESS_LOCK:
+        if _TESS_API is None:
+            _TESS_API = tesserocr.PyTessBaseAPI()
+        _TESS_API.SetImage(image)
+        return _TESS_API.GetUTF8Text()
+
 
 class ImageParser(BaseParser):
     """Image parser that extracts text from images using OCR."""
@@ -22,8 +58,12 @@ class ImageParser(BaseParser):
         # Open image
         image = Image.open(file_path)
         
-        # Extract text using OCR
-        text = pytesseract.image_to_string(image)
+        # Extract text using OCR, skipping blank/near-uniform images (covers,
+        # empty scans) where a single numpy reduction rules out any text
+        if np.asarray(image.convert('L'), dtype=np.uint8).std() < BLANK_IMAGE_STD_THRESHOLD:
+            text = ""
+        else:
+            text = _ocr_image(image)
         
         # Create document
         document = Document(
@@ -39,10 +79,6 @@ class ImageParser(BaseParser):
         
         documents.append(document)
         
-        # Enhance metadata for all documents
-        enhanced_documents = []
-        for doc in documents:
-            enhanced_doc = MetadataExtractor.enhance_document_metadata(doc, file_path)
-            enhanced_documents.append(enhanced_doc)
-        
-        return enhanced_documents
+        # Metadata enhancement is left to UniversalParser, which runs it once
+        # for every parser
+        return documents
@@ -1,7 +1,12 @@
 from typing import List
+import re
 from .base import BaseParser, Document
 
 
+# A line whose first non-blank character is '#'; the group is the stripped line
+_HEADER_RE = re.compile(r'^[^\S\n]*(#[^\n]*?)[^\S\n]*$', re.MULTILINE)
+
+
 class MarkdownParser(BaseParser):
     """Markdown document parser."""
     
@@ -23,12 +28,11 @@ class MarkdownParser(BaseParser):
         
         # Create Document objects
         documents = []
-        for i, (header, section_content) in enumerate(sections):
-            # Combine header and content
-            full_content = f"{header}\n\n{section_content}" if header else section_content
-            
+        for i, (header, start, end) in enumerate(sections):
+            # A section's header and body are contiguous in the source, so
+            # one slice gives the whole section without re-joining them
             document = Document(
-                content=full_content.strip(),
+                content=content[start:end].strip(),
                 metadata={
                     "source": file_path,
                     "content_type": "section",
@@ -54,32 +58,29 @@ class MarkdownParser(BaseParser):
     def _split_by_headers(self, content: str) -> List[tuple]:
         """Split markdown content by headers.
         
+        A header is any line whose first non-blank character is '#'.
+        
         Args:
             content (str): Markdown content
             
         Returns:
-            List[tuple]: List of (header, content) tuples
+            List[tuple]: List of (header, start, end) tuples, where
+            content[start:end] is the section including its header line
+            (the header is "" for text before the first header)
         """
-        lines = content.split('\n')
         sections = []
-        current_header = ""
-        current_content = []
+        header = ""
+        start = 0
         
-        for line in lines:
-            # Check if line is a header (starts with #)
-            if line.strip().startswith('#'):
-                # Save previous section if it exists
-                if current_header or current_content:
-                    sections.append((current_header, '\n'.join(current_content).strip()))
-                
-                # Start new section
-                current_header = line.strip()
-                current_content = []
-            else:
-                current_content.append(line)
+        for match in _HEADER_RE.finditer(content):
+            # Text before the first header forms an untitled section
+            if header or match.start() > 0:
+                sections.append((header, start, match.start()))
+            header = match.group(1)
+            start = match.start(1)
         
         # Add the last section
-        if current_header or current_content:
-            sections.append((current_header, '\n'.join(current_content).strip()))
+        if header or content:
+            sections.append((header, start, len(content)))
             
         return sections
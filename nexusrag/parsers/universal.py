@@ -1,12 +1,83 @@
 from typing import List
+from functools import lru_cache
+import importlib
 import os
 from nexusrag.parsers.base import BaseParser, Document
 from nexusrag.metadata.extractor import MetadataExtractor
 
 
+# File extension -> (module, parser class); unknown extensions use the text parser
+_EXT_MAP = {
+    '.pdf': ('nexusrag.parsers.pdf', 'PDFParser'),
+    '.docx': ('nexusrag.parsers.word', 'WordParser'),
+    '.doc': ('nexusrag.parsers.word', 'WordParser'),
+    '.html': ('nexusrag.parsers.html', 'HTMLParser'),
+    '.htm': ('nexusrag.parsers.html', 'HTMLParser'),
+    '.md': ('nexusrag.parsers.markdown', 'MarkdownParser'),
+    '.markdown': ('nexusrag.parsers.markdown', 'MarkdownParser'),
+    '.txt': ('nexusrag.parsers.text', 'TextParser'),
+    '.png': ('nexusrag.parsers.image', 'ImageParser'),
+    '.jpg': ('nexusrag.parsers.image', 'ImageParser'),
+    '.jpeg': ('nexusrag.parsers.image', 'ImageParser'),
+    '.gif': ('nexusrag.parsers.image', 'ImageParser'),
+    '.bmp': ('nexusrag.parsers.image', 'ImageParser'),
+    '.tiff': ('nexusrag.parsers.image', 'ImageParser'),
+    '.mp3': ('nexusrag.parsers.audio', 'AudioParser'),
+    '.wav': ('nexusrag.parsers.audio', 'AudioParser'),
+    '.flac': ('nexusrag.parsers.audio', 'AudioParser'),
+    '.aac': ('nexusrag.parsers.audio', 'AudioParser'),
+    '.ogg': ('nexusrag.parsers.audio', 'AudioParser'),
+    '.mp4': ('nexusrag.parsers.video', 'VideoParser'),
+    '.avi': ('nexusrag.parsers.video', 'VideoParser'),
+    '.mov': ('nexusrag.parsers.video', 'VideoParser'),
+    '.mkv': ('nexusrag.parsers.video', 'VideoParser'),
+    '.wmv': ('nexusrag.parsers.video', 'VideoParser'),
+    '.flv': ('nexusrag.parsers.video', 'VideoParser'),
+}
+_DEFAULT_PARSER = ('nexusrag.parsers.text', 'TextParser')
+
+
+@lru_cache(maxsize=None)
+def _parser_for(ext: str) -> BaseParser:
+    """Return the shared parser instance for a file extension.
+    
+    Parser modules are imported on first use, so optional dependencies are
+    only loaded for the formats actually parsed; parsers hold no per-file
+    state, so one instance per extension serves the whole process.
+    
+    Args:
+        ext (str): Lower-cased file extension including the dot
+        
+    Returns:
+        BaseParser: Parser instance
+    """
+    module_name, class_name = _EXT_MAP.get(ext, _DEFAULT_PARSER)
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+@lru_cache(maxsize=1)
+def get_parser() -> "UniversalParser":
+    """Return the process-wide UniversalParser.
+    
+    Returns:
+        UniversalParser: Shared parser instance
+    """
+    return UniversalParser()
+
+
 class UniversalParser(BaseParser):
     """Universal document parser that automatically detects file type and uses appropriate parser."""
     
+    def __init__(self, use_parse_cache: bool = False):
+        """Initialize the universal parser.
+        
+        Args:
+            use_parse_cache (bool): Reuse parse results for unchanged files
+                through BaseParser.parse_cached; the results stay in memory
+                until evicted or clear_parse_cache() is called
+        """
+        self.use_parse_cache = use_parse_cache
+    
     def parse(self, file_path: str) -> List[Document]:
         """Parse a document based on its file extension.
         
@@ -18,45 +89,23 @@ class UniversalParser(BaseParser):
         """
         # Get file extension
         _, ext = os.path.splitext(file_path)
-        ext = ext.lower()
         
         # Select appropriate parser based on file extension
-        if ext == '.pdf':
-            from .pdf import PDFParser
-            parser = PDFParser()
-        elif ext in ['.docx', '.doc']:
-            from .word import WordParser
-            parser = WordParser()
-        elif ext in ['.html', '.htm']:
-            from .html import HTMLParser
-            parser = HTMLParser()
-        elif ext in ['.md', '.markdown']:
-            from .markdown import MarkdownParser
-            parser = MarkdownParser()
-        elif ext == '.txt':
-            from .text import TextParser
-            parser = TextParser()
-        elif ext in ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff']:
-            from .image import ImageParser
-            parser = ImageParser()
-        elif ext in ['.mp3', '.wav', '.flac', '.aac', '.ogg']:
-            from .audio import AudioParser
-            parser = AudioParser()
-        elif ext in ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv']:
-            from .video import VideoParser
-            parser = VideoParser()
+        parser = _parser_for(ext.lower())
+        
+        # Stat the file once for both the parse cache and the file metadata
+        stat = os.stat(file_path)
+        
+        # Parse the document, reusing results for unchanged files if enabled
+        if self.use_parse_cache:
+            documents = parser.parse_cached(file_path, stat_result=stat)
         else:
-            # Default to text parser for unknown formats
-            from .text import TextParser
-            parser = TextParser()
-            
-        # Parse the document
-        documents = parser.parse(file_path)
+            documents = parser.parse(file_path)
         
         # Enhance metadata for all documents
         enhanced_documents = []
         for doc in documents:
-            enhanced_doc = MetadataExtractor.enhance_document_metadata(doc, file_path)
+            enhanced_doc = MetadataExtractor.enhance_document_metadata(doc, file_path, stat_result=stat)
             enhanced_documents.append(enhanced_doc)
         
         return enhanced_documents
@@ -1,7 +1,6 @@
 from typing import List
 from .base import BaseParser, Document
 import os
-from ..metadata.extractor import MetadataExtractor
 
 
 class VideoParser(BaseParser):
@@ -34,10 +33,6 @@ class VideoParser(BaseParser):
         
         documents.append(document)
         
-        # Enhance metadata for all documents
-        enhanced_documents = []
-        for doc in documents:
-            enhanced_doc = MetadataExtractor.enhance_document_metadata(doc, file_path)
-            enhanced_documents.append(enhanced_doc)
-        
-        return enhanced_documents
+        # Metadata enhancement is left to UniversalParser, which runs it once
+        # for every parser
+        return documents
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List, Tuple
 from .base import BaseParser, Document
 
 
@@ -25,34 +25,38 @@ class WordParser(BaseParser):
         # Open the Word document
         doc = DocxDocument(file_path)
         
-        # Extract paragraphs
-        paragraphs = []
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():  # Only add non-empty paragraphs
-                paragraphs.append(paragraph.text)
-        
-        # Extract tables
-        tables = []
-        for table in doc.tables:
-            table_content = ""
-            for row in table.rows:
-                row_content = "\t".join(cell.text for cell in row.cells)
-                table_content += row_content + "\n"
-            if table_content.strip():
-                tables.append(table_content)
-        
-        # Combine all content
-        all_content = paragraphs + tables
-        
-        # Convert to Document objects
+        # Convert paragraphs, then tables, to Document objects as they are read
         documents = []
-        for i, content in enumerate(all_content):
+        for i, (content_type, content) in enumerate(self._iter_elements(doc)):
             metadata = {
                 "source": file_path,
-                "content_type": "table" if i >= len(paragraphs) else "paragraph",
+                "content_type": content_type,
                 "element_index": i
             }
-            document = Document(content=content, metadata=metadata)
-            documents.append(document)
+            documents.append(Document(content=content, metadata=metadata))
             
         return documents
+    
+    @staticmethod
+    def _iter_elements(doc) -> Iterator[Tuple[str, str]]:
+        """Yield the non-empty paragraphs and tables of a Word document.
+        
+        Args:
+            doc (docx.document.Document): Opened Word document
+            
+        Yields:
+            Tuple[str, str]: (content type, text) pairs, paragraphs first
+        """
+        for paragraph in doc.paragraphs:
+            text = paragraph.text
+            if text.strip():  # Only add non-empty paragraphs
+                yield "paragraph", text
+        
+        for table in doc.tables:
+            # One tab-separated line per row
+            table_content = "".join(
+                "\t".join(cell.text for cell in row.cells) + "\n"
+                for row in table.rows
+            )
+            if table_content.strip():
+                yield "table", table_content
@@ -1,8 +1,18 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
+import io
+import re
 import pandas as pd
 from ..parsers.base import Document
 
 
+# A line containing a tab or a pipe is treated as a table row
+_TABLE_LINE_RE = re.compile(r'^[^\n]*[\t|][^\n]*$', re.MULTILINE)
+
+# Whitespace around tabs, and at the start/end of lines, in tab-separated text
+_TAB_PADDING_RE = re.compile(r'[^\S\t\n]*\t[^\S\t\n]*')
+_CELL_PADDING_RE = re.compile(r'^[^\S\t\n]+|[^\S\t\n]+$', re.MULTILINE)
+
+
 class TableProcessor:
     """Process tables from documents with advanced extraction capabilities."""
     
@@ -22,23 +32,31 @@ class TableProcessor:
         # In a production environment, you would use libraries like camelot or tabula
         tables = []
         
-        # Look for table-like patterns in text
-        lines = document.content.split('\n')
+        # Look for table-like patterns in text: the regex finds lines with
+        # tabs or pipes in one pass, so other lines are never split out
         table_data = []
+        table_lines = []
+        tab_only = True
         
-        for line in lines:
-            # Simple heuristic: lines with multiple tabs or pipes
-            if '\t' in line or '|' in line:
-                # Split by delimiter
-                if '|' in line:
-                    columns = [col.strip() for col in line.split('|') if col.strip()]
-                else:
-                    columns = [col.strip() for col in line.split('\t')]
-                table_data.append(columns)
+        for match in _TABLE_LINE_RE.finditer(document.content):
+            line = match.group()
+            table_lines.append(line)
+            
+            # Split by delimiter
+            # map(str.strip, ...) strips each cell once, in C
+            if '|' in line:
+                columns = [col for col in map(str.strip, line.split('|')) if col]
+                tab_only = False
+            else:
+                columns = list(map(str.strip, line.split('\t')))
+            table_data.append(columns)
         
         if table_data:
             tables.append({
                 'data': table_data,
+                # Raw lines, so tab-separated tables can go to pandas' C parser
+                'text': '\n'.join(table_lines),
+                'delimiter': '\t' if tab_only else '|',
                 'source_document': document.metadata.get('source', 'unknown'),
                 'page': document.metadata.get('page', 0),
                 'type': 'extracted_table'
@@ -46,15 +64,38 @@ class TableProcessor:
         
         return tables
     
-    def convert_to_structured(self, table_data: List[List[str]]) -> pd.DataFrame:
+    def convert_to_structured(self, table_data: Union[List[List[str]], str],
+                              delimiter: str = '\t') -> pd.DataFrame:
         """Convert extracted table data to structured format.
         
+        Table text is parsed by pandas' C CSV parser, which infers numeric
+        column types; rows of cells are turned into string columns. Text that
+        the C parser rejects is split into rows and handled as cells.
+        
         Args:
-            table_data (List[List[str]]): Raw table data
+            table_data (Union[List[List[str]], str]): Raw table data, as rows of
+                cells or as the table's text with one row per line
+            delimiter (str): Cell delimiter when table_data is text
             
         Returns:
             pd.DataFrame: Structured table as DataFrame
         """
+        if isinstance(table_data, str):
+            text = table_data
+            if delimiter == '\t':
+                # Drop padding around cells so the C parser sees bare values
+                text = _CELL_PADDING_RE.sub('', _TAB_PADDING_RE.sub('\t', text))
+            lines = text.splitlines()
+            
+            # The C parser needs a header, at least one row and equal widths
+            if len(lines) > 1 and len({line.count(delimiter) for line in lines}) == 1:
+                try:
+                    return pd.read_csv(io.StringIO(text), sep=delimiter, engine='c')
+                except (pd.errors.ParserError, ValueError):
+                    pass
+            
+            table_data = [line.split(delimiter) for line in lines]
+        
         if not table_data:
             return pd.DataFrame()
         
@@ -87,7 +128,10 @@ class TableProcessor:
         dataframes = []
         
         for table in tables:
-            df = self.convert_to_structured(table['data'])
+            if table['delimiter'] == '\t':
+                df = self.convert_to_structured(table['text'], delimiter='\t')
+            else:
+                df = self.convert_to_structured(table['data'])
             dataframes.append(df)
         
         return dataframes
@@ -1,8 +1,13 @@
 from typing import List, Dict, Any, Optional
-from nexusrag.parsers.universal import UniversalParser
-from nexusrag.embedders.universal import UniversalEmbedder
-from nexusrag.vectorstores.universal import UniversalVectorStore
-from nexusrag.llms.universal import UniversalLLM
+from nexusrag._lazy import lazy_import
+
+# Components are imported on first use, so importing nexusrag does not pull in
+# the parsers' and backends' dependencies
+get_parser = lazy_import("nexusrag.parsers.universal.get_parser")
+UniversalEmbedder = lazy_import("nexusrag.embedders.universal.UniversalEmbedder")
+UniversalVectorStore = lazy_import("nexusrag.vectorstores.universal.UniversalVectorStore")
+UniversalLLM = lazy_import("nexusrag.llms.universal.UniversalLLM")
+EnhancedRAGPipeline = lazy_import("nexusrag.enhanced_pipeline.EnhancedRAGPipeline")
 
 
 class RAG:
@@ -23,11 +28,9 @@ class RAG:
             chunk_size (int): Chunk size for document processing
             chunk_overlap (int): Chunk overlap for document processing
         """
-        # Import EnhancedRAGPipeline here to avoid circular imports
-        from .enhanced_pipeline import EnhancedRAGPipeline
-        
         # Initialize components
-        parser = UniversalParser()
+        # The parser is stateless and shared by every RAG in the process
+        parser = get_parser()
         embedder_obj = UniversalEmbedder(provider=embedder)
         vector_store_obj = UniversalVectorStore(provider=vector_store)
         llm_obj = UniversalLLM(provider=llm)
@@ -42,13 +45,20 @@ class RAG:
             chunk_overlap=chunk_overlap
         )
     
-    def process(self, files: List[str]) -> None:
+    def process(self, files: List[str], max_workers: Optional[int] = 1) -> None:
         """Process documents.
         
+        Files are parsed (optionally in parallel worker processes), then added
+        to the vector store in one batch.
+        
         Args:
             files (List[str]): List of file paths to process
+            max_workers (Optional[int]): Number of parsing processes (None for
+                the CPU count; the default 1 parses in this process). Worker
+                processes only parse formats that need no models; see
+                EnhancedRAGPipeline.process_documents
         """
-        self.pipeline.process_documents(files)
+        self.pipeline.process_documents(files, max_workers=max_workers)
     
     def ask(self, question: str, 
             filter_metadata: Dict[str, Any] = None,
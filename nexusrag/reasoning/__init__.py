@@ -1,7 +1,9 @@
 from .multi_step import MultiStepReasoner
 from .citation import CitationEngine
+from .cache import GenCache
 
 __all__ = [
     "MultiStepReasoner",
-    "CitationEngine"
+    "CitationEngine",
+    "GenCache"
 ]
@@ -0,0 +1,223 @@
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import time
+import numpy as np
+from ..embedders.base import BaseEmbedder
+
+
+# Default number of responses kept by a GenCache
+DEFAULT_CACHE_SIZE = 1024
+
+# Default lifetime of a cached response, in seconds
+DEFAULT_TTL = 300.0
+
+# Number of leading context documents that identify a context
+FINGERPRINT_DOCS = 5
+
+# Placeholder substituted for the query when hashing a prompt template
+_QUERY_PLACEHOLDER = "\x00query\x00"
+
+
+def _digest(text: str) -> str:
+    """Return the BLAKE2b hex digest of text.
+
+    Args:
+        text (str): Text to hash
+
+    Returns:
+        str: Hex digest
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class GenCache:
+    """LRU cache of LLM responses with a time-to-live and an optional semantic tier.
+
+    Responses are looked up by the exact prompt and a fingerprint of the
+    context documents. When an embedder is given, a miss falls back to the
+    cached response whose query is the most similar to the new one, among
+    entries with the same prompt template (the prompt with its query left out)
+    and the same context fingerprint.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_TTL,
+                 embedder: Optional[BaseEmbedder] = None,
+                 similarity_threshold: float = 0.95):
+        """Initialize the cache.
+
+        Args:
+            max_size (int): Maximum number of cached responses
+            ttl (float): Seconds a response stays valid (None keeps it until evicted)
+            embedder (Optional[BaseEmbedder]): Embedder for semantic matching of
+                queries; semantic matching is disabled when None
+            similarity_threshold (float): Minimum cosine similarity between
+                queries for a semantic hit
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+
+        # (prompt digest, context fingerprint) -> (expiry, response, template key)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, str, Tuple[str, str]]]" = OrderedDict()
+
+        # Semantic tier: (template digest, context fingerprint) ->
+        # {exact key: normalized query embedding}
+        self._templates: Dict[Tuple[str, str], Dict[Tuple[str, str], np.ndarray]] = {}
+
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def context_fingerprint(context: List[Dict[str, Any]]) -> str:
+        """Fingerprint the leading context documents, independent of their order.
+
+        Args:
+            context (List[Dict[str, Any]]): Context documents
+
+        Returns:
+            str: Hex fingerprint
+        """
+        doc_ids = sorted(
+            str(doc.get("metadata", {}).get("id") or _digest(doc.get("content", "")))
+            for doc in context[:FINGERPRINT_DOCS]
+        )
+        return _digest("\n".join(doc_ids))
+
+    @staticmethod
+    def _normalize(query: str) -> str:
+        """Normalize a query for hashing (case and whitespace insensitive)."""
+        return " ".join(query.lower().split())
+
+    def _keys(self, prompt: str, context_fingerprint: str,
+              query: Optional[str]) -> Tuple[Tuple[str, str], Optional[Tuple[str, str]]]:
+        """Return the exact and template keys for a prompt.
+
+        Args:
+            prompt (str): Prompt text
+            context_fingerprint (str): Fingerprint of the context documents
+            query (Optional[str]): Query embedded in the prompt
+
+        Returns:
+            Tuple: Exact key and template key (None without a query)
+        """
+        exact_key = (_digest(prompt), context_fingerprint)
+        if not query or query not in prompt:
+            return exact_key, None
+        template = prompt.replace(query, _QUERY_PLACEHOLDER)
+        return exact_key, (_digest(template), context_fingerprint)
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        """Embed a query and scale it to unit length.
+
+        Args:
+            query (str): Query text
+
+        Returns:
+            np.ndarray: Normalized embedding
+        """
+        vector = np.asarray(self.embedder.embed([self._normalize(query)])[0], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _discard(self, key: Tuple[str, str]) -> None:
+        """Remove an entry from both tiers.
+
+        Args:
+            key (Tuple[str, str]): Exact key of the entry
+        """
+        _, _, template_key = self._entries.pop(key)
+        embeddings = self._templates.get(template_key)
+        if embeddings is not None:
+            embeddings.pop(key, None)
+            if not embeddings:
+                del self._templates[template_key]
+
+    def _lookup(self, key: Tuple[str, str], now: float) -> Optional[str]:
+        """Return a live response for an exact key, dropping it if expired.
+
+        Args:
+            key (Tuple[str, str]): Exact key
+            now (float): Current monotonic time
+
+        Returns:
+            Optional[str]: Cached response, or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] < now:
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def get(self, prompt: str, context_fingerprint: str, query: Optional[str] = None) -> Optional[str]:
+        """Look up a cached response.
+
+        Args:
+            prompt (str): Prompt text
+            context_fingerprint (str): Fingerprint of the context documents
+            query (Optional[str]): Query embedded in the prompt, used by the
+                semantic tier
+
+        Returns:
+            Optional[str]: Cached response, or None on a miss
+        """
+        now = time.monotonic()
+        exact_key, template_key = self._keys(prompt, context_fingerprint, query)
+
+        response = self._lookup(exact_key, now)
+        if response is not None:
+            self.hits += 1
+            return response
+
+        if self.embedder is not None and template_key in self._templates:
+            candidates = self._templates[template_key]
+            keys = list(candidates)
+            similarities = np.stack([candidates[key] for key in keys]) @ self._embed_query(query)
+            for i in np.argsort(-similarities):
+                if similarities[i] < self.similarity_threshold:
+                    break
+                response = self._lookup(keys[i], now)
+                if response is not None:
+                    self.semantic_hits += 1
+                    return response
+
+        self.misses += 1
+        return None
+
+    def put(self, prompt: str, context_fingerprint: str, response: str,
+            query: Optional[str] = None) -> None:
+        """Store a response.
+
+        Args:
+            prompt (str): Prompt text
+            context_fingerprint (str): Fingerprint of the context documents
+            response (str): LLM response
+            query (Optional[str]): Query embedded in the prompt, used by the
+                semantic tier
+        """
+        exact_key, template_key = self._keys(prompt, context_fingerprint, query)
+        if exact_key in self._entries:
+            self._discard(exact_key)
+
+        expiry = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        if self.embedder is None or template_key is None:
+            template_key = None
+        else:
+            self._templates.setdefault(template_key, {})[exact_key] = self._embed_query(query)
+        self._entries[exact_key] = (expiry, response, template_key)
+
+        while len(self._entries) > self.max_size:
+            self._discard(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+        self._templates.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
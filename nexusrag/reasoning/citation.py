@@ -1,16 +1,110 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple, Hashable
 from ..parsers.base import Document
+from datetime import datetime
 import re
 import hashlib
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Fields stored for each citation, one column each
+_CITATION_FIELDS = ("id", "content", "source", "metadata", "timestamp")
+
+# Maximum number of claim verifications kept by a CitationEngine
+MAX_VERIFICATION_CACHE_SIZE = 1024
+
+# Maximum number of document IDs kept by a CitationEngine
+MAX_DOC_ID_CACHE_SIZE = 4096
+
+# Patterns used for entity and claim extraction
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_CAPITALIZED_RE = re.compile(r'\b[A-Z][a-z]+\b')
+_SENTENCE_RE = re.compile(r'[^.!?]+')
+_VERB_RE = re.compile(r'\b(is|are|was|were|has|have|had|will|would|could|should)\b', re.IGNORECASE)
+_VERBS = frozenset(['is', 'are', 'was', 'were', 'has', 'have', 'had', 'will', 'would', 'could', 'should'])
+
+
+def _fingerprint(text: str) -> str:
+    """Return a non-cryptographic hex fingerprint of text.
+    
+    Uses xxHash (XXH3) when installed, which is several times faster per byte
+    than MD5; falls back to MD5 otherwise.
+    
+    Args:
+        text (str): Text to fingerprint
+        
+    Returns:
+        str: Hex digest
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(text)
+    return hashlib.md5(text.encode()).hexdigest()
+
+
+def _claim_key(claim: str) -> Hashable:
+    """Return the verification cache key for a claim.
+    
+    A 64-bit xxHash integer when xxhash is installed; otherwise the claim
+    itself, whose hash Python computes once and caches on the string.
+    
+    Args:
+        claim (str): Claim text
+        
+    Returns:
+        Hashable: Cache key
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(claim)
+    return claim
+
 
 class CitationEngine:
     """Citation and verification engine for RAG responses."""
     
     def __init__(self):
         """Initialize the citation engine."""
-        self.citations = []
+        # Citations are stored column-wise, one list per field
+        self._citation_columns = {field: [] for field in _CITATION_FIELDS}
         self.verification_cache = {}
+        # Document content -> ID; context documents recur across calls
+        self._doc_id_cache = {}
+    
+    @property
+    def citations(self) -> List[Dict[str, Any]]:
+        """All citations as a list of dicts, built on access.
+        
+        The list is a snapshot: appending to it does not add a citation. Use
+        add_citation, or assign a whole list to replace the stored citations.
+        
+        Returns:
+            List[Dict[str, Any]]: Citations in the order they were added
+        """
+        columns = self._citation_columns
+        return [
+            dict(zip(_CITATION_FIELDS, row))
+            for row in zip(*(columns[field] for field in _CITATION_FIELDS))
+        ]
+    
+    @citations.setter
+    def citations(self, citations: List[Dict[str, Any]]) -> None:
+        """Replace the stored citations.
+        
+        Args:
+            citations (List[Dict[str, Any]]): Citation dicts with the fields
+                returned by the citations property
+        """
+        self._citation_columns = {
+            field: [citation.get(field) for citation in citations]
+            for field in _CITATION_FIELDS
+        }
     
     def add_citation(self, content: str, source: str, metadata: Dict[str, Any] = None) -> str:
         """Add a citation and return a citation ID.
@@ -24,18 +118,16 @@ class CitationEngine:
             str: Citation ID
         """
         # Generate citation ID based on content hash
-        content_hash = hashlib.md5(content.encode()).hexdigest()[:8]
+        content_hash = _fingerprint(content)[:8]
         citation_id = f"cite_{content_hash}"
         
-        citation = {
-            "id": citation_id,
-            "content": content,
-            "source": source,
-            "metadata": metadata or {},
-            "timestamp": self._get_timestamp()
-        }
+        columns = self._citation_columns
+        columns["id"].append(citation_id)
+        columns["content"].append(content)
+        columns["source"].append(source)
+        columns["metadata"].append(metadata or {})
+        columns["timestamp"].append(self._get_timestamp())
         
-        self.citations.append(citation)
         return citation_id
     
     def verify_claim(self, claim: str, context: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -49,10 +141,40 @@ class CitationEngine:
             Dict[str, Any]: Verification results
         """
         # Check cache first
-        claim_hash = hashlib.md5(claim.encode()).hexdigest()
+        claim_hash = _claim_key(claim)
         if claim_hash in self.verification_cache:
             return self.verification_cache[claim_hash]
         
+        return self._verify_claim(claim, claim_hash, self._prepare_context(context))
+    
+    def _prepare_context(self, context: List[Dict[str, Any]]) -> List[Tuple[str, str, str]]:
+        """Compute the per-document values claim verification needs.
+        
+        Args:
+            context (List[Dict[str, Any]]): Context documents
+            
+        Returns:
+            List[Tuple[str, str, str]]: (document ID, content, lowercased
+            content) for each document
+        """
+        prepared = []
+        for doc in context:
+            content = doc.get("content", "")
+            prepared.append((self._get_doc_id(doc), content, content.lower()))
+        return prepared
+    
+    def _verify_claim(self, claim: str, claim_hash: Hashable,
+                      prepared_context: List[Tuple[str, str, str]]) -> Dict[str, Any]:
+        """Verify a claim against prepared context and cache the result.
+        
+        Args:
+            claim (str): Claim to verify
+            claim_hash (Hashable): Cache key of the claim, from _claim_key
+            prepared_context (List[Tuple[str, str, str]]): Output of _prepare_context
+            
+        Returns:
+            Dict[str, Any]: Verification results
+        """
         # Extract key entities from claim
         entities = self._extract_entities(claim)
         
@@ -60,31 +182,40 @@ class CitationEngine:
         supporting_evidence = []
         contradicting_evidence = []
         
-        for doc in context:
-            doc_content = doc.get("content", "").lower()
-            claim_lower = claim.lower()
+        # Find the claim and all entities in each document in a single scan
+        claim_lower = claim.lower()
+        entity_patterns = [entity.lower() for entity in entities]
+        find_patterns = self._pattern_finder([claim_lower] + entity_patterns)
+        
+        direct_matches = 0
+        for doc_id, content, content_lower in prepared_context:
+            found = find_patterns(content_lower)
             
-            # Check for direct matches
-            if claim_lower in doc_content:
+            # Check for direct matches; a direct match already has the top
+            # score, so the document is not also counted as an entity match
+            if claim_lower in found:
                 supporting_evidence.append({
-                    "document_id": self._get_doc_id(doc),
-                    "content": doc.get("content", ""),
+                    "document_id": doc_id,
+                    "content": content,
                     "score": 1.0,
                     "type": "direct_match"
                 })
+                direct_matches += 1
+                
+                # Only the top 3 are kept, and later documents cannot beat these
+                if direct_matches >= 3:
+                    break
+                continue
             
             # Check for entity matches
-            entity_matches = 0
-            for entity in entities:
-                if entity.lower() in doc_content:
-                    entity_matches += 1
+            entity_matches = sum(1 for pattern in entity_patterns if pattern in found)
             
             if entity_matches > 0:
                 score = entity_matches / len(entities) if entities else 0
                 if score > 0.5:  # More than half of entities match
                     supporting_evidence.append({
-                        "document_id": self._get_doc_id(doc),
-                        "content": doc.get("content", ""),
+                        "document_id": doc_id,
+                        "content": content,
                         "score": score,
                         "type": "entity_match"
                     })
@@ -111,7 +242,9 @@ class CitationEngine:
                 "timestamp": self._get_timestamp()
             }
         
-        # Cache result
+        # Cache result, evicting the oldest entry once the cache is full
+        if len(self.verification_cache) >= MAX_VERIFICATION_CACHE_SIZE:
+            self.verification_cache.pop(next(iter(self.verification_cache)))
         self.verification_cache[claim_hash] = verification_result
         
         return verification_result
@@ -129,10 +262,20 @@ class CitationEngine:
         # Extract claims from response
         claims = self._extract_claims(response)
         
-        # Verify each claim
+        # Verify each claim; document IDs and lowercased contents are
+        # computed once for all claims, and only if a claim is not cached
         verified_claims = []
+        verified_count = 0
+        prepared_context = None
         for claim in claims:
-            verification = self.verify_claim(claim, context)
+            claim_hash = _claim_key(claim)
+            verification = self.verification_cache.get(claim_hash)
+            if verification is None:
+                if prepared_context is None:
+                    prepared_context = self._prepare_context(context)
+                verification = self._verify_claim(claim, claim_hash, prepared_context)
+            if verification["verified"]:
+                verified_count += 1
             verified_claims.append({
                 "claim": claim,
                 "verification": verification
@@ -143,8 +286,8 @@ class CitationEngine:
             "response": response,
             "claims": verified_claims,
             "total_claims": len(claims),
-            "verified_claims": len([c for c in verified_claims if c["verification"]["verified"]]),
-            "citation_rate": len([c for c in verified_claims if c["verification"]["verified"]]) / len(claims) if claims else 0.0,
+            "verified_claims": verified_count,
+            "citation_rate": verified_count / len(claims) if claims else 0.0,
             "timestamp": self._get_timestamp()
         }
         
@@ -164,15 +307,15 @@ class CitationEngine:
         entities = []
         
         # Extract quoted phrases
-        quoted = re.findall(r'"([^"]+)"', text)
+        quoted = _QUOTED_RE.findall(text)
         entities.extend(quoted)
         
         # Extract capitalized words (potential proper nouns)
-        capitalized = re.findall(r'\b[A-Z][a-z]+\b', text)
+        capitalized = _CAPITALIZED_RE.findall(text)
         entities.extend(capitalized)
         
-        # Remove duplicates and return
-        return list(set(entities))
+        # Remove duplicates, keeping first-seen order so results are deterministic
+        return list(dict.fromkeys(entities))
     
     def _extract_claims(self, text: str) -> List[str]:
         """Extract factual claims from text.
@@ -185,18 +328,52 @@ class CitationEngine:
         """
         # Simple claim extraction
         # In a real implementation, you might use more sophisticated NLP
-        sentences = re.split(r'[.!?]+', text)
         claims = []
         
-        for sentence in sentences:
-            sentence = sentence.strip()
+        # Sentences are the runs between end punctuation, found lazily
+        for match in _SENTENCE_RE.finditer(text):
+            sentence = match.group().strip()
             if sentence:
-                # Simple heuristic: sentences with verbs are likely claims
-                if re.search(r'\b(is|are|was|were|has|have|had|will|would|could|should)\b', sentence, re.IGNORECASE):
+                # Simple heuristic: sentences with verbs are likely claims. A
+                # whitespace-delimited verb is found by a set lookup; the regex
+                # catches verbs next to punctuation.
+                if not _VERBS.isdisjoint(sentence.lower().split()) or _VERB_RE.search(sentence):
                     claims.append(sentence)
         
         return claims
     
+    @staticmethod
+    def _pattern_finder(patterns: List[str]) -> Callable[[str], Set[str]]:
+        """Build a function returning which patterns occur in a text.
+        
+        Uses an Aho-Corasick automaton (pyahocorasick) when installed, so each
+        text is scanned once regardless of the number of patterns; otherwise
+        falls back to testing the patterns one by one.
+        
+        Args:
+            patterns (List[str]): Substrings to look for
+            
+        Returns:
+            Callable[[str], Set[str]]: Maps a text to the patterns found in it
+        """
+        patterns = set(patterns)
+        
+        if ahocorasick is None:
+            return lambda text: {pattern for pattern in patterns if pattern in text}
+        
+        # The empty pattern occurs in every text, as with the in operator
+        always = {""} & patterns
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns - always:
+            automaton.add_word(pattern, pattern)
+        
+        if len(automaton) == 0:
+            return lambda text: set(always)
+        
+        automaton.make_automaton()
+        iter_matches = automaton.iter
+        return lambda text: {pattern for _, pattern in iter_matches(text)} | always
+    
     def _get_doc_id(self, doc: Dict[str, Any]) -> str:
         """Generate a document ID.
         
@@ -207,7 +384,14 @@ class CitationEngine:
             str: Document ID
         """
         content = doc.get("content", "")
-        return hashlib.md5(content.encode()).hexdigest()[:12]
+        doc_id = self._doc_id_cache.get(content)
+        if doc_id is None:
+            doc_id = _fingerprint(content)[:12]
+            # Evict the oldest entry once the cache is full
+            if len(self._doc_id_cache) >= MAX_DOC_ID_CACHE_SIZE:
+                self._doc_id_cache.pop(next(iter(self._doc_id_cache)))
+            self._doc_id_cache[content] = doc_id
+        return doc_id
     
     def _get_timestamp(self) -> str:
         """Get current timestamp.
@@ -215,7 +399,6 @@ class CitationEngine:
         Returns:
             str: Timestamp
         """
-        from datetime import datetime
         return datetime.now().isoformat()
     
     def get_citation_report(self) -> Dict[str, Any]:
@@ -225,12 +408,29 @@ class CitationEngine:
             Dict[str, Any]: Citation report
         """
         return {
-            "total_citations": len(self.citations),
+            "total_citations": len(self._citation_columns["id"]),
             "citations": self.citations,
             "verification_cache_size": len(self.verification_cache)
         }
     
+    def get_citation_frame(self):
+        """Get all citations as a pandas DataFrame, one column per field.
+        
+        Returns:
+            pd.DataFrame: Citations with id, content, source, metadata and
+            timestamp columns
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                "To get citations as a DataFrame, you need to install pandas. "
+                "Please run: pip install pandas"
+            )
+        return pd.DataFrame(self._citation_columns, columns=list(_CITATION_FIELDS))
+    
     def clear_citations(self) -> None:
         """Clear all citations and verification cache."""
-        self.citations = []
+        self._citation_columns = {field: [] for field in _CITATION_FIELDS}
         self.verification_cache = {}
+        self._doc_id_cache = {}
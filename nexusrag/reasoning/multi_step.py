@@ -1,23 +1,114 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Deque
+from collections import deque
 from ..llms.base import BaseLLM
 from ..vectorstores.base import BaseVectorStore
 from ..parsers.base import Document
+from .cache import GenCache
+import hashlib
 import json
+import re
+import zlib
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Maximum length of the context block in reasoning prompts
+MAX_CONTEXT_CHARS = 2000
+
+# Maximum number of reasoning sessions kept in the history
+MAX_REASONING_HISTORY = 1000
+
+# Words in a refinement response that signal the reasoning is done
+_STOP_RE = re.compile(r'sufficient|adequate|complete', re.IGNORECASE)
+
+
+def _compress(text: str) -> bytes:
+    """Compress text for storage, with zstandard when installed (zlib otherwise).
+    
+    Args:
+        text (str): Text to compress
+        
+    Returns:
+        bytes: Compressed text
+    """
+    if zstandard is not None:
+        return zstandard.ZstdCompressor().compress(text.encode("utf-8"))
+    return zlib.compress(text.encode("utf-8"))
+
+
+def _decompress(data: bytes) -> str:
+    """Decompress text stored by _compress.
+    
+    Args:
+        data (bytes): Compressed text
+        
+    Returns:
+        str: Original text
+    """
+    if zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+    return zlib.decompress(data).decode("utf-8")
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON, with orjson when installed.
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    the latter either way.
+    
+    Args:
+        text (str): JSON text
+        
+    Returns:
+        Any: Parsed value
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _dumps_indented(value: Any) -> str:
+    """Serialize a value as JSON indented by two spaces, with orjson when installed.
+    
+    Args:
+        value (Any): JSON-serializable value
+        
+    Returns:
+        str: JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, indent=2)
 
 
 class MultiStepReasoner:
     """Multi-step reasoning engine with iterative refinement."""
     
-    def __init__(self, llm: BaseLLM, vector_store: BaseVectorStore):
+    def __init__(self, llm: BaseLLM, vector_store: BaseVectorStore,
+                 cache: Optional[GenCache] = None):
         """Initialize the multi-step reasoner.
         
         Args:
             llm (BaseLLM): Language model for generation
             vector_store (BaseVectorStore): Vector store for retrieval
+            cache (Optional[GenCache]): Cache of LLM responses shared by the
+                reasoning steps (defaults to an exact-match GenCache)
         """
         self.llm = llm
         self.vector_store = vector_store
-        self.reasoning_history: List[Dict[str, Any]] = []
+        self.cache = cache if cache is not None else GenCache()
+        # Compacted sessions: each step's prompt is replaced by a digest and
+        # its response is compressed (see _compact_session)
+        self.reasoning_history: Deque[Dict[str, Any]] = deque(maxlen=MAX_REASONING_HISTORY)
+        self._session_count = 0
     
     def reason(self, query: str, max_steps: int = 5, context: List[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Perform multi-step reasoning to answer a query.
@@ -31,7 +122,8 @@ class MultiStepReasoner:
             Dict[str, Any]: Reasoning results with steps and final answer
         """
         # Initialize reasoning session
-        session_id = len(self.reasoning_history)
+        session_id = self._session_count
+        self._session_count += 1
         reasoning_session = {
             "session_id": session_id,
             "query": query,
@@ -48,7 +140,8 @@ class MultiStepReasoner:
         step_result = self._initial_analysis(query, context)
         reasoning_session["steps"].append(step_result)
         
-        # Subsequent refinement steps
+        # Subsequent refinement steps; each prompt is built from the previous
+        # step's result, so steps run one after another
         current_state = step_result
         for step in range(1, max_steps):
             step_result = self._refinement_step(query, context, current_state, step)
@@ -66,11 +159,44 @@ class MultiStepReasoner:
         reasoning_session["confidence"] = final_result["confidence"]
         reasoning_session["evidence"] = final_result["evidence"]
         
-        # Store reasoning session
-        self.reasoning_history.append(reasoning_session)
+        # Store a compacted copy of the reasoning session
+        self.reasoning_history.append(self._compact_session(reasoning_session))
         
         return reasoning_session
     
+    def _generate(self, prompts: List[str], query: str, context: List[Dict[str, Any]]) -> List[str]:
+        """Generate responses for prompts, serving repeated prompts from the cache.
+        
+        Prompts missing from the cache are generated together, once per
+        distinct prompt, and stored.
+        
+        Args:
+            prompts (List[str]): Prompts to answer
+            query (str): Query the prompts were built for
+            context (List[Dict[str, Any]]): Context documents in the prompts
+            
+        Returns:
+            List[str]: One response per prompt
+        """
+        fingerprint = GenCache.context_fingerprint(context)
+        responses = {}
+        for prompt in prompts:
+            if prompt not in responses:
+                responses[prompt] = self.cache.get(prompt, fingerprint, query)
+        
+        missing = [prompt for prompt, response in responses.items() if response is None]
+        if len(missing) == 1:
+            generated = [self.llm.generate(missing[0])]
+        elif missing:
+            generated = self.llm.generate_batch(missing)
+        else:
+            generated = []
+        for prompt, response in zip(missing, generated):
+            self.cache.put(prompt, fingerprint, response, query)
+            responses[prompt] = response
+        
+        return [responses[prompt] for prompt in prompts]
+    
     def _initial_analysis(self, query: str, context: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Perform initial analysis of the query.
         
@@ -81,7 +207,20 @@ class MultiStepReasoner:
         Returns:
             Dict[str, Any]: Analysis results
         """
-        prompt = f"""Analyze the following query and provide an initial assessment:
+        prompt = self._initial_analysis_prompt(query, context)
+        return self._parse_initial_analysis(prompt, self._generate([prompt], query, context)[0])
+    
+    def _initial_analysis_prompt(self, query: str, context: List[Dict[str, Any]]) -> str:
+        """Build the initial analysis prompt.
+        
+        Args:
+            query (str): The query to analyze
+            context (List[Dict[str, Any]]): Context documents
+            
+        Returns:
+            str: Prompt text
+        """
+        return f"""Analyze the following query and provide an initial assessment:
 
 Query: {query}
 
@@ -95,11 +234,19 @@ Please provide:
 4. Potential challenges or ambiguities
 
 Format your response as JSON with keys: entities, relevant_context, approach, challenges"""
+    
+    def _parse_initial_analysis(self, prompt: str, response: str) -> Dict[str, Any]:
+        """Turn an initial analysis response into a step result.
         
-        response = self.llm.generate(prompt)
-        
+        Args:
+            prompt (str): Prompt the response was generated for
+            response (str): LLM response
+            
+        Returns:
+            Dict[str, Any]: Analysis results
+        """
         try:
-            analysis = json.loads(response)
+            analysis = _loads(response)
         except json.JSONDecodeError:
             # Fallback if JSON parsing fails
             analysis = {
@@ -130,12 +277,34 @@ Format your response as JSON with keys: entities, relevant_context, approach, ch
         Returns:
             Dict[str, Any]: Refinement results
         """
-        prompt = f"""Refine the analysis of the following query based on previous reasoning:
+        # Refine the previous step's result: the initial analysis, or the
+        # previous refinement, so each step's prompt (and cache key) differs
+        previous_analysis = previous_state.get('refinement', previous_state.get('analysis', {}))
+        prompt = self._refinement_prompt(query, context, previous_analysis)
+        # The full response is kept even when it contains an early-stop word:
+        # the word only ends further steps (_should_stop_early), and the step's
+        # JSON is parsed and cached whole
+        response = self._generate([prompt], query, context)[0]
+        return self._parse_refinement(prompt, response, step)
+    
+    def _refinement_prompt(self, query: str, context: List[Dict[str, Any]],
+                           previous_analysis: Dict[str, Any]) -> str:
+        """Build a refinement prompt.
+        
+        Args:
+            query (str): The query to refine
+            context (List[Dict[str, Any]]): Context documents
+            previous_analysis (Dict[str, Any]): Analysis of the previous step
+            
+        Returns:
+            str: Prompt text
+        """
+        return f"""Refine the analysis of the following query based on previous reasoning:
 
 Query: {query}
 
 Previous Analysis:
-{json.dumps(previous_state.get('analysis', {}), indent=2)}
+{_dumps_indented(previous_analysis)}
 
 Context:
 {self._format_context(context)}
@@ -147,11 +316,20 @@ Please provide:
 4. Resolved challenges or new insights
 
 Format your response as JSON with keys: entities, relevant_context, approach, insights"""
+    
+    def _parse_refinement(self, prompt: str, response: str, step: int) -> Dict[str, Any]:
+        """Turn a refinement response into a step result.
         
-        response = self.llm.generate(prompt)
-        
+        Args:
+            prompt (str): Prompt the response was generated for
+            response (str): LLM response
+            step (int): Current step number
+            
+        Returns:
+            Dict[str, Any]: Refinement results
+        """
         try:
-            refinement = json.loads(response)
+            refinement = _loads(response)
         except json.JSONDecodeError:
             # Fallback if JSON parsing fails
             refinement = {
@@ -181,12 +359,23 @@ Format your response as JSON with keys: entities, relevant_context, approach, in
         Returns:
             Dict[str, Any]: Final answer with confidence and evidence
         """
+        # Only the parsed results of each step go into the prompt; the earlier
+        # prompts and raw responses would grow it quadratically with the steps
+        compact_steps = [
+            {
+                "step": step["step"],
+                "type": step["type"],
+                **{key: step[key] for key in ("analysis", "refinement") if key in step}
+            }
+            for step in steps
+        ]
+        
         prompt = f"""Synthesize a final answer to the following query based on all reasoning steps:
 
 Query: {query}
 
 Reasoning Steps:
-{json.dumps(steps, indent=2)}
+{_dumps_indented(compact_steps)}
 
 Context:
 {self._format_context(context)}
@@ -199,10 +388,10 @@ Please provide:
 
 Format your response as JSON with keys: answer, confidence, evidence, limitations"""
         
-        response = self.llm.generate(prompt)
+        response = self._generate([prompt], query, context)[0]
         
         try:
-            synthesis = json.loads(response)
+            synthesis = _loads(response)
         except json.JSONDecodeError:
             # Fallback if JSON parsing fails
             synthesis = {
@@ -231,35 +420,82 @@ Format your response as JSON with keys: answer, confidence, evidence, limitation
         # Simple heuristic: stop if confidence is high enough
         if "refinement" in step_result:
             # This is a bit tricky without structured data, so we'll use a simple approach
-            response = step_result.get("response", "").lower()
-            if "sufficient" in response or "adequate" in response or "complete" in response:
+            # (a single case-insensitive scan of the response)
+            if _STOP_RE.search(step_result.get("response", "")):
                 return True
         
         return False
     
-    def _format_context(self, context: List[Dict[str, Any]]) -> str:
+    def _format_context(self, context: List[Dict[str, Any]],
+                        max_total_chars: int = MAX_CONTEXT_CHARS) -> str:
         """Format context for inclusion in prompts.
         
         Args:
             context (List[Dict[str, Any]]): Context documents
+            max_total_chars (int): Maximum length of the formatted context
             
         Returns:
             str: Formatted context string
         """
-        formatted = ""
+        parts = []
         for i, doc in enumerate(context[:5]):  # Limit to first 5 documents
-            content = doc.get("content", "")[:200] + "..." if len(doc.get("content", "")) > 200 else doc.get("content", "")
-            formatted += f"Document {i+1} (Score: {doc.get('score', 0.0):.2f}):\n{content}\n\n"
-        return formatted.strip()
+            content = doc.get("content", "")
+            if len(content) > 200:
+                content = content[:200] + "..."
+            parts.append(f"Document {i+1} (Score: {doc.get('score', 0.0):.2f}):\n{content}")
+        return "\n\n".join(parts).strip()[:max_total_chars]
     
-    def get_reasoning_history(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _compact_session(session: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a reasoning session with its LLM text reduced for storage.
+        
+        Each step's prompt becomes an 8-byte BLAKE2b "prompt_hash" and its
+        response is compressed into "response_compressed"; the parsed
+        analysis/refinement is kept as is.
+        
+        Args:
+            session (Dict[str, Any]): Reasoning session returned by reason
+            
+        Returns:
+            Dict[str, Any]: Compacted session
+        """
+        steps = []
+        for step in session["steps"]:
+            compact_step = {
+                key: value for key, value in step.items() if key not in ("prompt", "response")
+            }
+            compact_step["prompt_hash"] = hashlib.blake2b(
+                step["prompt"].encode("utf-8"), digest_size=8
+            ).hexdigest()
+            compact_step["response_compressed"] = _compress(step["response"])
+            steps.append(compact_step)
+        return {**session, "steps": steps}
+    
+    def get_reasoning_history(self, decompress: bool = True) -> List[Dict[str, Any]]:
         """Get the reasoning history.
         
+        Prompts are not kept; each step has a "prompt_hash" instead.
+        
+        Args:
+            decompress (bool): Restore each step's "response" text; when False,
+                steps carry the compressed bytes in "response_compressed"
+            
         Returns:
-            List[Dict[str, Any]]: Reasoning history
+            List[Dict[str, Any]]: Reasoning history, oldest session first
         """
-        return self.reasoning_history.copy()
+        if not decompress:
+            return list(self.reasoning_history)
+        
+        history = []
+        for session in self.reasoning_history:
+            steps = []
+            for step in session["steps"]:
+                step = dict(step)
+                step["response"] = _decompress(step.pop("response_compressed"))
+                steps.append(step)
+            history.append({**session, "steps": steps})
+        return history
     
     def clear_history(self) -> None:
         """Clear the reasoning history."""
-        self.reasoning_history = []
+        self.reasoning_history.clear()
@@ -1,6 +1,90 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from array import array
+from collections import Counter, OrderedDict, defaultdict
+from functools import lru_cache
 from ..parsers.base import Document
+import json
 import math
+import os
+import re
+import numpy as np
+
+
+# Terms are runs of word characters
+_TOKEN_RE = re.compile(r'\b\w+\b')
+
+# Number of (query terms, top_k) rankings kept per retriever
+SEARCH_CACHE_SIZE = 1024
+
+# Headroom applied to the largest single-term score to get score_scale
+SCORE_SCALE_MARGIN = 1.2
+
+# Files written by BM25Retriever.save; postings are stored CSR-style, term i
+# owning postings_offsets[i]:postings_offsets[i + 1] of the doc ID and
+# frequency arrays
+INDEX_FILE = "index.json"
+DOCUMENTS_FILE = "documents.json"
+DOC_LENGTHS_FILE = "doc_lengths.npy"
+POSTINGS_DOC_IDS_FILE = "postings_doc_ids.npy"
+POSTINGS_FREQS_FILE = "postings_freqs.npy"
+POSTINGS_OFFSETS_FILE = "postings_offsets.npy"
+
+
+def _bm25_accumulate(doc_ids: np.ndarray, freqs: np.ndarray, offsets: np.ndarray,
+                     idf: np.ndarray, k1: float, k1_norm: np.ndarray,
+                     scores: np.ndarray, seen: np.ndarray) -> np.ndarray:
+    """Accumulate BM25 scores of the query terms' postings into a dense array.
+    
+    Query term t owns postings offsets[t]:offsets[t + 1] of doc_ids/freqs.
+    Terms are added in query order, matching the NumPy path bit for bit.
+    
+    Args:
+        doc_ids (np.ndarray): Concatenated posting document IDs
+        freqs (np.ndarray): Concatenated posting term frequencies
+        offsets (np.ndarray): Start of each term's postings, plus the end
+        idf (np.ndarray): IDF of each query term
+        k1 (float): BM25 k1 parameter
+        k1_norm (np.ndarray): k1 length normalization per document
+        scores (np.ndarray): Zeroed per-document scores, filled in place
+        seen (np.ndarray): Cleared per-document flags, set for matched documents
+        
+    Returns:
+        np.ndarray: Matched document IDs, in first-seen order
+    """
+    candidates = np.empty(len(doc_ids), dtype=np.int32)
+    count = 0
+    for t in range(len(idf)):
+        for j in range(offsets[t], offsets[t + 1]):
+            doc_id = doc_ids[j]
+            freq = freqs[j]
+            if not seen[doc_id]:
+                seen[doc_id] = True
+                candidates[count] = doc_id
+                count += 1
+            scores[doc_id] += idf[t] * ((freq * (k1 + 1)) / (freq + k1_norm[doc_id]))
+    return candidates[:count]
+
+
+@lru_cache(maxsize=1)
+def _compiled_accumulate():
+    """Import Numba and compile _bm25_accumulate on first multi-term search.
+    
+    Returns:
+        Callable: The compiled kernel, or None when Numba is not installed
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(cache=True, nogil=True)(_bm25_accumulate)
+
+
+def _new_postings() -> Tuple[List[int], List[int]]:
+    """Return empty pending postings, ([doc IDs], [frequencies]).
+    
+    A named function rather than a lambda, so retrievers stay picklable.
+    """
+    return [], []
 
 
 class BM25Retriever:
@@ -18,9 +102,25 @@ class BM25Retriever:
         self.documents = []
         self.avg_doc_length = 0.0
         self.doc_count = 0
-        self.term_freqs = {}  # term -> doc_id -> frequency
-        self.doc_freqs = {}   # term -> document frequency
-        self.doc_lengths = {} # doc_id -> length
+        self.doc_lengths = array('i')  # doc_id -> length, packed int32
+        self._total_doc_length = 0
+        
+        # Inverted index as structure-of-arrays postings: term -> (doc IDs,
+        # term frequencies) as contiguous int32 arrays. New postings collect in
+        # _pending (term -> ([doc IDs], [frequencies])) and are frozen into
+        # the arrays on the next search.
+        self.postings = {}
+        self._pending = defaultdict(_new_postings)
+        
+        # k1 * (1 - b + b * |d| / avgdl) per document, rebuilt with the postings
+        self._k1_norm = None
+        self._score_scale = None
+        
+        # LRU of rankings, (query terms, top_k) -> ((doc_id, score), ...);
+        # cleared whenever documents are added
+        self._search_cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
     
     def add_documents(self, docs: List[Document]) -> None:
         """Add documents to the BM25 index.
@@ -35,27 +135,150 @@ class BM25Retriever:
             # Tokenize content
             tokens = self._tokenize(doc.content)
             doc_length = len(tokens)
-            self.doc_lengths[doc_id] = doc_length
+            self.doc_lengths.append(doc_length)
+            self._total_doc_length += doc_length
             
             # Calculate term frequencies
-            term_freq = {}
-            for token in tokens:
-                term_freq[token] = term_freq.get(token, 0) + 1
+            term_freq = Counter(tokens)
             
-            # Update term frequencies and document frequencies
+            # Append this document to each term's pending postings
             for term, freq in term_freq.items():
-                if term not in self.term_freqs:
-                    self.term_freqs[term] = {}
-                self.term_freqs[term][doc_id] = freq
-                
-                if term not in self.doc_freqs:
-                    self.doc_freqs[term] = 0
-                self.doc_freqs[term] += 1
+                doc_ids, freqs = self._pending[term]
+                doc_ids.append(doc_id)
+                freqs.append(freq)
         
         # Update statistics
         self.doc_count = len(self.documents)
         if self.doc_lengths:
-            self.avg_doc_length = sum(self.doc_lengths.values()) / len(self.doc_lengths)
+            self.avg_doc_length = self._total_doc_length / len(self.doc_lengths)
+        
+        # Invalidate the length norms, score scale and cached rankings
+        self._k1_norm = None
+        self._score_scale = None
+        self._search_cache.clear()
+    
+    def _freeze(self) -> None:
+        """Merge pending postings into the int32 arrays and rebuild length norms."""
+        postings = self.postings
+        for term, (doc_ids, freqs) in self._pending.items():
+            doc_ids = np.asarray(doc_ids, dtype=np.int32)
+            freqs = np.asarray(freqs, dtype=np.int32)
+            if term in postings:
+                old_doc_ids, old_freqs = postings[term]
+                doc_ids = np.concatenate((old_doc_ids, doc_ids))
+                freqs = np.concatenate((old_freqs, freqs))
+            postings[term] = (doc_ids, freqs)
+        self._pending.clear()
+        
+        doc_lengths = np.frombuffer(self.doc_lengths, dtype=np.int32).astype(np.float64) \
+            if self.doc_lengths else np.empty(0, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Length normalization per document: 1 - b + b * |d| / avgdl
+            norm = (1 - self.b) + self.b * (doc_lengths / self.avg_doc_length)
+        self._k1_norm = self.k1 * norm
+    
+    @property
+    def score_scale(self) -> float:
+        """Typical upper bound of search scores, for normalizing them.
+        
+        Computed once per indexing change as SCORE_SCALE_MARGIN times the
+        largest score any single term contributes to any document. Queries
+        matching several terms in one document can score above it.
+        
+        Returns:
+            float: Score scale (1.0 for an empty index)
+        """
+        if self._score_scale is None:
+            if self._k1_norm is None:
+                self._freeze()
+            largest = 0.0
+            if self.postings:
+                postings = list(self.postings.values())
+                doc_freqs = np.array([len(doc_ids) for doc_ids, _ in postings], dtype=np.float64)
+                idf = np.log((self.doc_count - doc_freqs + 0.5) / (doc_freqs + 0.5))
+                doc_ids = np.concatenate([doc_ids for doc_ids, _ in postings])
+                freqs = np.concatenate([freqs for _, freqs in postings])
+                scores = np.repeat(idf, doc_freqs.astype(np.int64)) * (
+                    freqs * (self.k1 + 1) / (freqs + self._k1_norm[doc_ids])
+                )
+                largest = max(float(scores.max()), 0.0)
+            self._score_scale = largest * SCORE_SCALE_MARGIN or 1.0
+        return self._score_scale
+    
+    def save(self, path: str) -> None:
+        """Save the index to a directory.
+        
+        Document metadata is stored as JSON; a TypeError is raised, before
+        any file is written, if a metadata value is not JSON serializable.
+        
+        Args:
+            path (str): Directory to write the index files to (created if missing)
+        """
+        # Serialize first so a bad metadata value leaves no partial index behind
+        documents_json = json.dumps(
+            [{"content": doc.content, "metadata": doc.metadata} for doc in self.documents]
+        )
+        
+        self._freeze()
+        os.makedirs(path, exist_ok=True)
+        
+        terms = list(self.postings)
+        doc_id_arrays = [self.postings[term][0] for term in terms]
+        freq_arrays = [self.postings[term][1] for term in terms]
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum([len(doc_ids) for doc_ids in doc_id_arrays], out=offsets[1:])
+        
+        empty = np.empty(0, dtype=np.int32)
+        np.save(os.path.join(path, POSTINGS_DOC_IDS_FILE),
+                np.concatenate(doc_id_arrays) if terms else empty)
+        np.save(os.path.join(path, POSTINGS_FREQS_FILE),
+                np.concatenate(freq_arrays) if terms else empty)
+        np.save(os.path.join(path, POSTINGS_OFFSETS_FILE), offsets)
+        np.save(os.path.join(path, DOC_LENGTHS_FILE),
+                np.asarray(self.doc_lengths, dtype=np.int32))
+        
+        with open(os.path.join(path, INDEX_FILE), "w", encoding="utf-8") as f:
+            json.dump({"k1": self.k1, "b": self.b, "terms": terms}, f)
+        with open(os.path.join(path, DOCUMENTS_FILE), "w", encoding="utf-8") as f:
+            f.write(documents_json)
+    
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "BM25Retriever":
+        """Load an index written by save.
+        
+        Args:
+            path (str): Directory containing the index files
+            mmap (bool): Memory-map the posting arrays instead of reading them,
+                so they are paged in on demand
+            
+        Returns:
+            BM25Retriever: Retriever ready to search; more documents can be added
+        """
+        mmap_mode = "r" if mmap else None
+        with open(os.path.join(path, INDEX_FILE), encoding="utf-8") as f:
+            index = json.load(f)
+        with open(os.path.join(path, DOCUMENTS_FILE), encoding="utf-8") as f:
+            documents = [Document(doc["content"], doc["metadata"]) for doc in json.load(f)]
+        
+        doc_ids = np.load(os.path.join(path, POSTINGS_DOC_IDS_FILE), mmap_mode=mmap_mode)
+        freqs = np.load(os.path.join(path, POSTINGS_FREQS_FILE), mmap_mode=mmap_mode)
+        offsets = np.load(os.path.join(path, POSTINGS_OFFSETS_FILE)).tolist()
+        doc_lengths = array('i', np.load(os.path.join(path, DOC_LENGTHS_FILE)).astype(np.int32).tobytes())
+        
+        retriever = cls(k1=index["k1"], b=index["b"])
+        retriever.documents = documents
+        retriever.doc_count = len(documents)
+        retriever.doc_lengths = doc_lengths
+        retriever._total_doc_length = sum(doc_lengths)
+        if doc_lengths:
+            retriever.avg_doc_length = retriever._total_doc_length / len(doc_lengths)
+        
+        # Slices of the memory-mapped arrays stay memory-mapped
+        retriever.postings = {
+            term: (doc_ids[start:end], freqs[start:end])
+            for term, start, end in zip(index["terms"], offsets, offsets[1:])
+        }
+        return retriever
     
     def search(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """Search documents using BM25 scoring.
@@ -71,44 +294,105 @@ class BM25Retriever:
             return []
         
         # Tokenize query
-        query_terms = self._tokenize(query)
-        
-        # Calculate scores for each document
-        scores = {}
-        for doc_id in range(len(self.documents)):
-            score = 0.0
-            for term in query_terms:
-                if term in self.term_freqs and doc_id in self.term_freqs[term]:
-                    # Calculate BM25 score for this term
-                    term_freq = self.term_freqs[term][doc_id]
-                    doc_freq = self.doc_freqs.get(term, 0)
-                    doc_length = self.doc_lengths.get(doc_id, 0)
-                    
-                    # BM25 formula
-                    idf = math.log((self.doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
-                    numerator = term_freq * (self.k1 + 1)
-                    denominator = term_freq + self.k1 * (1 - self.b + self.b * (doc_length / self.avg_doc_length))
-                    score += idf * (numerator / denominator)
-            
-            scores[doc_id] = score
+        query_terms = tuple(self._tokenize(query))
         
-        # Sort by score and return top_k
-        sorted_docs = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
+        # Repeated queries (common in agent loops) reuse the cached ranking
+        key = (query_terms, top_k)
+        ranking = self._search_cache.get(key)
+        if ranking is None:
+            self.cache_misses += 1
+            ranking = self._rank(query_terms, top_k)
+            self._search_cache[key] = ranking
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        else:
+            self.cache_hits += 1
+            self._search_cache.move_to_end(key)
         
         # Format results
         results = []
-        for doc_id, score in sorted_docs:
-            if score > 0:  # Only include documents with positive scores
-                doc = self.documents[doc_id]
-                result = {
-                    "content": doc.content,
-                    "metadata": doc.metadata,
-                    "score": score
-                }
-                results.append(result)
+        for doc_id, score in ranking:
+            doc = self.documents[doc_id]
+            result = {
+                "content": doc.content,
+                "metadata": doc.metadata,
+                "score": score
+            }
+            results.append(result)
         
         return results
     
+    def _rank(self, query_terms: Tuple[str, ...], top_k: int) -> Tuple[Tuple[int, float], ...]:
+        """Score documents for query terms and return the top_k positive ones.
+        
+        Args:
+            query_terms (Tuple[str, ...]): Tokenized query
+            top_k (int): Number of top results to return
+            
+        Returns:
+            Tuple[Tuple[int, float], ...]: (doc_id, score) pairs, best first
+        """
+        if self._k1_norm is None:
+            self._freeze()
+        k1_norm = self._k1_norm
+        
+        # Walk only the postings of the query terms (repeated terms count
+        # again), so the work is proportional to the matched postings rather
+        # than to the corpus size
+        postings = [self.postings[term] for term in query_terms if term in self.postings]
+        if top_k <= 0 or not postings:
+            return ()
+        idf = [
+            math.log((self.doc_count - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5))
+            for doc_ids, _ in postings
+        ]
+        
+        accumulate = _compiled_accumulate() if len(postings) > 1 else None
+        if accumulate is not None:
+            # Compiled kernel: one pass over the postings with no temporaries
+            offsets = np.zeros(len(postings) + 1, dtype=np.int64)
+            np.cumsum([len(doc_ids) for doc_ids, _ in postings], out=offsets[1:])
+            scores = np.zeros(self.doc_count, dtype=np.float64)
+            seen = np.zeros(self.doc_count, dtype=np.bool_)
+            candidates = accumulate(
+                np.concatenate([doc_ids for doc_ids, _ in postings]),
+                np.concatenate([freqs for _, freqs in postings]),
+                offsets, np.asarray(idf, dtype=np.float64), float(self.k1),
+                k1_norm, scores, seen
+            )
+            scores = scores[candidates]
+        else:
+            # BM25 formula, vectorized over each term's postings
+            contributions = [
+                term_idf * ((term_freq * (self.k1 + 1)) / (term_freq + k1_norm[doc_ids]))
+                for term_idf, (doc_ids, term_freq) in zip(idf, postings)
+            ]
+            if len(postings) == 1:
+                # A single posting list already has unique, ascending document IDs
+                candidates, scores = postings[0][0], contributions[0]
+            else:
+                # Sum per matched document; np.add.at adds in query-term order
+                candidates, inverse = np.unique(
+                    np.concatenate([doc_ids for doc_ids, _ in postings]), return_inverse=True
+                )
+                scores = np.zeros(len(candidates), dtype=np.float64)
+                np.add.at(scores, inverse, np.concatenate(contributions))
+        
+        # Only documents with positive scores are returned; pick the top_k of
+        # them, ties broken by insertion order
+        positive = scores > 0
+        candidates, scores = candidates[positive], scores[positive]
+        if len(candidates) > top_k:
+            # Keep everything scoring at least the k-th best, so ties survive
+            kth = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+            keep = scores >= kth
+            candidates, scores = candidates[keep], scores[keep]
+        order = np.lexsort((candidates, -scores))[:top_k]
+        
+        return tuple(
+            (int(candidates[i]), float(scores[i])) for i in order
+        )
+    
     def _tokenize(self, text: str) -> List[str]:
         """Simple tokenizer that splits text into terms.
         
@@ -119,6 +403,4 @@ class BM25Retriever:
             List[str]: List of terms
         """
         # Simple tokenization by splitting on whitespace and removing punctuation
-        import re
-        terms = re.findall(r'\b\w+\b', text.lower())
-        return terms
+        return _TOKEN_RE.findall(text.lower())
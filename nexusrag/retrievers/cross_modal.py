@@ -2,9 +2,14 @@ from typing import List, Dict, Any
 from ..parsers.base import Document
 from ..vectorstores.base import BaseVectorStore
 from ..embedders.base import BaseEmbedder
+import heapq
 import numpy as np
 
 
+# Modalities with their own vector store namespace when the store supports them
+MODALITIES = ("text", "image", "audio", "video", "table")
+
+
 class CrossModalRetriever:
     """Cross-modal retriever for retrieving across different modalities."""
     
@@ -26,6 +31,31 @@ class CrossModalRetriever:
         """
         # Add documents to vector store
         self.vector_store.add(documents)
+        self.add_to_namespaces(documents)
+    
+    def add_to_namespaces(self, documents: List[Document]) -> None:
+        """Index documents under their modality namespaces only.
+        
+        For callers that add the documents to the main vector store
+        themselves; a no-op for stores without namespace support.
+        
+        Args:
+            documents (List[Document]): List of multimodal documents to index
+        """
+        # Index each document under every modality it matches, so modality
+        # searches query only that modality's documents
+        if getattr(self.vector_store, "supports_namespaces", False):
+            buckets = {modality: [] for modality in MODALITIES}
+            for doc in documents:
+                content_type = doc.metadata.get("content_type", "unknown")
+                media_type = doc.metadata.get("media_type", "unknown")
+                for modality in MODALITIES:
+                    if self._matches_modality(content_type, media_type, modality):
+                        buckets[modality].append(doc)
+            
+            for modality, docs in buckets.items():
+                if docs:
+                    self.vector_store.add_to_namespace(modality, docs)
     
     def cross_modal_search(self, query: str, modality: str = None, top_k: int = 5) -> List[Dict[str, Any]]:
         """Perform cross-modal search across different modalities.
@@ -38,6 +68,12 @@ class CrossModalRetriever:
         Returns:
             List[Dict[str, Any]]: List of search results with scores
         """
+        if (modality and modality.lower() in MODALITIES
+                and getattr(self.vector_store, "supports_namespaces", False)):
+            # Query the modality's namespace directly: no over-fetch or filtering
+            results = self.vector_store.query_namespace(query, top_k, namespace=modality.lower())
+            return heapq.nlargest(top_k, results, key=lambda x: x.get("score", 0.0))
+        
         # Perform standard vector search
         results = self.vector_store.query(query, top_k * 2)  # Get more results for filtering
         
@@ -55,9 +91,8 @@ class CrossModalRetriever:
             
             results = filtered_results
         
-        # Sort by score and return top_k
-        results.sort(key=lambda x: x.get("score", 0.0), reverse=True)
-        return results[:top_k]
+        # Select the top_k by score (O(n log k), same order as a stable sort)
+        return heapq.nlargest(top_k, results, key=lambda x: x.get("score", 0.0))
     
     def _matches_modality(self, content_type: str, media_type: str, target_modality: str) -> bool:
         """Check if a document matches the target modality.
@@ -105,11 +140,9 @@ class CrossModalRetriever:
         if weights is None:
             weights = {modality: 1.0/len(queries) for modality in queries}
         
-        # Perform search for each modality
-        modality_results = {}
-        for modality, query in queries.items():
-            results = self.vector_store.query(query, top_k * 2)
-            modality_results[modality] = results
+        # Search all modalities in one batched call
+        all_results = self.vector_store.query_batch(list(queries.values()), top_k * 2)
+        modality_results = dict(zip(queries, all_results))
         
         # Fuse results
         fused_results = self._fuse_results(modality_results, weights, top_k)
@@ -141,10 +174,13 @@ class CrossModalRetriever:
                 score = result.get("score", 0.0)
                 weighted_score = score * weight
                 
-                if content in result_map:
+                # One lookup per result; str caches its hash, so the content
+                # is hashed once however many modalities return it
+                existing = result_map.get(content)
+                if existing is not None:
                     # Update existing result
-                    result_map[content]["fused_score"] += weighted_score
-                    result_map[content]["modalities"].append(modality)
+                    existing["fused_score"] += weighted_score
+                    existing["modalities"].append(modality)
                 else:
                     # Add new result
                     result_map[content] = {
@@ -155,9 +191,5 @@ class CrossModalRetriever:
                         "modalities": [modality]
                     }
         
-        # Convert to list and sort by fused score
-        fused_results = list(result_map.values())
-        fused_results.sort(key=lambda x: x["fused_score"], reverse=True)
-        
-        # Return top_k results
-        return fused_results[:top_k]
+        # Return the top_k results by fused score
+        return heapq.nlargest(top_k, result_map.values(), key=lambda x: x["fused_score"])
@@ -2,21 +2,39 @@ from typing import List, Dict, Any
 from ..parsers.base import Document
 from ..vectorstores.base import BaseVectorStore
 from .bm25 import BM25Retriever
+import heapq
 import numpy as np
 
 
+# Rank offset k in Reciprocal Rank Fusion, 1 / (k + rank); 60 is the value
+# from the original RRF paper
+RRF_K = 60
+
+
 class HybridRetriever:
     """Hybrid retriever that combines vector search and keyword search."""
     
-    def __init__(self, vector_store: BaseVectorStore, keyword_weight: float = 0.5):
+    def __init__(self, vector_store: BaseVectorStore, keyword_weight: float = 0.5,
+                 fast_normalize: bool = False, fusion: str = "rrf"):
         """Initialize the hybrid retriever.
         
         Args:
             vector_store (BaseVectorStore): Vector store for semantic search
             keyword_weight (float): Weight for keyword search (0.0 to 1.0)
+            fast_normalize (bool): With "score" fusion, normalize scores by the
+                vector store's and BM25 index's precomputed score_scale instead
+                of each result list's maximum
+            fusion (str): How result lists are merged: "rrf" (weighted
+                Reciprocal Rank Fusion, which only uses ranks) or "score"
+                (weighted sum of normalized scores)
         """
+        if fusion not in ("rrf", "score"):
+            raise ValueError(f"Unsupported fusion method: {fusion}")
+        
         self.vector_store = vector_store
         self.keyword_weight = keyword_weight
+        self.fast_normalize = fast_normalize
+        self.fusion = fusion
         self.bm25_retriever = BM25Retriever()
     
     def add_documents(self, docs: List[Document]) -> None:
@@ -48,11 +66,58 @@ class HybridRetriever:
         keyword_results = self.bm25_retriever.search(query, top_k * 2)
         
         # Combine results
-        combined_results = self._combine_results(vector_results, keyword_results, top_k)
+        if self.fusion == "rrf":
+            combined_results = self._rrf_combine_results(vector_results, keyword_results, top_k)
+        else:
+            combined_results = self._combine_results(vector_results, keyword_results, top_k)
         
         return combined_results
     
     
+    def _rrf_combine_results(self, vector_results: List[Dict[str, Any]],
+                             keyword_results: List[Dict[str, Any]],
+                             top_k: int) -> List[Dict[str, Any]]:
+        """Combine vector and keyword search results with Reciprocal Rank Fusion.
+        
+        Each list contributes weight / (RRF_K + rank) for its best rank of a
+        document, so differently scaled scores need no normalization.
+        
+        Args:
+            vector_results (List[Dict[str, Any]]): Vector search results, best first
+            keyword_results (List[Dict[str, Any]]): Keyword search results, best first
+            top_k (int): Number of top results to return
+            
+        Returns:
+            List[Dict[str, Any]]: Combined search results; vector_score and
+                keyword_score are the raw scores from each list
+        """
+        result_map = {}
+        for results, score_key, weight in (
+            (vector_results, "vector_score", 1 - self.keyword_weight),
+            (keyword_results, "keyword_score", self.keyword_weight),
+        ):
+            seen = set()
+            for rank, result in enumerate(results, start=1):
+                content = result["content"]
+                if content in seen:
+                    continue
+                seen.add(content)
+                
+                existing = result_map.get(content)
+                if existing is None:
+                    existing = result_map[content] = {
+                        "content": content,
+                        "metadata": result["metadata"],
+                        "vector_score": 0.0,
+                        "keyword_score": 0.0,
+                        "hybrid_score": 0.0
+                    }
+                existing[score_key] = result.get("score", 0.0)
+                existing["hybrid_score"] += weight / (RRF_K + rank)
+        
+        # Return the top_k results by fused score
+        return heapq.nlargest(top_k, result_map.values(), key=lambda x: x["hybrid_score"])
+    
     def _combine_results(self, vector_results: List[Dict[str, Any]], 
                         keyword_results: List[Dict[str, Any]], 
                         top_k: int) -> List[Dict[str, Any]]:
@@ -66,17 +131,17 @@ class HybridRetriever:
         Returns:
             List[Dict[str, Any]]: Combined search results with scores
         """
-        # Normalize scores
-        vector_scores = [result.get("score", 0.0) for result in vector_results]
-        keyword_scores = [result.get("score", 0.0) for result in keyword_results]
-        
         # Handle empty results
-        if not vector_scores and not keyword_scores:
+        if not vector_results and not keyword_results:
             return []
         
         # Normalize scores to 0-1 range
-        max_vector_score = max(vector_scores) if vector_scores else 1.0
-        max_keyword_score = max(keyword_scores) if keyword_scores else 1.0
+        if self.fast_normalize:
+            max_vector_score = getattr(self.vector_store, "score_scale", 1.0)
+            max_keyword_score = self.bm25_retriever.score_scale
+        else:
+            max_vector_score = max((result.get("score", 0.0) for result in vector_results), default=1.0)
+            max_keyword_score = max((result.get("score", 0.0) for result in keyword_results), default=1.0)
         
         if max_vector_score == 0:
             max_vector_score = 1.0
@@ -106,10 +171,13 @@ class HybridRetriever:
             normalized_score = result.get("score", 0.0) / max_keyword_score
             keyword_score = self.keyword_weight * normalized_score
             
-            if content in result_map:
+            # One lookup per result; str caches its hash, so the content is
+            # hashed once for both result lists
+            existing = result_map.get(content)
+            if existing is not None:
                 # Update existing result
-                result_map[content]["keyword_score"] = normalized_score
-                result_map[content]["hybrid_score"] += keyword_score
+                existing["keyword_score"] = normalized_score
+                existing["hybrid_score"] += keyword_score
             else:
                 # Add new result
                 result_map[content] = {
@@ -120,9 +188,5 @@ class HybridRetriever:
                     "hybrid_score": keyword_score
                 }
         
-        # Convert to list and sort by hybrid score
-        combined_results = list(result_map.values())
-        combined_results.sort(key=lambda x: x["hybrid_score"], reverse=True)
-        
-        # Return top_k results
-        return combined_results[:top_k]
+        # Return the top_k results by hybrid score
+        return heapq.nlargest(top_k, result_map.values(), key=lambda x: x["hybrid_score"])
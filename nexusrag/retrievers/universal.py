@@ -1,10 +1,13 @@
 from typing import List, Dict, Any
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from ..parsers.base import Document
 from ..vectorstores.base import BaseVectorStore
 from ..embedders.base import BaseEmbedder
 from .hybrid import HybridRetriever
 from .reranker import BGEReranker, LightweightReranker
 from .cross_modal import CrossModalRetriever
+import heapq
 
 
 class UniversalRetriever:
@@ -40,11 +43,17 @@ class UniversalRetriever:
         Args:
             documents (List[Document]): List of documents to add
         """
-        # Add to hybrid retriever (which also adds to vector store)
-        self.hybrid_retriever.add_documents(documents)
-        
-        # Add to cross-modal retriever
-        self.cross_modal_retriever.add_multimodal_documents(documents)
+        # The documents are written to the vector store exactly once (the
+        # hybrid and cross-modal retrievers share it); the BM25 index is built
+        # in a worker thread while the store embeds and writes them, then the
+        # modality namespaces are populated
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            bm25_future = executor.submit(
+                self.hybrid_retriever.bm25_retriever.add_documents, documents
+            )
+            self.vector_store.add(documents)
+            self.cross_modal_retriever.add_to_namespaces(documents)
+            bm25_future.result()
     
     def search(self, query: str, top_k: int = 5, use_reranking: bool = True) -> List[Dict[str, Any]]:
         """Perform standard search with optional re-ranking.
@@ -64,9 +73,8 @@ class UniversalRetriever:
         if use_reranking and results:
             results = self.reranker.rerank(query, results, top_k)
         else:
-            # Sort by hybrid score and return top_k
-            results.sort(key=lambda x: x.get("hybrid_score", x.get("score", 0.0)), reverse=True)
-            results = results[:top_k]
+            # Select the top_k by hybrid score (O(n log k), same order as a stable sort)
+            results = heapq.nlargest(top_k, results, key=lambda x: x.get("hybrid_score", x.get("score", 0.0)))
         
         return results
     
@@ -90,9 +98,8 @@ class UniversalRetriever:
         if use_reranking and results:
             results = self.reranker.rerank(query, results, top_k)
         else:
-            # Sort by score and return top_k
-            results.sort(key=lambda x: x.get("score", 0.0), reverse=True)
-            results = results[:top_k]
+            # Select the top_k by score (O(n log k), same order as a stable sort)
+            results = heapq.nlargest(top_k, results, key=lambda x: x.get("score", 0.0))
         
         return results
     
@@ -118,9 +125,8 @@ class UniversalRetriever:
             first_query = next(iter(queries.values()))
             results = self.reranker.rerank(first_query, results, top_k)
         else:
-            # Sort by fused score and return top_k
-            results.sort(key=lambda x: x.get("fused_score", 0.0), reverse=True)
-            results = results[:top_k]
+            # Select the top_k by fused score (O(n log k), same order as a stable sort)
+            results = heapq.nlargest(top_k, results, key=lambda x: x.get("fused_score", 0.0))
         
         return results
     
@@ -136,18 +142,19 @@ class UniversalRetriever:
         if not results:
             return {"total_results": 0}
         
-        # Count modalities
-        modality_counts = {}
+        # Count modalities and sum scores in a single pass
+        modality_counts = Counter()
+        score_sum = 0.0
         for result in results:
             metadata = result.get("metadata", {})
             content_type = metadata.get("content_type", "unknown")
             media_type = metadata.get("media_type", "unknown")
             
-            modality = f"{content_type}/{media_type}"
-            modality_counts[modality] = modality_counts.get(modality, 0) + 1
+            modality_counts[f"{content_type}/{media_type}"] += 1
+            score_sum += result.get("score", 0.0)
         
         return {
             "total_results": len(results),
-            "modalities": modality_counts,
-            "avg_score": sum(result.get("score", 0.0) for result in results) / len(results)
+            "modalities": dict(modality_counts),
+            "avg_score": score_sum / len(results)
         }
@@ -1,11 +1,19 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
 from nexusrag.parsers.base import Document
 
 
 class BaseVectorStore(ABC):
     """Abstract base class for vector stores."""
     
+    # Upper bound of the scores returned by query (e.g. 1.0 for cosine
+    # similarity); callers may divide by it instead of scanning for the maximum
+    score_scale: float = 1.0
+    
+    # Whether add_to_namespace and query_namespace are implemented
+    supports_namespaces: bool = False
+    
     @abstractmethod
     def add(self, docs: List[Document]) -> None:
         """Add documents to the vector store.
@@ -27,3 +35,43 @@ class BaseVectorStore(ABC):
             List[Dict[str, Any]]: List of similar documents with scores
         """
         pass
+    
+    def query_batch(self, texts: List[str], top_k: int = 5) -> List[List[Dict[str, Any]]]:
+        """Query the vector store with several texts at once.
+        
+        The default implementation issues the query calls concurrently from a
+        thread pool; stores with a native multi-query API can override it.
+        
+        Args:
+            texts (List[str]): Query texts
+            top_k (int): Number of top results to return per query
+            
+        Returns:
+            List[List[Dict[str, Any]]]: Results for each query, in input order
+        """
+        if len(texts) <= 1:
+            return [self.query(text, top_k) for text in texts]
+        with ThreadPoolExecutor(max_workers=len(texts)) as executor:
+            return list(executor.map(lambda text: self.query(text, top_k), texts))
+    
+    def add_to_namespace(self, namespace: str, docs: List[Document]) -> None:
+        """Add documents to a namespace that can be queried on its own.
+        
+        Args:
+            namespace (str): Namespace name
+            docs (List[Document]): List of documents to add
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support namespaces")
+    
+    def query_namespace(self, text: str, top_k: int = 5, namespace: str = None) -> List[Dict[str, Any]]:
+        """Query only the documents of one namespace.
+        
+        Args:
+            text (str): Query text
+            top_k (int): Number of top results to return
+            namespace (str): Namespace name
+            
+        Returns:
+            List[Dict[str, Any]]: List of similar documents with scores
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support namespaces")
@@ -1,10 +1,22 @@
 from typing import List, Dict, Any
+import threading
 from .base import BaseVectorStore
 from ..parsers.base import Document
 
+try:
+    import chromadb
+except ImportError:
+    chromadb = None
+
 
 class ChromaVectorStore(BaseVectorStore):
-    """Vector store implementation using ChromaDB."""
+    """Vector store implementation using ChromaDB.
+    
+    Namespaces are stored as separate collections named
+    "<collection_name>-<namespace>".
+    """
+    
+    supports_namespaces = True
     
     def __init__(self, collection_name: str = "nexusrag", persist_directory: str = None):
         """Initialize the Chroma vector store.
@@ -13,9 +25,7 @@ class ChromaVectorStore(BaseVectorStore):
             collection_name (str): Name of the Chroma collection
             persist_directory (str): Directory to persist the database (optional)
         """
-        try:
-            import chromadb
-        except ImportError:
+        if chromadb is None:
             raise ImportError(
                 "To use ChromaVectorStore, you need to install the chromadb library. "
                 "Please run: pip install chromadb"
@@ -29,6 +39,30 @@ class ChromaVectorStore(BaseVectorStore):
             
         # Get or create collection
         self.collection = self.client.get_or_create_collection(name=collection_name)
+        self.collection_name = collection_name
+        self._namespaces = {}
+        
+        # Next document ID per collection name; starts after any documents
+        # already persisted so earlier rows are not overwritten. IDs are
+        # reserved under a lock so concurrent add calls get disjoint ranges
+        self._next_ids = {}
+        self._id_lock = threading.Lock()
+    
+    def _namespace_collection(self, namespace: str):
+        """Get or create the collection backing a namespace.
+        
+        Args:
+            namespace (str): Namespace name
+            
+        Returns:
+            chromadb.Collection: Collection for the namespace
+        """
+        collection = self._namespaces.get(namespace)
+        if collection is None:
+            collection = self._namespaces[namespace] = self.client.get_or_create_collection(
+                name=f"{self.collection_name}-{namespace}"
+            )
+        return collection
     
     def add(self, docs: List[Document]) -> None:
         """Add documents to the vector store.
@@ -36,13 +70,42 @@ class ChromaVectorStore(BaseVectorStore):
         Args:
             docs (List[Document]): List of documents to add
         """
-        # Extract content and metadata
-        contents = [doc.content for doc in docs]
-        metadatas = [doc.metadata for doc in docs]
-        ids = [f"doc_{i}" for i in range(len(docs))]
+        self._add_to_collection(self.collection, docs)
+    
+    def add_to_namespace(self, namespace: str, docs: List[Document]) -> None:
+        """Add documents to a namespace collection.
+        
+        Args:
+            namespace (str): Namespace name
+            docs (List[Document]): List of documents to add
+        """
+        self._add_to_collection(self._namespace_collection(namespace), docs)
+    
+    def _add_to_collection(self, collection, docs: List[Document]) -> None:
+        """Add documents to a Chroma collection.
+        
+        Args:
+            collection (chromadb.Collection): Target collection
+            docs (List[Document]): List of documents to add
+        """
+        if not docs:
+            return
+        
+        with self._id_lock:
+            start = self._next_ids.get(collection.name)
+            if start is None:
+                start = collection.count()
+            self._next_ids[collection.name] = start + len(docs)
+        
+        # Extract content, metadata and IDs in one pass
+        contents, metadatas, ids = [], [], []
+        for i, doc in enumerate(docs, start):
+            contents.append(doc.content)
+            metadatas.append(doc.metadata)
+            ids.append(f"doc_{i}")
         
         # Add to collection
-        self.collection.add(
+        collection.add(
             documents=contents,
             metadatas=metadatas,
             ids=ids
@@ -58,20 +121,65 @@ class ChromaVectorStore(BaseVectorStore):
         Returns:
             List[Dict[str, Any]]: List of similar documents with scores
         """
+        return self.query_batch([text], top_k)[0]
+    
+    def query_namespace(self, text: str, top_k: int = 5, namespace: str = None) -> List[Dict[str, Any]]:
+        """Query only the documents of one namespace.
+        
+        Args:
+            text (str): Query text
+            top_k (int): Number of top results to return
+            namespace (str): Namespace name
+            
+        Returns:
+            List[Dict[str, Any]]: List of similar documents with scores
+        """
+        return self._query_collection(self._namespace_collection(namespace), [text], top_k)[0]
+    
+    def query_batch(self, texts: List[str], top_k: int = 5) -> List[List[Dict[str, Any]]]:
+        """Query the vector store with several texts in one collection query.
+        
+        Args:
+            texts (List[str]): Query texts
+            top_k (int): Number of top results to return per query
+            
+        Returns:
+            List[List[Dict[str, Any]]]: Results for each query, in input order
+        """
+        return self._query_collection(self.collection, texts, top_k)
+    
+    @staticmethod
+    def _query_collection(collection, texts: List[str], top_k: int) -> List[List[Dict[str, Any]]]:
+        """Query a Chroma collection with several texts.
+        
+        Args:
+            collection (chromadb.Collection): Collection to query
+            texts (List[str]): Query texts
+            top_k (int): Number of top results to return per query
+            
+        Returns:
+            List[List[Dict[str, Any]]]: Results for each query, in input order
+        """
+        if not texts:
+            return []
+        
         # Query the collection
-        results = self.collection.query(
-            query_texts=[text],
+        results = collection.query(
+            query_texts=texts,
             n_results=top_k
         )
         
-        # Format results
-        formatted_results = []
-        for i in range(len(results['ids'][0])):
-            result = {
-                "content": results['documents'][0][i],
-                "metadata": results['metadatas'][0][i],
-                "score": results['distances'][0][i] if 'distances' in results else None
-            }
-            formatted_results.append(result)
+        # Format results, zipping each query's pre-bound columns
+        documents = results['documents']
+        metadatas = results['metadatas']
+        distances = results['distances'] if 'distances' in results else None
+        
+        batch_results = []
+        for q in range(len(texts)):
+            scores = distances[q] if distances is not None else [None] * len(documents[q])
+            batch_results.append([
+                {"content": content, "metadata": metadata, "score": score}
+                for content, metadata, score in zip(documents[q], metadatas[q], scores)
+            ])
             
-        return formatted_results
+        return batch_results
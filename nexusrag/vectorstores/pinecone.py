@@ -1,22 +1,33 @@
 from typing import List, Dict, Any
 import os
+import uuid
 from .base import BaseVectorStore
 from ..parsers.base import Document
+from ..embedders.base import BaseEmbedder
+import numpy as np
+
+try:
+    import pinecone
+except ImportError:
+    pinecone = None
 
 
 class PineconeVectorStore(BaseVectorStore):
     """Vector store implementation using Pinecone."""
     
-    def __init__(self, index_name: str = "nexusrag", dimension: int = 384):
+    supports_namespaces = True
+    
+    def __init__(self, index_name: str = "nexusrag", dimension: int = 384,
+                 embedder: BaseEmbedder = None):
         """Initialize the Pinecone vector store.
         
         Args:
             index_name (str): Name of the Pinecone index
             dimension (int): Dimension of the embeddings
+            embedder (BaseEmbedder): Embedder for documents and queries;
+                placeholder zero vectors are used when None
         """
-        try:
-            import pinecone
-        except ImportError:
+        if pinecone is None:
             raise ImportError(
                 "To use PineconeVectorStore, you need to install the pinecone-client library. "
                 "Please run: pip install pinecone-client"
@@ -41,6 +52,8 @@ class PineconeVectorStore(BaseVectorStore):
         
         self.index = pinecone.Index(index_name)
         self.index_name = index_name
+        self.dimension = dimension
+        self.embedder = embedder
     
     def add(self, docs: List[Document]) -> None:
         """Add documents to the Pinecone vector store.
@@ -48,29 +61,37 @@ class PineconeVectorStore(BaseVectorStore):
         Args:
             docs (List[Document]): List of documents to add
         """
-        # In a real implementation, you would first embed the documents
-        # For this example, we'll assume embeddings are already available
-        # or generate them on the fly
-        
-        vectors = []
-        for i, doc in enumerate(docs):
-            # Generate a unique ID for each document
-            doc_id = f"{self.index_name}_{i}"
-            
-            # In a real implementation, you would embed the document content
-            # For now, we'll create a placeholder
-            vector = [0.0] * 384  # Placeholder vector
-            
-            # Create metadata
-            metadata = {
-                "content": doc.content,
-                **doc.metadata
-            }
-            
-            vectors.append((doc_id, vector, metadata))
+        self.add_to_namespace(None, docs)
+    
+    def add_to_namespace(self, namespace: str, docs: List[Document]) -> None:
+        """Add documents to a Pinecone namespace.
+        
+        Args:
+            namespace (str): Namespace name (None for the default namespace)
+            docs (List[Document]): List of documents to add
+        """
+        # Embed all documents in one call into a single matrix
+        embeddings = self._embed([doc.content for doc in docs])
+        
+        vectors = [
+            (
+                # Random IDs, so documents added by other instances or earlier
+                # runs against the same index are never overwritten
+                str(uuid.uuid4()),
+                embeddings[i].tolist(),
+                {
+                    "content": doc.content,
+                    **doc.metadata
+                }
+            )
+            for i, doc in enumerate(docs)
+        ]
         
         # Upsert vectors to Pinecone
-        self.index.upsert(vectors)
+        if namespace is None:
+            self.index.upsert(vectors)
+        else:
+            self.index.upsert(vectors, namespace=namespace)
     
     def query(self, text: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """Query the Pinecone vector store for similar documents.
@@ -82,25 +103,59 @@ class PineconeVectorStore(BaseVectorStore):
         Returns:
             List[Dict[str, Any]]: List of similar documents with scores
         """
-        # In a real implementation, you would first embed the query text
-        # For this example, we'll create a placeholder query vector
-        query_vector = [0.0] * 384  # Placeholder vector
+        return self.query_namespace(text, top_k)
+    
+    def query_namespace(self, text: str, top_k: int = 5, namespace: str = None) -> List[Dict[str, Any]]:
+        """Query only the documents of one Pinecone namespace.
+        
+        Args:
+            text (str): Query text
+            top_k (int): Number of top results to return
+            namespace (str): Namespace name (None for the default namespace)
+            
+        Returns:
+            List[Dict[str, Any]]: List of similar documents with scores
+        """
+        # Embed the query text (a placeholder vector without an embedder)
+        query_vector = self._embed([text])[0].tolist()
         
         # Query Pinecone
+        namespace_kwargs = {} if namespace is None else {"namespace": namespace}
         response = self.index.query(
             vector=query_vector,
             top_k=top_k,
-            include_metadata=True
+            include_metadata=True,
+            **namespace_kwargs
         )
         
         # Format results
-        results = []
-        for match in response.matches:
-            result = {
-                "content": match.metadata.get("content", ""),
-                "metadata": {k: v for k, v in match.metadata.items() if k != "content"},
-                "score": match.score
-            }
-            results.append(result)
+        return [self._format_match(match.metadata, match.score) for match in response.matches]
+    
+    @staticmethod
+    def _format_match(payload: Dict[str, Any], score: float) -> Dict[str, Any]:
+        """Split a stored payload into content and metadata.
+        
+        Args:
+            payload (Dict[str, Any]): Stored metadata, including "content"
+            score (float): Match score
             
-        return results
+        Returns:
+            Dict[str, Any]: Search result
+        """
+        metadata = dict(payload)
+        content = metadata.pop("content", "")
+        return {"content": content, "metadata": metadata, "score": score}
+    
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts as rows of a float32 matrix.
+        
+        Args:
+            texts (List[str]): Texts to embed
+            
+        Returns:
+            np.ndarray: Matrix of shape (len(texts), dimension)
+        """
+        if self.embedder is None:
+            # Placeholder vectors until an embedder is configured
+            return np.zeros((len(texts), self.dimension), dtype=np.float32)
+        return np.asarray(self.embedder.embed(texts), dtype=np.float32)
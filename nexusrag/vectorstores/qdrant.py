@@ -1,24 +1,34 @@
 from typing import List, Dict, Any
 from .base import BaseVectorStore
 from ..parsers.base import Document
+from ..embedders.base import BaseEmbedder
 import os
+import uuid
+import numpy as np
+
+try:
+    from qdrant_client import QdrantClient
+    from qdrant_client.models import Distance, VectorParams
+except ImportError:
+    QdrantClient = None
 
 
 class QdrantVectorStore(BaseVectorStore):
     """Vector store implementation using Qdrant with hybrid search support."""
     
-    def __init__(self, collection_name: str = "nexusrag", host: str = None, port: int = 6333):
+    def __init__(self, collection_name: str = "nexusrag", host: str = None, port: int = 6333,
+                 embedder: BaseEmbedder = None, vector_size: int = 768):
         """Initialize the Qdrant vector store.
         
         Args:
             collection_name (str): Name of the Qdrant collection
             host (str): Qdrant host URL
             port (int): Qdrant port
+            embedder (BaseEmbedder): Embedder for documents and queries; random
+                placeholder vectors are used when None
+            vector_size (int): Dimension of the vectors in the collection
         """
-        try:
-            from qdrant_client import QdrantClient
-            from qdrant_client.models import Distance, VectorParams, PointStruct
-        except ImportError:
+        if QdrantClient is None:
             raise ImportError(
                 "To use QdrantVectorStore, you need to install the qdrant-client library. "
                 "Please run: pip install qdrant-client"
@@ -30,21 +40,14 @@ class QdrantVectorStore(BaseVectorStore):
         # Initialize Qdrant client
         self.client = QdrantClient(host=host, port=port)
         self.collection_name = collection_name
-        self.point_id = 0
+        self.embedder = embedder
+        self.vector_size = vector_size
         
         # Create collection if it doesn't exist
         self._create_collection_if_not_exists()
     
     def _create_collection_if_not_exists(self):
         """Create the Qdrant collection if it doesn't exist."""
-        try:
-            from qdrant_client.models import Distance, VectorParams
-        except ImportError:
-            raise ImportError(
-                "To use QdrantVectorStore, you need to install the qdrant-client library. "
-                "Please run: pip install qdrant-client"
-            )
-        
         # Check if collection exists
         try:
             self.client.get_collection(self.collection_name)
@@ -52,7 +55,7 @@ class QdrantVectorStore(BaseVectorStore):
             # Create collection
             self.client.create_collection(
                 collection_name=self.collection_name,
-                vectors_config=VectorParams(size=768, distance=Distance.COSINE)
+                vectors_config=VectorParams(size=self.vector_size, distance=Distance.COSINE)
             )
     
     def add(self, docs: List[Document]) -> None:
@@ -61,41 +64,40 @@ class QdrantVectorStore(BaseVectorStore):
         Args:
             docs (List[Document]): List of documents to add
         """
-        try:
-            from qdrant_client.models import PointStruct
-            import numpy as np
-        except ImportError:
-            raise ImportError(
-                "To use QdrantVectorStore, you need to install the qdrant-client library. "
-                "Please run: pip install qdrant-client"
-            )
+        if not docs:
+            return
         
-        # Add documents to Qdrant
-        points = []
-        for doc in docs:
-            # Generate a simple vector (in a real implementation, you would use an embedder)
-            # For demonstration, we'll create a random vector
-            vector = np.random.rand(768).tolist()
-            
-            # Create point
-            point = PointStruct(
-                id=self.point_id,
-                vector=vector,
-                payload={
-                    "content": doc.content,
-                    **doc.metadata
-                }
-            )
-            
-            points.append(point)
-            self.point_id += 1
+        # Embed all documents in one call into a single float32 matrix
+        vectors = self._embed([doc.content for doc in docs])
         
-        # Upload points
-        self.client.upsert(
+        # Upload the matrix as is (the client serializes ndarray rows without
+        # converting them to lists of Python floats), without waiting for the
+        # points to be indexed
+        self.client.upload_collection(
             collection_name=self.collection_name,
-            points=points
+            vectors=vectors,
+            payload=[{"content": doc.content, **doc.metadata} for doc in docs],
+            # Random UUIDs: points from earlier processes or concurrent add
+            # calls are never overwritten, and no shared counter is needed
+            ids=[str(uuid.uuid4()) for _ in docs],
+            wait=False
         )
     
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts as rows of a float32 matrix.
+        
+        Args:
+            texts (List[str]): Texts to embed
+            
+        Returns:
+            np.ndarray: Matrix of shape (len(texts), vector_size)
+        """
+        if self.embedder is None:
+            # Generate simple vectors (in a real implementation, you would use
+            # an embedder); for demonstration, random ones
+            return np.random.rand(len(texts), self.vector_size).astype(np.float32)
+        return np.asarray(self.embedder.embed(texts), dtype=np.float32)
+    
     def query(self, text: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """Query the Qdrant vector store for similar documents.
         
@@ -106,17 +108,8 @@ class QdrantVectorStore(BaseVectorStore):
         Returns:
             List[Dict[str, Any]]: List of similar documents with scores
         """
-        try:
-            import numpy as np
-        except ImportError:
-            raise ImportError(
-                "To use QdrantVectorStore, you need to install numpy. "
-                "Please run: pip install numpy"
-            )
-        
-        # Generate a simple vector for the query (in a real implementation, you would use an embedder)
-        # For demonstration, we'll create a random vector
-        query_vector = np.random.rand(768).tolist()
+        # Embed the query (a random vector without an embedder)
+        query_vector = self._embed([text])[0]
         
         # Search in Qdrant
         search_result = self.client.search(
@@ -126,16 +119,7 @@ class QdrantVectorStore(BaseVectorStore):
         )
         
         # Format results
-        results = []
-        for result in search_result:
-            doc_result = {
-                "content": result.payload.get("content", ""),
-                "metadata": {k: v for k, v in result.payload.items() if k != "content"},
-                "score": result.score
-            }
-            results.append(doc_result)
-        
-        return results
+        return [self._format_point(point) for point in search_result]
     
     def hybrid_search(self, query_text: str, query_vector: List[float] = None, 
                      top_k: int = 5) -> List[Dict[str, Any]]:
@@ -149,18 +133,9 @@ class QdrantVectorStore(BaseVectorStore):
         Returns:
             List[Dict[str, Any]]: List of search results with scores
         """
-        try:
-            from qdrant_client.models import SearchRequest
-            import numpy as np
-        except ImportError:
-            raise ImportError(
-                "To use QdrantVectorStore hybrid search, you need to install the qdrant-client library. "
-                "Please run: pip install qdrant-client"
-            )
-        
-        # If no vector provided, generate a random one for demonstration
+        # If no vector provided, embed the query text
         if query_vector is None:
-            query_vector = np.random.rand(768).tolist()
+            query_vector = self._embed([query_text])[0]
         
         # Perform hybrid search using Qdrant's recommendation search
         search_result = self.client.search(
@@ -173,13 +148,18 @@ class QdrantVectorStore(BaseVectorStore):
         )
         
         # Format results
-        results = []
-        for result in search_result:
-            doc_result = {
-                "content": result.payload.get("content", ""),
-                "metadata": {k: v for k, v in result.payload.items() if k != "content"},
-                "score": result.score
-            }
-            results.append(doc_result)
+        return [self._format_point(point) for point in search_result]
+    
+    @staticmethod
+    def _format_point(point: Any) -> Dict[str, Any]:
+        """Split a scored point's payload into content and metadata.
         
-        return results
+        Args:
+            point (Any): Scored point returned by a search
+            
+        Returns:
+            Dict[str, Any]: Search result
+        """
+        metadata = dict(point.payload)
+        content = metadata.pop("content", "")
+        return {"content": content, "metadata": metadata, "score": point.score}
@@ -30,6 +30,11 @@ class UniversalVectorStore(BaseVectorStore):
         else:
             raise ValueError(f"Unsupported provider: {provider}")
     
+    @property
+    def supports_namespaces(self) -> bool:
+        """Whether the wrapped vector store supports namespaces."""
+        return self.vector_store.supports_namespaces
+    
     def add(self, docs: List[Document]) -> None:
         """Add documents to the vector store.
         
@@ -49,3 +54,37 @@ class UniversalVectorStore(BaseVectorStore):
             List[Dict[str, Any]]: List of similar documents with scores
         """
         return self.vector_store.query(text, top_k)
+    
+    def query_batch(self, texts: List[str], top_k: int = 5) -> List[List[Dict[str, Any]]]:
+        """Query the vector store with several texts at once.
+        
+        Args:
+            texts (List[str]): Query texts
+            top_k (int): Number of top results to return per query
+            
+        Returns:
+            List[List[Dict[str, Any]]]: Results for each query, in input order
+        """
+        return self.vector_store.query_batch(texts, top_k)
+    
+    def add_to_namespace(self, namespace: str, docs: List[Document]) -> None:
+        """Add documents to a namespace that can be queried on its own.
+        
+        Args:
+            namespace (str): Namespace name
+            docs (List[Document]): List of documents to add
+        """
+        self.vector_store.add_to_namespace(namespace, docs)
+    
+    def query_namespace(self, text: str, top_k: int = 5, namespace: str = None) -> List[Dict[str, Any]]:
+        """Query only the documents of one namespace.
+        
+        Args:
+            text (str): Query text
+            top_k (int): Number of top results to return
+            namespace (str): Namespace name
+            
+        Returns:
+            List[Dict[str, Any]]: List of similar documents with scores
+        """
+        return self.vector_store.query_namespace(text, top_k, namespace)
@@ -1,22 +1,165 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from urllib.parse import urlparse
+import asyncio
+import atexit
+import functools
+import hashlib
+import json
 import os
+import threading
+import uuid
 from .base import BaseVectorStore
 from ..parsers.base import Document
+from ..embedders.base import BaseEmbedder
+import numpy as np
+
+try:
+    import weaviate
+    from weaviate.classes.config import ConsistencyLevel, Property, DataType
+    from weaviate.classes.data import DataObject
+    from weaviate.classes.query import MetadataQuery
+    from weaviate.config import AdditionalConfig, ConnectionConfig
+except ImportError:
+    weaviate = None
+
+
+# Default number of pooled HTTP connections per client; the client's own
+# default is small enough that concurrent requests queue for a socket
+DEFAULT_POOL_SIZE = 100
+
+# Objects per batch request in bulk_add
+BULK_BATCH_SIZE = 1000
+
+# Number of query embeddings kept per store when an embedder is used
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
+# Metadata key suffixes left out of object UUIDs: timestamps that differ
+# between ingests of an unchanged file (extraction_timestamp, accessed_time)
+VOLATILE_METADATA_SUFFIXES = ("_time", "_timestamp")
+
+# Clients shared by all stores connecting to the same endpoint, keyed by
+# (HTTP URL, gRPC port, pool size), so each process connects and checks the
+# schema once per endpoint; they are closed at interpreter exit
+_CLIENT_CACHE: Dict[Tuple[str, int, int], Any] = {}
+_CLIENT_LOCK = threading.Lock()
+
+# (client key, class name) pairs whose collection is known to exist
+_SCHEMA_READY = set()
+
+
+def _object_uuid(doc: Document) -> uuid.UUID:
+    """Derive a deterministic object UUID from a document.
+
+    Re-adding the same document (same content and stable metadata) overwrites
+    its object instead of creating a duplicate. Metadata keys ending in one of
+    VOLATILE_METADATA_SUFFIXES (extraction_timestamp, accessed_time, ...)
+    change on every ingest of an unchanged file, so they are not hashed.
+
+    Args:
+        doc (Document): Document to identify
+
+    Returns:
+        uuid.UUID: 128-bit BLAKE2b digest of the content and stable metadata
+    """
+    stable_metadata = {
+        key: value for key, value in doc.metadata.items()
+        if not key.endswith(VOLATILE_METADATA_SUFFIXES)
+    }
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(doc.content.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(json.dumps(stable_metadata, sort_keys=True, default=str).encode("utf-8"))
+    return uuid.UUID(bytes=digest.digest())
+
+
+def _connection_kwargs(host: str, grpc_port: int, pool_size: int) -> Dict[str, Any]:
+    """Build the connect_to_custom arguments for an endpoint.
+
+    Args:
+        host (str): Weaviate HTTP URL
+        grpc_port (int): Weaviate gRPC port, on the same host
+        pool_size (int): Number of pooled HTTP connections
+
+    Returns:
+        Dict[str, Any]: Keyword arguments shared by the sync and async clients
+    """
+    url = urlparse(host)
+    secure = url.scheme == "https"
+    return dict(
+        http_host=url.hostname,
+        http_port=url.port or (443 if secure else 80),
+        http_secure=secure,
+        grpc_host=url.hostname,
+        grpc_port=grpc_port,
+        grpc_secure=secure,
+        additional_config=AdditionalConfig(connection=ConnectionConfig(
+            session_pool_connections=pool_size,
+            session_pool_maxsize=pool_size
+        ))
+    )
+
+
+def _get_client(host: str, grpc_port: int, pool_size: int = DEFAULT_POOL_SIZE):
+    """Return the shared client for an endpoint, connecting on first use.
+
+    Args:
+        host (str): Weaviate HTTP URL
+        grpc_port (int): Weaviate gRPC port, on the same host
+        pool_size (int): Number of pooled HTTP connections
+
+    Returns:
+        weaviate.WeaviateClient: Connected client
+    """
+    key = (host, grpc_port, pool_size)
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = _CLIENT_CACHE[key] = weaviate.connect_to_custom(
+                **_connection_kwargs(host, grpc_port, pool_size)
+            )
+        return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close all shared clients."""
+    with _CLIENT_LOCK:
+        for client in _CLIENT_CACHE.values():
+            client.close()
+        _CLIENT_CACHE.clear()
+        _SCHEMA_READY.clear()
 
 
 class WeaviateVectorStore(BaseVectorStore):
-    """Vector store implementation using Weaviate."""
+    """Vector store implementation using Weaviate.
+
+    Uses the v4 client: objects are inserted and queried over gRPC, and the
+    schema is managed over HTTP. Stores connecting to the same endpoint share
+    one client, which stays open until the interpreter exits.
+    """
 
-    def __init__(self, class_name: str = "NexusRAGDocument", host: str = None):
+    def __init__(self, class_name: str = "NexusRAGDocument", host: str = None,
+                 grpc_port: int = 50051, batch_size: int = 100, num_workers: int = 2,
+                 dynamic: bool = True, pool_size: int = DEFAULT_POOL_SIZE,
+                 embedder: BaseEmbedder = None):
         """Initialize the Weaviate vector store.
 
         Args:
-            class_name (str): Name of the Weaviate class
-            host (str): Weaviate host URL
+            class_name (str): Name of the Weaviate collection
+            host (str): Weaviate HTTP URL, e.g. "http://localhost:8080"
+            grpc_port (int): Weaviate gRPC port, on the same host
+            batch_size (int): Number of objects sent per batch request (ignored
+                when dynamic is True)
+            num_workers (int): Number of batch requests sent concurrently
+                (ignored when dynamic is True)
+            dynamic (bool): Let the client adapt the batch size and concurrency
+                to the server's ingestion rate
+            pool_size (int): Number of pooled HTTP connections, so concurrent
+                requests do not wait for a free socket
+            embedder (BaseEmbedder): Embedder for documents and queries; when
+                None, Weaviate's configured vectorizer embeds them server-side
         """
-        try:
-            import weaviate
-        except ImportError:
+        if weaviate is None:
             raise ImportError(
                 "To use WeaviateVectorStore, you need to install the weaviate-client library. "
                 "Please run: pip install weaviate-client"
@@ -24,39 +167,91 @@ class WeaviateVectorStore(BaseVectorStore):
 
         # Get host from environment variable or use default
         host = host or os.getenv("WEAVIATE_HOST", "http://localhost:8080")
+        if "://" not in host:
+            host = f"http://{host}"
 
-        # Initialize Weaviate client
-        self.client = weaviate.Client(host)
+        # Use the process-wide client for this endpoint
+        self.client = _get_client(host, grpc_port, pool_size)
+        self._client_key = (host, grpc_port, pool_size)
         self.class_name = class_name
+        self.batch_size = batch_size
+        self.num_workers = num_workers
+        self.dynamic = dynamic
+        self.embedder = embedder
+
+        # LRU of query text -> embedding, so repeated queries (common in chat
+        # and agent loops) are embedded once
+        self._embed_query = functools.lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(
+            self._embed_query_uncached
+        )
 
         # Create class if it doesn't exist
         self._create_class_if_not_exists()
+        self.collection = self.client.collections.get(class_name)
+
+        # Scalar property names selected by query_batch's GraphQL query;
+        # fetched on first use and reset by add, since auto-schema may add
+        # properties for new metadata keys
+        self._property_names = None
 
     def _create_class_if_not_exists(self):
-        """Create the Weaviate class if it doesn't exist."""
-        # Check if class exists
-        if not self.client.schema.exists(self.class_name):
-            # Define class schema
-            class_schema = {
-                "class": self.class_name,
-                "properties": [
-                    {
-                        "name": "content",
-                        "dataType": ["text"],
-                    },
-                    {
-                        "name": "source",
-                        "dataType": ["string"],
-                    },
-                    {
-                        "name": "contentType",
-                        "dataType": ["string"],
-                    }
+        """Create the Weaviate collection if it doesn't exist."""
+        # Skip the schema round trip when another store already checked it
+        schema_key = (self._client_key, self.class_name)
+        if schema_key in _SCHEMA_READY:
+            return
+
+        if not self.client.collections.exists(self.class_name):
+            self.client.collections.create(
+                name=self.class_name,
+                properties=[
+                    Property(name="content", data_type=DataType.TEXT),
+                    Property(name="source", data_type=DataType.TEXT),
+                    Property(name="contentType", data_type=DataType.TEXT),
                 ]
-            }
+            )
+        _SCHEMA_READY.add(schema_key)
+
+    def _batch(self, collection):
+        """Return a batch context for a collection, configured from the constructor.
+
+        Args:
+            collection: Collection (or consistency-level view of it) to insert into
+
+        Returns:
+            Batch context manager
+        """
+        if self.dynamic:
+            return collection.batch.dynamic()
+        return collection.batch.fixed_size(
+            batch_size=self.batch_size,
+            concurrent_requests=self.num_workers
+        )
+
+    def _embed_documents(self, docs: List[Document]) -> List[Any]:
+        """Embed documents in one call, or defer to the server-side vectorizer.
 
-            # Create class
-            self.client.schema.create_class(class_schema)
+        Args:
+            docs (List[Document]): Documents to embed
+
+        Returns:
+            List[Any]: One vector (list of floats) per document, or Nones
+                without an embedder
+        """
+        if self.embedder is None:
+            return [None] * len(docs)
+        return np.asarray(self.embedder.embed([doc.content for doc in docs]), dtype=np.float32).tolist()
+
+    def _embed_query_uncached(self, text: str) -> List[float]:
+        """Embed a query with the store's embedder.
+
+        Args:
+            text (str): Query text
+
+        Returns:
+            List[float]: Query vector
+        """
+        return np.asarray(self.embedder.embed([text])[0], dtype=np.float32).tolist()
 
     def add(self, docs: List[Document]) -> None:
         """Add documents to the Weaviate vector store.
@@ -64,16 +259,104 @@ class WeaviateVectorStore(BaseVectorStore):
         Args:
             docs (List[Document]): List of documents to add
         """
-        # Add documents to Weaviate
-        for doc in docs:
-            data_object = {
-                "content": doc.content,
-                **doc.metadata
-            }
-
-            self.client.data_object.create(
-                data_object=data_object,
-                class_name=self.class_name
+        self._insert_batched(self.collection, self._batch(self.collection), docs)
+
+    def bulk_add(self, docs: List[Document], batch_size: int = BULK_BATCH_SIZE,
+                 concurrency: int = None) -> None:
+        """Add a large number of documents with relaxed write consistency.
+
+        Writes are acknowledged by a single replica (consistency level ONE)
+        instead of a quorum, and sent in large fixed-size batches from one
+        concurrent request per CPU. Replicas catch up asynchronously, so
+        reads at a higher consistency level may briefly miss new objects.
+
+        Args:
+            docs (List[Document]): List of documents to add
+            batch_size (int): Number of objects per batch request
+            concurrency (int): Number of concurrent batch requests (CPU count when None)
+        """
+        collection = self.collection.with_consistency_level(ConsistencyLevel.ONE)
+        batch = collection.batch.fixed_size(
+            batch_size=batch_size,
+            concurrent_requests=concurrency or os.cpu_count() or 1
+        )
+        self._insert_batched(collection, batch, docs)
+
+    def _insert_batched(self, collection, batch_context, docs: List[Document]) -> None:
+        """Insert documents through a batch context.
+
+        Args:
+            collection: Collection the batch context belongs to
+            batch_context: Batch context manager of the collection
+            docs (List[Document]): List of documents to add
+        """
+        vectors = self._embed_documents(docs)
+
+        # Add documents to Weaviate in batches; leaving the context flushes
+        # the last, partial batch
+        with batch_context as batch:
+            for doc, vector in zip(docs, vectors):
+                batch.add_object(properties={
+                    "content": doc.content,
+                    **doc.metadata
+                }, uuid=_object_uuid(doc), vector=vector)
+
+        self._property_names = None
+
+        # Batch requests do not raise for rejected objects, so report them here
+        failed = collection.batch.failed_objects
+        if failed:
+            raise RuntimeError(
+                f"Failed to add {len(failed)} object(s) to Weaviate: {failed[0].message}"
+            )
+
+    async def aadd(self, docs: List[Document], batch_size: int = 100,
+                   concurrency: int = 8) -> None:
+        """Add documents with concurrent insert requests from an async client.
+
+        The documents are split into sub-batches of batch_size, each sent as
+        one insert_many request; at most concurrency requests are in flight.
+
+        Args:
+            docs (List[Document]): List of documents to add
+            batch_size (int): Number of objects per insert request
+            concurrency (int): Maximum number of concurrent insert requests
+        """
+        if not docs:
+            return
+
+        objects = [
+            DataObject(
+                properties={"content": doc.content, **doc.metadata},
+                uuid=_object_uuid(doc),
+                vector=vector
+            )
+            for doc, vector in zip(docs, self._embed_documents(docs))
+        ]
+
+        client = weaviate.use_async_with_custom(**_connection_kwargs(*self._client_key))
+        await client.connect()
+        try:
+            collection = client.collections.get(self.class_name)
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def insert(chunk: List[Any]):
+                async with semaphore:
+                    return await collection.data.insert_many(chunk)
+
+            results = await asyncio.gather(*(
+                insert(objects[start:start + batch_size])
+                for start in range(0, len(objects), batch_size)
+            ))
+        finally:
+            await client.close()
+        self._property_names = None
+
+        # Insert requests do not raise for rejected objects, so report them here
+        errors = [error for result in results for error in result.errors.values()]
+        if errors:
+            raise RuntimeError(
+                f"Failed to add {len(errors)} object(s) to Weaviate: {errors[0].message}"
             )
 
     def query(self, text: str, top_k: int = 5) -> List[Dict[str, Any]]:
@@ -86,36 +369,104 @@ class WeaviateVectorStore(BaseVectorStore):
         Returns:
             List[Dict[str, Any]]: List of similar documents with scores
         """
-        # Query Weaviate
-        results = (
-            self.client.query
-            .get(self.class_name, ["content", "source", "contentType"])
-            .with_near_text({"concepts": [text]})
-            .with_limit(top_k)
-            .do()
+        # Query Weaviate, with a (cached) local query embedding when the
+        # store has an embedder, else with the server-side vectorizer
+        if self.embedder is not None:
+            response = self.collection.query.near_vector(
+                near_vector=self._embed_query(text),
+                limit=top_k,
+                return_metadata=MetadataQuery(distance=True)
+            )
+        else:
+            response = self.collection.query.near_text(
+                query=text,
+                limit=top_k,
+                return_metadata=MetadataQuery(distance=True)
+            )
+
+        # Format results
+        return [self._format_object(obj) for obj in response.objects]
+
+    def query_batch(self, texts: List[str], top_k: int = 5) -> List[List[Dict[str, Any]]]:
+        """Query the vector store with several texts in one GraphQL request.
+
+        Each text becomes an aliased nearText (or, with an embedder, nearVector)
+        selection (q0, q1, ...) of the same Get query, so the batch costs a
+        single round trip.
+
+        Args:
+            texts (List[str]): Query texts
+            top_k (int): Number of top results to return per query
+
+        Returns:
+            List[List[Dict[str, Any]]]: Results for each query, in input order
+        """
+        if len(texts) <= 1:
+            return [self.query(text, top_k) for text in texts]
+
+        if self._property_names is None:
+            self._property_names = [
+                prop.name for prop in self.collection.config.get().properties
+                if prop.data_type not in (DataType.OBJECT, DataType.OBJECT_ARRAY)
+            ]
+        fields = " ".join(self._property_names) + " _additional { id distance }"
+
+        # json.dumps yields valid GraphQL string and list literals
+        if self.embedder is not None:
+            searches = [f"nearVector: {{vector: {json.dumps(self._embed_query(text))}}}" for text in texts]
+        else:
+            searches = [f"nearText: {{concepts: [{json.dumps(text)}]}}" for text in texts]
+        selections = " ".join(
+            f"q{i}: {self.class_name}({search}, limit: {int(top_k)}) {{ {fields} }}"
+            for i, search in enumerate(searches)
         )
+        response = self.client.graphql_raw_query(f"{{ Get {{ {selections} }} }}")
+        if response.errors:
+            raise RuntimeError(f"Weaviate batch query failed: {response.errors}")
 
-        # Extract documents from results
-        if (
-            "data" in results and
-            "Get" in results["data"] and
-            self.class_name in results["data"]["Get"]
-        ):
-            documents = results["data"]["Get"][self.class_name]
-
-            # Format results
-            formatted_results = []
-            for doc in documents:
-                result = {
-                    "content": doc.get("content", ""),
-                    "metadata": {
-                        "source": doc.get("source", ""),
-                        "content_type": doc.get("contentType", "")
-                    },
-                    "score": 1.0  # Weaviate doesn't return scores in this query
-                }
-                formatted_results.append(result)
-
-            return formatted_results
-
-        return []
+        return [
+            [self._format_graphql_object(obj) for obj in response.get.get(f"q{i}") or []]
+            for i in range(len(texts))
+        ]
+
+    @staticmethod
+    def _format_graphql_object(obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Split a GraphQL Get result object into content and metadata.
+
+        Args:
+            obj (Dict[str, Any]): Object of a Get query, with an _additional block
+
+        Returns:
+            Dict[str, Any]: Search result, formatted like _format_object's
+        """
+        metadata = dict(obj)
+        additional = metadata.pop("_additional", None) or {}
+        content = metadata.pop("content", "")
+        distance = additional.get("distance")
+        return {
+            "id": additional.get("id"),
+            "content": content,
+            "metadata": metadata,
+            "score": 1.0 - distance if distance is not None else None
+        }
+
+    @staticmethod
+    def _format_object(obj: Any) -> Dict[str, Any]:
+        """Split a returned object's properties into content and metadata.
+
+        Args:
+            obj (Any): Object returned by a query
+
+        Returns:
+            Dict[str, Any]: Search result with the object's UUID as "id",
+                scored by cosine similarity (1 - cosine distance)
+        """
+        metadata = dict(obj.properties)
+        content = metadata.pop("content", "")
+        distance = obj.metadata.distance
+        return {
+            "id": str(obj.uuid),
+            "content": content,
+            "metadata": metadata,
+            "score": 1.0 - distance if distance is not None else None
+        }
@@ -0,0 +1,62 @@
+"""
+Shared content of the test PDFs created by the NexusRAG scripts.
+"""
+
+import copy
+import functools
+
+
+# Sentences following each document's introductory sentence
+CONTENT = [
+    "NexusRAG is an open-source framework for building autonomous AI agents that reason over complex, multimodal data.",
+    "It combines high-fidelity document parsing with a fully modular architecture.",
+    "The framework enables developers to create powerful, data-aware applications.",
+    "Key features include multimodal parsing, modular design, and agent-ready capabilities.",
+    "The capital of France is Paris.",
+    "The largest planet in our solar system is Jupiter.",
+    "Water boils at 100 degrees Celsius at sea level.",
+    "The Python programming language was created by Guido van Rossum.",
+    "Machine learning is a subset of artificial intelligence."
+]
+
+
+@functools.lru_cache(maxsize=4)
+def _paragraphs(title, intro):
+    """Parse the title and content paragraphs of a document, once per process."""
+    from reportlab.platypus import Paragraph
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    styles = getSampleStyleSheet()
+
+    # Space paragraphs with the style rather than a Spacer after each one,
+    # halving the number of flowables to lay out
+    body_style = ParagraphStyle("Body", parent=styles["Normal"], spaceAfter=12)
+
+    title_paragraph = Paragraph(title, styles["Title"])
+    paragraphs = tuple(Paragraph(text, body_style) for text in [intro] + CONTENT)
+    return title_paragraph, paragraphs
+
+
+def build_story(title, intro, repeat=1):
+    """Build the flowables of a test document.
+
+    Paragraphs are parsed once per process; each slot gets a shallow copy,
+    which shares the parsed text but not the layout state reportlab sets on
+    a flowable while placing it (a flowable instance placed twice can fail
+    with a LayoutError at a page break).
+
+    Args:
+        title (str): Document title
+        intro (str): First content sentence
+        repeat (int): Number of times the content is repeated
+
+    Returns:
+        list: Flowables to pass to SimpleDocTemplate.build
+    """
+    from reportlab.platypus import Spacer
+
+    title_paragraph, paragraphs = _paragraphs(title, intro)
+    story = [copy.copy(title_paragraph), Spacer(1, 12)]
+    for _ in range(repeat):
+        story.extend(copy.copy(paragraph) for paragraph in paragraphs)
+    return story
@@ -17,45 +17,22 @@ from nexusrag.embedders.sentence_transformers import SentenceTransformerEmbedder
 from nexusrag.vectorstores.chroma import ChromaVectorStore
 from nexusrag.llms.huggingface import HuggingFaceLLM
 from nexusrag.pipeline import RAGPipeline
+from _pdf_fixtures import build_story
 
 
 def create_simple_test_pdf(filename):
     """Create a simple test PDF with known content."""
     from reportlab.lib.pagesizes import letter
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import SimpleDocTemplate
     
     # Create document
     doc = SimpleDocTemplate(filename, pagesize=letter)
-    styles = getSampleStyleSheet()
-    story = []
-    
-    # Add title
-    title = Paragraph("Test Document for NexusRAG", styles["Title"])
-    story.append(title)
-    story.append(Spacer(1, 12))
-    
-    # Add some content
-    content = [
-        "This is a test document created for testing NexusRAG components.",
-        "NexusRAG is an open-source framework for building autonomous AI agents that reason over complex, multimodal data.",
-        "It combines high-fidelity document parsing with a fully modular architecture.",
-        "The framework enables developers to create powerful, data-aware applications.",
-        "Key features include multimodal parsing, modular design, and agent-ready capabilities.",
-        "The capital of France is Paris.",
-        "The largest planet in our solar system is Jupiter.",
-        "Water boils at 100 degrees Celsius at sea level.",
-        "The Python programming language was created by Guido van Rossum.",
-        "Machine learning is a subset of artificial intelligence."
-    ]
-    
-    for paragraph_text in content:
-        paragraph = Paragraph(paragraph_text, styles["Normal"])
-        story.append(paragraph)
-        story.append(Spacer(1, 12))
     
     # Build PDF
-    doc.build(story)
+    doc.build(build_story(
+        "Test Document for NexusRAG",
+        "This is a test document created for testing NexusRAG components."
+    ))
     return filename
 
 
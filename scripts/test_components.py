@@ -20,6 +20,11 @@ from nexusrag.pipeline import RAGPipeline
 from nexusrag.parsers.base import Document
 
 
+# Tests that load models (hundreds of MB) only run when this is set, so the
+# default run only checks imports and lightweight components
+FULL_TESTS = bool(os.getenv("NEXUSRAG_FULL_TESTS"))
+
+
 def test_parser():
     """Test the PDF parser component."""
     print("Testing PDF Parser...")
@@ -41,6 +46,10 @@ def test_embedder():
     """Test the Sentence Transformer embedder component."""
     print("\nTesting Sentence Transformer Embedder...")
     
+    if not FULL_TESTS:
+        print("- skipped (set NEXUSRAG_FULL_TESTS=1 to load models)")
+        return
+    
     try:
         embedder = SentenceTransformerEmbedder()
         print("✓ SentenceTransformerEmbedder initialized successfully")
@@ -88,6 +97,10 @@ def test_llm():
     """Test the Hugging Face LLM component."""
     print("\nTesting Hugging Face LLM...")
     
+    if not FULL_TESTS:
+        print("- skipped (set NEXUSRAG_FULL_TESTS=1 to load models)")
+        return
+    
     try:
         llm = HuggingFaceLLM()
         print("✓ HuggingFaceLLM initialized successfully")
@@ -105,6 +118,10 @@ def test_pipeline():
     """Test the RAG pipeline."""
     print("\nTesting RAG Pipeline...")
     
+    if not FULL_TESTS:
+        print("- skipped (set NEXUSRAG_FULL_TESTS=1 to load models)")
+        return
+    
     try:
         # Initialize components
         parser = PDFParser()
@@ -3,154 +3,222 @@
 Script to validate the NexusRAG project structure.
 """
 
+import compileall
+import functools
+import importlib
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Files, directories and modules the project must contain, relative to the
+# project root
+REQUIRED_FILES = (
+    "LICENSE",
+    "README.md",
+    "pyproject.toml",
+    "setup.cfg",
+    "requirements.txt",
+    "Dockerfile",
+    "docker-compose.yml",
+    ".gitignore",
+    ".env.example",
+    "Makefile",
+)
+
+REQUIRED_DIRS = (
+    "nexusrag",
+    "nexusrag/parsers",
+    "nexusrag/embedders",
+    "nexusrag/vectorstores",
+    "nexusrag/llms",
+    "tests",
+    "docs",
+    "docs/api",
+    "docs/api/parsers",
+    "docs/api/embedders",
+    "docs/api/vectorstores",
+    "docs/api/llms",
+    "scripts",
+    "examples",
+    ".github/workflows",
+)
+
+REQUIRED_MODULES = (
+    "nexusrag",
+    "nexusrag.pipeline",
+    "nexusrag.enhanced_pipeline",
+    "nexusrag.chunking",
+    "nexusrag.metadata_filter",
+    "nexusrag.multimodal",
+    "nexusrag.knowledge_graph",
+    "nexusrag.parsers.base",
+    "nexusrag.parsers.pdf",
+    "nexusrag.parsers.word",
+    "nexusrag.parsers.html",
+    "nexusrag.parsers.markdown",
+    "nexusrag.parsers.text",
+    "nexusrag.parsers.universal",
+    "nexusrag.parsers.advanced_pdf",
+    "nexusrag.processors.table_processor",
+    "nexusrag.agents.basic_agent",
+    "nexusrag.embedders.base",
+    "nexusrag.embedders.sentence_transformers",
+    "nexusrag.embedders.openai",
+    "nexusrag.embedders.cohere",
+    "nexusrag.embedders.gemini",
+    "nexusrag.embedders.universal",
+    "nexusrag.vectorstores.base",
+    "nexusrag.vectorstores.chroma",
+    "nexusrag.vectorstores.pinecone",
+    "nexusrag.vectorstores.weaviate",
+    "nexusrag.vectorstores.universal",
+    "nexusrag.llms.base",
+    "nexusrag.llms.huggingface",
+    "nexusrag.llms.openai",
+    "nexusrag.llms.anthropic",
+    "nexusrag.llms.gemini",
+    "nexusrag.llms.ollama",
+    "nexusrag.llms.universal",
+    "nexusrag.cli",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _dir_entries(dirpath):
+    """Map the names in a directory to their DirEntry objects, scanning it once."""
+    try:
+        with os.scandir(dirpath) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+
+def _entry(path):
+    """Return the cached DirEntry for a path, or None if it does not exist."""
+    parent, name = os.path.split(path)
+    return _dir_entries(parent).get(name)
+
 
 def check_file_exists(filepath):
-    """Check if a file exists and print status."""
-    if os.path.exists(filepath):
-        print(f"✓ {filepath} exists")
-        return True
+    """Check if a file exists and return (ok, status message)."""
+    # DirEntry.is_file/is_dir use the type scandir already read, so checking
+    # a path costs no stat call of its own
+    entry = _entry(filepath)
+    if entry is not None and entry.is_file():
+        return True, f"✓ {filepath} exists"
     else:
-        print(f"✗ {filepath} missing")
-        return False
+        return False, f"✗ {filepath} missing"
 
 
 def check_directory_exists(dirpath):
-    """Check if a directory exists and print status."""
-    if os.path.exists(dirpath) and os.path.isdir(dirpath):
-        print(f"✓ {dirpath} exists")
-        return True
+    """Check if a directory exists and return (ok, status message)."""
+    entry = _entry(dirpath)
+    if entry is not None and entry.is_dir():
+        return True, f"✓ {dirpath} exists"
     else:
-        print(f"✗ {dirpath} missing")
-        return False
+        return False, f"✗ {dirpath} missing"
 
 
-def check_import(module_name):
-    """Check if a module can be imported and print status."""
+def warmup():
+    """Byte-compile the nexusrag package so the import checks load cached .pyc files."""
+    # Imports would write the same bytecode themselves, one module at a time;
+    # compileall compiles stale modules in parallel worker processes
+    if sys.dont_write_bytecode:
+        return
+    compileall.compile_dir(os.path.join(project_root, "nexusrag"), quiet=1, workers=0)
+
+
+def try_import(module_name):
+    """Import a module and return the import error message, or None on success."""
     try:
-        __import__(module_name)
-        print(f"✓ {module_name} can be imported")
-        return True
+        # import_module returns modules already in sys.modules directly, and
+        # waits for one that another thread is still initializing (which a
+        # plain sys.modules membership test would report as imported)
+        importlib.import_module(module_name)
+        return None
     except ImportError as e:
-        print(f"✗ {module_name} cannot be imported: {e}")
-        return False
+        return str(e)
+
+
+def check_import(module_name, error):
+    """Return (ok, status message) for a module, given try_import's result."""
+    if error is None:
+        return True, f"✓ {module_name} can be imported"
+    else:
+        return False, f"✗ {module_name} cannot be imported: {error}"
 
 
 def main():
     """Validate the NexusRAG project structure."""
-    print("NexusRAG Project Structure Validation")
-    print("=" * 35)
+    # Report lines are collected and written with a single print at the end
+    lines = ["NexusRAG Project Structure Validation", "=" * 35]
     
     # Check required files
-    print("\nChecking required files...")
-    required_files = [
-        "LICENSE",
-        "README.md",
-        "pyproject.toml",
-        "setup.cfg",
-        "requirements.txt",
-        "Dockerfile",
-        "docker-compose.yml",
-        ".gitignore",
-        ".env.example",
-        "Makefile"
-    ]
+    lines.append("\nChecking required files...")
     
     file_checks = []
-    for file in required_files:
+    for file in REQUIRED_FILES:
         filepath = os.path.join(project_root, file)
-        file_checks.append(check_file_exists(filepath))
+        ok, message = check_file_exists(filepath)
+        file_checks.append(ok)
+        lines.append(message)
     
     # Check required directories
-    print("\nChecking required directories...")
-    required_dirs = [
-        "nexusrag",
-        "nexusrag/parsers",
-        "nexusrag/embedders",
-        "nexusrag/vectorstores",
-        "nexusrag/llms",
-        "tests",
-        "docs",
-        "docs/api",
-        "docs/api/parsers",
-        "docs/api/embedders",
-        "docs/api/vectorstores",
-        "docs/api/llms",
-        "scripts",
-        "examples",
-        ".github/workflows"
-    ]
+    lines.append("\nChecking required directories...")
     
     dir_checks = []
-    for dir in required_dirs:
+    for dir in REQUIRED_DIRS:
         dirpath = os.path.join(project_root, dir)
-        dir_checks.append(check_directory_exists(dirpath))
+        ok, message = check_directory_exists(dirpath)
+        dir_checks.append(ok)
+        lines.append(message)
     
     # Check required Python modules
-    print("\nChecking Python module imports...")
-    required_modules = [
-        "nexusrag",
-        "nexusrag.pipeline",
-        "nexusrag.enhanced_pipeline",
-        "nexusrag.chunking",
-        "nexusrag.metadata_filter",
-        "nexusrag.multimodal",
-        "nexusrag.knowledge_graph",
-        "nexusrag.parsers.base",
-        "nexusrag.parsers.pdf",
-        "nexusrag.parsers.word",
-        "nexusrag.parsers.html",
-        "nexusrag.parsers.markdown",
-        "nexusrag.parsers.text",
-        "nexusrag.parsers.universal",
-        "nexusrag.parsers.advanced_pdf",
-        "nexusrag.processors.table_processor",
-        "nexusrag.agents.basic_agent",
-        "nexusrag.embedders.base",
-        "nexusrag.embedders.sentence_transformers",
-        "nexusrag.embedders.openai",
-        "nexusrag.embedders.cohere",
-        "nexusrag.embedders.gemini",
-        "nexusrag.embedders.universal",
-        "nexusrag.vectorstores.base",
-        "nexusrag.vectorstores.chroma",
-        "nexusrag.vectorstores.pinecone",
-        "nexusrag.vectorstores.weaviate",
-        "nexusrag.vectorstores.universal",
-        "nexusrag.llms.base",
-        "nexusrag.llms.huggingface",
-        "nexusrag.llms.openai",
-        "nexusrag.llms.anthropic",
-        "nexusrag.llms.gemini",
-        "nexusrag.llms.ollama",
-        "nexusrag.llms.universal",
-        "nexusrag.cli"
-    ]
+    lines.append("\nChecking Python module imports...")
+    
+    # Import the top-level package first so worker threads do not race to
+    # initialize it, then import the modules concurrently (file reads and
+    # stats release the GIL), packages before their submodules so most
+    # parent imports are already done, and report in the listed order
+    warmup()
+    try_import("nexusrag")
+    
+    # Modules the package already imported are checked with a sys.modules
+    # lookup; no import is running yet, so none of them is half-initialized
+    import_errors = dict.fromkeys(REQUIRED_MODULES)
+    pending = sorted(
+        (module for module in REQUIRED_MODULES if module not in sys.modules),
+        key=lambda module: module.count("."),
+    )
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        import_errors.update(zip(pending, executor.map(try_import, pending)))
     
     import_checks = []
-    for module in required_modules:
-        import_checks.append(check_import(module))
+    for module in REQUIRED_MODULES:
+        ok, message = check_import(module, import_errors[module])
+        import_checks.append(ok)
+        lines.append(message)
     
-    # Print summary
-    print("\n" + "=" * 35)
+    # Summary
+    lines.append("\n" + "=" * 35)
     total_checks = len(file_checks) + len(dir_checks) + len(import_checks)
     passed_checks = sum(file_checks) + sum(dir_checks) + sum(import_checks)
     
-    print(f"Validation Summary: {passed_checks}/{total_checks} checks passed")
+    lines.append(f"Validation Summary: {passed_checks}/{total_checks} checks passed")
     
-    if passed_checks == total_checks:
-        print("✓ All checks passed! Project structure is valid.")
-        return True
+    success = passed_checks == total_checks
+    if success:
+        lines.append("✓ All checks passed! Project structure is valid.")
     else:
-        print("✗ Some checks failed. Please review the issues above.")
-        return False
+        lines.append("✗ Some checks failed. Please review the issues above.")
+    
+    print("\n".join(lines))
+    return success
 
 
 if __name__ == "__main__":
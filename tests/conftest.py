@@ -0,0 +1,55 @@
+import importlib
+import sys
+
+import pytest
+
+
+# Modules whose import tests check sys.modules rather than importing them
+PRELOADED_MODULES = (
+    "nexusrag",
+    "nexusrag.pipeline",
+    "nexusrag.parsers.base",
+    "nexusrag.parsers.pdf",
+    "nexusrag.parsers.advanced_pdf",
+    "nexusrag.processors.table_processor",
+    "nexusrag.agents.basic_agent",
+    "nexusrag.embedders.base",
+    "nexusrag.embedders.sentence_transformers",
+    "nexusrag.embedders.gemini",
+    "nexusrag.vectorstores.base",
+    "nexusrag.vectorstores.chroma",
+    "nexusrag.llms.base",
+    "nexusrag.llms.huggingface",
+    "nexusrag.llms.gemini",
+    "nexusrag.llms.ollama",
+)
+
+
+# Module name -> ImportError raised while preloading it
+_IMPORT_ERRORS = {}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preload_modules():
+    """Import the package modules once per test session."""
+    for module_name in PRELOADED_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            # Re-raised by preloaded_module in the module's import test
+            _IMPORT_ERRORS[module_name] = e
+
+
+@pytest.fixture
+def preloaded_module():
+    """Return a lookup for modules imported by _preload_modules.
+    
+    Looking up a module that failed to import re-raises its ImportError, so
+    the import test reports the original error.
+    """
+    def lookup(module_name):
+        error = _IMPORT_ERRORS.get(module_name)
+        if error is not None:
+            raise error
+        return sys.modules[module_name]
+    return lookup
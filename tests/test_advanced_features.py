@@ -1,27 +1,26 @@
+import sys
+
 import pytest
 from nexusrag.parsers.advanced_pdf import AdvancedPDFParser
 from nexusrag.processors.table_processor import TableProcessor
 from nexusrag.agents.basic_agent import BasicAgent
 from nexusrag.parsers.base import Document
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 
-def test_advanced_pdf_parser_import():
+def test_advanced_pdf_parser_import(preloaded_module):
     """Test that the AdvancedPDFParser can be imported."""
-    from nexusrag.parsers.advanced_pdf import AdvancedPDFParser
-    assert AdvancedPDFParser
+    assert preloaded_module("nexusrag.parsers.advanced_pdf").AdvancedPDFParser
 
 
-def test_table_processor_import():
+def test_table_processor_import(preloaded_module):
     """Test that the TableProcessor can be imported."""
-    from nexusrag.processors.table_processor import TableProcessor
-    assert TableProcessor
+    assert preloaded_module("nexusrag.processors.table_processor").TableProcessor
 
 
-def test_basic_agent_import():
+def test_basic_agent_import(preloaded_module):
     """Test that the BasicAgent can be imported."""
-    from nexusrag.agents.basic_agent import BasicAgent
-    assert BasicAgent
+    assert preloaded_module("nexusrag.agents.basic_agent").BasicAgent
 
 
 def test_table_processor_extraction():
@@ -43,21 +42,21 @@ def test_table_processor_extraction():
 
 def test_basic_agent_initialization():
     """Test BasicAgent initialization."""
-    mock_llm = Mock()
-    mock_vector_store = Mock()
+    mock_llm = SimpleNamespace(generate=lambda *args, **kwargs: "answer")
+    mock_vector_store = SimpleNamespace(query=lambda *args, **kwargs: [])
     
     agent = BasicAgent(mock_llm, mock_vector_store)
     
-    assert agent.llm == mock_llm
-    assert agent.vector_store == mock_vector_store
+    assert agent.llm is mock_llm
+    assert agent.vector_store is mock_vector_store
     assert agent.memory == []
     assert agent.tools == {}
 
 
 def test_basic_agent_memory():
     """Test BasicAgent memory functionality."""
-    mock_llm = Mock()
-    mock_vector_store = Mock()
+    mock_llm = SimpleNamespace(generate=lambda *args, **kwargs: "answer")
+    mock_vector_store = SimpleNamespace(query=lambda *args, **kwargs: [])
     
     agent = BasicAgent(mock_llm, mock_vector_store)
     
@@ -67,3 +66,432 @@ def test_basic_agent_memory():
     # Clear memory (should not fail)
     agent.clear_memory()
     assert len(agent.get_memory()) == 0
+
+
+def test_gen_cache_exact_and_semantic_hits():
+    """Test GenCache exact lookups, semantic fallback and expiry."""
+    from nexusrag.reasoning.cache import GenCache
+    
+    class StubEmbedder:
+        def embed(self, texts):
+            return [[1.0, 0.0] if "capital" in texts[0] else [0.0, 1.0]]
+    
+    cache = GenCache(embedder=StubEmbedder())
+    fingerprint = GenCache.context_fingerprint([{"content": "Paris is the capital of France."}])
+    
+    cache.put("Q: capital of France?", fingerprint, "Paris", query="capital of France?")
+    assert cache.get("Q: capital of France?", fingerprint) == "Paris"
+    assert cache.get("Q: the capital of France?", fingerprint, query="the capital of France?") == "Paris"
+    assert cache.get("Q: population?", fingerprint, query="population?") is None
+    
+    expired = GenCache(ttl=-1.0)
+    expired.put("prompt", fingerprint, "response")
+    assert expired.get("prompt", fingerprint) is None
+
+
+def test_advanced_pdf_parser_parallel_matches_serial(tmp_path):
+    """Test that parallel page extraction matches a serial parse."""
+    import fitz
+    from nexusrag.parsers.advanced_pdf import close_cached
+    
+    # Compressed multi-page PDF, so workers reading through a shared file
+    # offset would hit corrupt streams
+    pdf_path = str(tmp_path / "pages.pdf")
+    pdf_document = fitz.open()
+    for page_num in range(12):
+        page = pdf_document.new_page()
+        for block in range(20):
+            page.insert_text((50, 40 + block * 36), f"page {page_num} block {block}", fontsize=8)
+    pdf_document.save(pdf_path, deflate=True)
+    pdf_document.close()
+    
+    try:
+        serial = [doc.content for doc in AdvancedPDFParser(max_workers=1).parse(pdf_path)]
+        for _ in range(3):
+            parallel = [doc.content for doc in AdvancedPDFParser(max_workers=4).parse(pdf_path)]
+            assert parallel == serial
+        assert len(serial) == 12 * 20
+    finally:
+        close_cached()
+
+
+def test_ocr_upscale_is_bounded():
+    """Test that low-DPI images are upscaled for OCR only within bounds."""
+    Image = pytest.importorskip("PIL.Image")
+    from nexusrag.multimodal.image_processor import ImageProcessor
+    
+    def prepared_size(size, dpi):
+        image = Image.new("RGB", size)
+        image.info["dpi"] = (dpi, dpi)
+        return ImageProcessor._prepare_for_ocr(image, Image).size
+    
+    # Small 72-dpi image: capped at 2x per side rather than 300/72
+    assert prepared_size((400, 300), 72) == (800, 600)
+    # Large screenshot: enough pixels already, left as is
+    assert prepared_size((1920, 1080), 72) == (1920, 1080)
+    # Already at the target resolution
+    assert prepared_size((400, 300), 300) == (400, 300)
+
+
+def test_process_images_applies_ocr_gate():
+    """Test that batched images only escalate low-confidence OCR to the model."""
+    from unittest.mock import patch
+    from nexusrag.multimodal.image_processor import ImageProcessor
+    
+    confidences = {"clean.png": 95.0, "photo.png": 20.0}
+    
+    def fake_ocr(image_path):
+        return Document(content=f"text of {image_path}",
+                        metadata={"source": image_path, "ocr_confidence": confidences[image_path]})
+    
+    processor = ImageProcessor()
+    with patch.object(processor, "_process_with_ocr", side_effect=fake_ocr), \
+            patch.object(processor, "_load_model", side_effect=ImportError("no model")) as load_model:
+        # Confident OCR for every image: the model is never loaded
+        documents = processor.process_images(["clean.png"])
+        assert [doc.content for doc in documents] == ["text of clean.png"]
+        assert documents[0].content == processor.process_image("clean.png").content
+        load_model.assert_not_called()
+        
+        # Low-confidence image: model load is attempted, OCR kept on failure
+        documents = processor.process_images(["clean.png", "photo.png"])
+        assert [doc.content for doc in documents] == ["text of clean.png", "text of photo.png"]
+        load_model.assert_called_once()
+
+
+def test_parse_cached_uses_instance_configuration(tmp_path):
+    """Test that parse_cached parses with, and keys on, the instance's configuration."""
+    from nexusrag.parsers.base import BaseParser
+    
+    class PrefixParser(BaseParser):
+        def __init__(self, prefix):
+            self.prefix = prefix
+            self.calls = 0
+        
+        def parse(self, file_path):
+            self.calls += 1
+            return [Document(self.prefix + open(file_path).read())]
+        
+        def _cache_key(self):
+            return (self.prefix,)
+    
+    file_path = str(tmp_path / "doc.txt")
+    with open(file_path, "w") as f:
+        f.write("content")
+    
+    first, second = PrefixParser("a:"), PrefixParser("b:")
+    assert first.parse_cached(file_path)[0].content == "a:content"
+    assert second.parse_cached(file_path)[0].content == "b:content"
+    
+    # Unchanged file and configuration: served from the cache
+    assert PrefixParser("a:").parse_cached(file_path)[0].content == "a:content"
+    assert first.calls == 1 and second.calls == 1
+
+
+def test_reasoner_keeps_full_refinement_on_early_stop():
+    """Test that an early-stop word ends further steps without truncating the response."""
+    from nexusrag.reasoning.multi_step import MultiStepReasoner
+    
+    refinement = '{"approach": "The context is sufficient to answer", "insights": ["Paris"]}'
+    
+    class StubLLM:
+        def __init__(self):
+            self.prompts = []
+        
+        def generate(self, prompt, context=None):
+            self.prompts.append(prompt)
+            if prompt.startswith("Refine"):
+                return refinement
+            return '{"answer": "Paris", "confidence": 0.9}'
+        
+        def generate_batch(self, prompts):
+            return [self.generate(prompt) for prompt in prompts]
+    
+    llm = StubLLM()
+    reasoner = MultiStepReasoner(llm, vector_store=None)
+    session = reasoner.reason("Capital of France?", max_steps=4,
+                              context=[{"content": "Paris is the capital of France."}])
+    
+    # Stopped after the first refinement, whose JSON was parsed whole
+    step = session["steps"][1]
+    assert len(session["steps"]) == 2
+    assert step["response"] == refinement
+    assert step["refinement"]["insights"] == ["Paris"]
+
+
+def test_universal_retriever_stores_each_document_once():
+    """Test that adding documents writes them to the vector store once."""
+    from nexusrag.retrievers.universal import UniversalRetriever
+    
+    class StubVectorStore:
+        def __init__(self):
+            self.documents = []
+        
+        def add(self, documents):
+            self.documents.extend(documents)
+        
+        def query(self, query, top_k=5):
+            return [{"content": doc.content, "metadata": doc.metadata, "score": 1.0}
+                    for doc in self.documents][:top_k]
+    
+    vector_store = StubVectorStore()
+    retriever = UniversalRetriever(vector_store, embedder=None)
+    documents = [Document("Paris is the capital of France.", {"source": "a.txt"}),
+                 Document("Jupiter is the largest planet.", {"source": "b.txt"})]
+    retriever.add_documents(documents)
+    
+    assert len(vector_store.documents) == 2
+    assert retriever.hybrid_retriever.bm25_retriever.doc_count == 2
+    assert len(retriever.search("capital of France", top_k=5, use_reranking=False)) == 2
+
+
+def test_html_parser_keeps_text_outside_blocks(tmp_path):
+    """Test that text outside block elements is kept alongside the blocks."""
+    from nexusrag.parsers.html import HTMLParser
+    
+    html_path = tmp_path / "page.html"
+    html_path.write_text(
+        "<html><body><div>Introductory text outside any paragraph."
+        "<p>A paragraph inside a block element.</p></div></body></html>"
+    )
+    
+    contents = [doc.content for doc in HTMLParser().parse(str(html_path))]
+    assert contents == [
+        "Introductory text outside any paragraph.",
+        "A paragraph inside a block element.",
+    ]
+
+
+def test_reasoner_refines_previous_step():
+    """Test that each refinement prompt is built from the previous step's result."""
+    from nexusrag.reasoning.multi_step import MultiStepReasoner
+    
+    class StubLLM:
+        def __init__(self):
+            self.prompts = []
+        
+        def generate(self, prompt, context=None):
+            self.prompts.append(prompt)
+            return '{"approach": "approach %d"}' % len(self.prompts)
+        
+        def generate_batch(self, prompts):
+            return [self.generate(prompt) for prompt in prompts]
+    
+    llm = StubLLM()
+    reasoner = MultiStepReasoner(llm, vector_store=None)
+    session = reasoner.reason("Capital of France?", max_steps=4,
+                              context=[{"content": "Paris is the capital of France."}])
+    
+    # One generation per step plus synthesis; no step is a cache hit of another
+    assert len(llm.prompts) == 5
+    prompts = [step["prompt"] for step in session["steps"]]
+    assert len(set(prompts)) == 4
+    for step in range(2, 4):
+        assert f"approach {step}" in prompts[step]
+
+
+def test_audio_model_loads_once_across_threads():
+    """Test that concurrent audio and video requests share one Whisper load."""
+    import threading
+    import time
+    from unittest.mock import patch
+    from nexusrag.multimodal.audio_processor import AudioProcessor
+    
+    loads = []
+    
+    def load_model(model_size, device):
+        loads.append(model_size)
+        time.sleep(0.05)
+        return SimpleNamespace()
+    
+    fake_whisper = SimpleNamespace(load_model=load_model, DecodingOptions=lambda fp16: None)
+    fake_torch = SimpleNamespace(cuda=SimpleNamespace(is_available=lambda: False))
+    
+    processor = AudioProcessor()
+    with patch("nexusrag.multimodal.audio_processor._whisper", return_value=fake_whisper), \
+            patch.dict(sys.modules, {"torch": fake_torch}):
+        threads = [threading.Thread(target=processor._load_model) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    
+    assert loads == ["base"]
+    assert processor.device == "cpu"
+
+
+def test_process_multimodal_content_inside_running_loop():
+    """Test that the sync multimodal wrapper also works from async code."""
+    import asyncio
+    from unittest.mock import patch
+    from nexusrag.multimodal.universal import UniversalMultimodalProcessor
+    
+    processor = UniversalMultimodalProcessor()
+    content = {"html_table": "<table></table>", "table_data": [[1]]}
+    
+    async def process_from_coroutine():
+        return processor.process_multimodal_content(content)
+    
+    with patch.object(processor, "process_table_data", return_value=Document(content="data")), \
+            patch.object(processor, "process_html_table", return_value=Document(content="html")):
+        expected = processor.process_multimodal_content(content)
+        documents = asyncio.run(process_from_coroutine())
+    
+    assert [doc.content for doc in expected] == ["data", "html"]
+    assert [doc.content for doc in documents] == ["data", "html"]
+
+
+def test_pinecone_instances_do_not_reuse_ids(monkeypatch):
+    """Test that a second store on the same index does not overwrite vectors."""
+    from unittest.mock import MagicMock, patch
+    from nexusrag.vectorstores.pinecone import PineconeVectorStore
+    
+    monkeypatch.setenv("PINECONE_API_KEY", "test-key")
+    fake_pinecone = MagicMock()
+    fake_pinecone.list_indexes.return_value = ["nexusrag"]
+    
+    with patch("nexusrag.vectorstores.pinecone.pinecone", fake_pinecone):
+        PineconeVectorStore(dimension=4).add([Document(content="first run")])
+        PineconeVectorStore(dimension=4).add([Document(content="second run")])
+    
+    upserts = fake_pinecone.Index.return_value.upsert.call_args_list
+    ids = [vector[0] for call in upserts for vector in call.args[0]]
+    assert len(ids) == 2 and ids[0] != ids[1]
+
+
+def test_audio_batch_reuses_loaded_samples():
+    """Test that long batch files are transcribed from the samples already loaded."""
+    import numpy as np
+    from unittest.mock import MagicMock, patch
+    from nexusrag.multimodal.audio_processor import AudioProcessor
+    
+    samples = {"short.wav": np.zeros(5), "long.wav": np.zeros(20)}
+    fake_whisper = SimpleNamespace(
+        load_audio=MagicMock(side_effect=lambda path: samples[path]),
+        audio=SimpleNamespace(N_SAMPLES=10, SAMPLE_RATE=10),
+        pad_or_trim=lambda audio: audio,
+        log_mel_spectrogram=lambda audio, n_mels: audio,
+        decode=lambda model, mel, options: [SimpleNamespace(text="short text", language="en")]
+    )
+    fake_torch = SimpleNamespace(stack=lambda tensors: SimpleNamespace(to=lambda device: tensors))
+    
+    processor = AudioProcessor()
+    processor.device = "cpu"
+    processor.model = SimpleNamespace(dims=SimpleNamespace(n_mels=80), transcribe=MagicMock(return_value={
+        "text": "long text", "language": "en",
+        "segments": [{"start": 0.0, "end": 1.0, "text": "long"}, {"start": 1.0, "end": 2.0, "text": "text"}]
+    }))
+    
+    with patch("nexusrag.multimodal.audio_processor._whisper", return_value=fake_whisper), \
+            patch.dict(sys.modules, {"torch": fake_torch}):
+        short_doc, long_doc = processor.process_audio_batch(["short.wav", "long.wav"])
+    
+    # Each file is decoded from disk once
+    assert fake_whisper.load_audio.call_count == 2
+    assert processor.model.transcribe.call_args.args[0] is samples["long.wav"]
+    assert long_doc.metadata["segment_count"] == 2
+    assert short_doc.metadata["segments"] == [{"start": 0.0, "end": 0.5, "text": "short text"}]
+
+
+def test_citation_engine_citations_assignment():
+    """Test that the citations property can be replaced and round-trips."""
+    from nexusrag.reasoning.citation import CitationEngine
+    
+    engine = CitationEngine()
+    engine.add_citation("Paris is the capital of France.", "geo.txt")
+    saved = engine.citations
+    
+    engine.clear_citations()
+    assert engine.citations == []
+    
+    engine.citations = saved
+    assert engine.citations == saved
+    assert engine.get_citation_report()["total_citations"] == 1
+
+
+def test_parse_cache_is_bounded_and_clearable(tmp_path, monkeypatch):
+    """Test that the parse cache keys on absolute paths, bounds its size and can be cleared."""
+    import os
+    from nexusrag.parsers import base
+    from nexusrag.parsers.base import BaseParser
+    from nexusrag.parsers.universal import UniversalParser
+    
+    class CountingParser(BaseParser):
+        calls = 0
+        
+        def parse(self, file_path):
+            CountingParser.calls += 1
+            return [Document(open(file_path).read())]
+    
+    for name in ("a.txt", "b.txt"):
+        (tmp_path / name).write_text("x" * 10)
+    monkeypatch.chdir(tmp_path)
+    BaseParser.clear_parse_cache()
+    
+    parser = CountingParser()
+    parser.parse_cached("a.txt")
+    parser.parse_cached(os.path.join(str(tmp_path), "a.txt"))
+    assert CountingParser.calls == 1
+    
+    # Room for one file's content only: caching b evicts a
+    monkeypatch.setattr(base, "PARSE_CACHE_MAX_CHARS", 15)
+    parser.parse_cached("b.txt")
+    parser.parse_cached("a.txt")
+    assert CountingParser.calls == 3
+    assert base._parse_cache_chars == 10
+    
+    BaseParser.clear_parse_cache()
+    assert len(base._parse_cache) == 0 and base._parse_cache_chars == 0
+    
+    # UniversalParser only caches when asked to
+    UniversalParser().parse("a.txt")
+    assert len(base._parse_cache) == 0
+    UniversalParser(use_parse_cache=True).parse("a.txt")
+    assert len(base._parse_cache) == 1
+    BaseParser.clear_parse_cache()
+
+
+def test_content_statistics_line_count_matches_splitlines():
+    """Test that line counts follow str.splitlines() for every line boundary."""
+    from nexusrag.metadata.extractor import _content_statistics, _JIT_MIN_LENGTH
+    
+    samples = ["", "one", "one\n", "a\nb", "a\r\nb\r\n", "a\rb", "a\vb\fc", "a\x85b c\n\n"]
+    # Large ASCII text takes the Numba path when it is installed
+    samples.append("word line\r" * (_JIT_MIN_LENGTH // 5))
+    samples.append("word line\n" * (_JIT_MIN_LENGTH // 5))
+    
+    for content in samples:
+        assert _content_statistics(content)["line_count"] == len(content.splitlines())
+
+
+def test_metadata_extractor_imports_numba_lazily():
+    """Test that importing the metadata extractor does not import Numba."""
+    import subprocess
+    
+    code = ("import sys, nexusrag.metadata.extractor; "
+            "sys.exit('numba' in sys.modules)")
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def test_bm25_retriever_pickles_and_saves_strictly(tmp_path):
+    """Test that a BM25 index pickles with pending postings and refuses lossy saves."""
+    import os
+    import pickle
+    import subprocess
+    from datetime import datetime
+    from nexusrag.retrievers.bm25 import BM25Retriever
+    
+    retriever = BM25Retriever()
+    retriever.add_documents([Document("Paris is in France"), Document("Berlin is in Germany"),
+                             Document("Rome is in Italy")])
+    restored = pickle.loads(pickle.dumps(retriever))
+    assert restored.search("Paris France") == retriever.search("Paris France")
+    
+    retriever.add_documents([Document("Madrid is in Spain", {"added": datetime(2024, 1, 1)})])
+    with pytest.raises(TypeError):
+        retriever.save(str(tmp_path / "index"))
+    assert not os.path.exists(tmp_path / "index")
+    
+    code = ("import sys, nexusrag.retrievers.bm25; "
+            "sys.exit('numba' in sys.modules)")
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
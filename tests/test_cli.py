@@ -5,24 +5,19 @@ import os
 import tempfile
 from pathlib import Path
 
-# Add the project root to the Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
-
-def test_cli_version():
+def test_cli_version(capsys):
     """Test the CLI version command."""
     from nexusrag.cli import main
     
     with patch('sys.argv', ['nexusrag', 'version']):
-        with patch('builtins.print') as mock_print:
-            try:
-                main()
-            except SystemExit:
-                pass
-            
-            # Check that print was called with version info
-            mock_print.assert_called()
+        try:
+            main()
+        except SystemExit:
+            pass
+    
+    # Check that version info was printed
+    assert "NexusRAG v" in capsys.readouterr().out
 
 
 def test_cli_help():
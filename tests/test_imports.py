@@ -1,31 +1,38 @@
 import pytest
 
 
-def test_package_import():
+def test_package_import(preloaded_module):
     """Test that the nexusrag package can be imported."""
-    import nexusrag
-    assert nexusrag.__version__ == "0.1.0"
+    assert preloaded_module("nexusrag").__version__ == "0.1.0"
 
 
-def test_module_imports():
+def test_module_imports(preloaded_module):
     """Test that all main modules can be imported."""
-    from nexusrag import pipeline
-    from nexusrag.parsers import base
-    from nexusrag.embedders import base
-    from nexusrag.vectorstores import base
-    from nexusrag.llms import base
+    modules = {
+        "nexusrag.pipeline": ["RAGPipeline"],
+        "nexusrag.parsers.base": ["BaseParser", "Document"],
+        "nexusrag.embedders.base": ["BaseEmbedder"],
+        "nexusrag.vectorstores.base": ["BaseVectorStore"],
+        "nexusrag.llms.base": ["BaseLLM"],
+    }
     
-    # Test that specific classes can be imported
-    from nexusrag.pipeline import RAGPipeline
-    from nexusrag.parsers.base import BaseParser, Document
-    from nexusrag.embedders.base import BaseEmbedder
-    from nexusrag.vectorstores.base import BaseVectorStore
-    from nexusrag.llms.base import BaseLLM
+    # Modules are imported by the session fixture in conftest.py
+    for module_name, class_names in modules.items():
+        module = preloaded_module(module_name)
+        
+        # Test that specific classes can be imported
+        for class_name in class_names:
+            assert hasattr(module, class_name)
 
 
-def test_component_imports():
+def test_component_imports(preloaded_module):
     """Test that all component implementations can be imported."""
-    from nexusrag.parsers.pdf import PDFParser
-    from nexusrag.embedders.sentence_transformers import SentenceTransformerEmbedder
-    from nexusrag.vectorstores.chroma import ChromaVectorStore
-    from nexusrag.llms.huggingface import HuggingFaceLLM
+    components = {
+        "nexusrag.parsers.pdf": "PDFParser",
+        "nexusrag.embedders.sentence_transformers": "SentenceTransformerEmbedder",
+        "nexusrag.vectorstores.chroma": "ChromaVectorStore",
+        "nexusrag.llms.huggingface": "HuggingFaceLLM",
+    }
+    
+    for module_name, class_name in components.items():
+        assert hasattr(preloaded_module(module_name), class_name)
@@ -0,0 +1,62 @@
+import pytest
+from nexusrag.metadata_filter import MetadataFilter
+from nexusrag.parsers.base import Document
+
+
+def _documents():
+    return [
+        Document("a", {"source": "reports/a.pdf", "content_type": "pdf", "year": 2021}),
+        Document("b", {"source": "notes/b.txt", "content_type": "text", "year": 2019}),
+        Document("c", {"source": "reports/c.pdf", "content_type": "pdf"}),
+        Document("d", {"source": "reports/d.html", "content_type": "html", "year": 2023}),
+    ]
+
+
+def test_filter_by_content_types():
+    """Test filtering on a set of content types."""
+    results = MetadataFilter.filter_by_content_types(_documents(), ["pdf", "html"])
+    assert [doc.content for doc in results] == ["a", "c", "d"]
+
+
+def test_compiled_filter_matches_lambda():
+    """Test that a compiled spec filters like the equivalent lambda."""
+    documents = _documents()
+    predicate = MetadataFilter.compile([
+        ("year", "ge", 2020),
+        ("content_type", "eq", "pdf"),
+    ])
+    
+    compiled = MetadataFilter.filter_by_metadata(documents, predicate)
+    expected = MetadataFilter.filter_by_metadata(
+        documents,
+        lambda m: m.get("content_type") == "pdf" and m.get("year") is not None and m["year"] >= 2020
+    )
+    
+    assert [doc.content for doc in compiled] == [doc.content for doc in expected] == ["a"]
+    assert predicate._compiled_fields == ("content_type", "year")
+
+
+def test_compiled_filter_operators():
+    """Test the remaining compiled filter operators."""
+    documents = _documents()
+    
+    contains = MetadataFilter.compile([("source", "contains", "reports/")])
+    assert len(MetadataFilter.filter_by_metadata(documents, contains)) == 3
+    
+    members = MetadataFilter.compile([("content_type", "in", ["text", "html"]), ("year", "ne", 2019)])
+    assert [doc.content for doc in MetadataFilter.filter_by_metadata(documents, members)] == ["d"]
+    
+    # Unhashable candidates fall back to an equality scan
+    tagged = [Document("x", {"tags": ["a", "b"]}), Document("y", {"tags": ["c"]})]
+    tag_members = MetadataFilter.compile([("tags", "in", [["a", "b"], ["d"]])])
+    assert [doc.content for doc in MetadataFilter.filter_by_metadata(tagged, tag_members)] == ["x"]
+    
+    with pytest.raises(ValueError):
+        MetadataFilter.compile([("year", "between", (1, 2))])
+
+
+def test_filter_by_sources():
+    """Test filtering on any of several source patterns."""
+    results = MetadataFilter.filter_by_sources(_documents(), ["notes/", ".html"])
+    assert [doc.content for doc in results] == ["b", "d"]
+    assert MetadataFilter.filter_by_sources(_documents(), []) == []
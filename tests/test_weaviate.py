@@ -0,0 +1,31 @@
+import pytest
+from unittest.mock import patch
+
+from nexusrag.parsers.base import Document
+from nexusrag.metadata.extractor import MetadataExtractor
+from nexusrag.vectorstores.weaviate import _object_uuid
+
+
+def test_object_uuid_stable_across_ingests(tmp_path):
+    """Test that re-ingesting an unchanged file keeps the object UUIDs."""
+    file_path = tmp_path / "doc.txt"
+    file_path.write_text("The capital of France is Paris.")
+    document = Document("The capital of France is Paris.", {"source": str(file_path), "page": 1})
+    
+    # Extraction and access times differ between the two ingests
+    with patch("nexusrag.metadata.extractor._now_isoformat", return_value="2024-01-01T00:00:00"):
+        first = MetadataExtractor.enhance_document_metadata(document, str(file_path))
+    with patch("nexusrag.metadata.extractor._now_isoformat", return_value="2024-01-02T00:00:00"):
+        second = MetadataExtractor.enhance_document_metadata(document, str(file_path))
+    second.metadata["accessed_time"] = "2024-01-02T00:00:00"
+    
+    assert first.metadata != second.metadata
+    assert _object_uuid(first) == _object_uuid(second)
+
+
+def test_object_uuid_distinguishes_documents():
+    """Test that content and stable metadata are part of the UUID."""
+    document = Document("Same content", {"source": "a.txt", "page": 1})
+    
+    assert _object_uuid(document) != _object_uuid(Document("Other content", {"source": "a.txt", "page": 1}))
+    assert _object_uuid(document) != _object_uuid(Document("Same content", {"source": "a.txt", "page": 2}))